@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+"""
+Atomic save benchmark:
+compares the latency of writing a synthetic store the old way
+(open(file.json, "w") + json.dump(), no fsync) with the atomic
+save() (temporary file, fsync, rename), without and with fsync_dir
+
+usage: ./benchmarks/atomic_save.py [number of objects] [repeats]
+"""
+
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine.file_storage import FileStorage  # noqa: E402
+from models.review import Review  # noqa: E402
+
+
+def old_save(path, fsync=False):
+    """the save() from before the atomic writes, optionally fsynced"""
+    objects = FileStorage._FileStorage__objects
+    with open(path, "w") as file:
+        json.dump({key: obj.to_dict() for key, obj in objects.items()},
+                  file)
+        if fsync:
+            file.flush()
+            os.fsync(file.fileno())
+
+
+def new_save(storage, fsync_dir):
+    """a full atomic save(), encoding every object again"""
+    FileStorage.fsync_dir = fsync_dir
+    FileStorage._FileStorage__cache.clear()
+    storage.save()
+
+
+def timed(function, repeats):
+    """returns the median latency of function() in ms"""
+    times = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    storage = FileStorage()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "file.json")
+        FileStorage._FileStorage__file_path = path
+        for i in range(count):
+            storage.new(Review(
+                id=f"{i:08d}-0000-4000-8000-000000000000",
+                created_at="2023-08-08T12:34:56.789012",
+                updated_at="2023-08-08T12:34:56.789012",
+                place_id=f"place-{i % 1000}", user_id=f"user-{i % 97}",
+                text=f"review number {i} " * 4
+            ))
+        rows = [
+            ("open('w') + json.dump", lambda: old_save(path)),
+            ("open('w') + json.dump + fsync",
+             lambda: old_save(path, fsync=True)),
+            ("save()", lambda: new_save(storage, False)),
+            ("save(), fsync_dir", lambda: new_save(storage, True)),
+        ]
+        print(f"{count} objects, median of {repeats} runs")
+        print(f"{'path':>32} {'ms':>9} {'vs old':>7}")
+        base = None
+        for name, function in rows:
+            latency = timed(function, repeats)
+            base = base or latency
+            print(f"{name:>32} {latency:9.1f} {latency / base:6.2f}x")
+    FileStorage.fsync_dir = False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""
+Compression benchmark:
+compares the file size and the full save() and reload() latency of a
+synthetic store without compression and with each available codec
+
+usage: ./benchmarks/compression.py [number of objects]
+"""
+
+
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine import compressed  # noqa: E402
+from models.engine.file_storage import FileStorage  # noqa: E402
+from models.review import Review  # noqa: E402
+
+
+def forget():
+    """empties FileStorage as if the process had just started"""
+    FileStorage._FileStorage__objects.clear()
+    FileStorage._FileStorage__by_class.clear()
+    FileStorage._FileStorage__by_attr.clear()
+    FileStorage._FileStorage__cache.clear()
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    storage = FileStorage()
+    print(f"{count} objects, codecs: {', '.join(compressed.available())}")
+    print(f"{'codec':>6} {'MB':>8} {'ratio':>6} {'save ms':>9} "
+          f"{'reload ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        FileStorage._FileStorage__file_path = os.path.join(
+            tmp_dir, "file.json"
+        )
+        base = None
+        for name in [None] + compressed.available():
+            forget()
+            for i in range(count):
+                storage.new(Review(
+                    id=f"{i:08d}-0000-4000-8000-000000000000",
+                    created_at="2023-08-08T12:34:56.789012",
+                    updated_at="2023-08-08T12:34:56.789012",
+                    place_id=f"place-{i % 1000}", user_id=f"user-{i % 97}",
+                    text=f"review number {i} " * 4
+                ))
+            FileStorage.compression = name
+            FileStorage._FileStorage__cache.clear()
+            start = perf_counter()
+            storage.save()
+            saving = perf_counter() - start
+            size = os.path.getsize(storage.snapshot_path())
+            base = base or size
+            forget()
+            start = perf_counter()
+            storage.reload()
+            reloading = perf_counter() - start
+            assert storage.count(Review) == count
+            print(
+                f"{name or 'none':>6} {size / 1e6:8.1f} {base / size:6.1f} "
+                f"{saving * 1000:9.1f} {reloading * 1000:10.1f}"
+            )
+    FileStorage.compression = None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+"""
+Geospatial index benchmark:
+compares radius and bounding-box searches over a GridIndex
+with a full scan computing the haversine of every place
+
+usage: ./benchmarks/geo_index.py [number of places]
+"""
+
+
+import os
+import random
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine.geo import GridIndex, haversine  # noqa: E402
+
+
+class Point:
+    """a located object, lighter than a Place for a million of them"""
+
+    def __init__(self, obj_id, latitude, longitude):
+        """Initialize the point"""
+        self.id = obj_id
+        self.latitude = latitude
+        self.longitude = longitude
+
+
+def timed(function, *args):
+    """returns (result, milliseconds) of function(*args)"""
+    start = perf_counter()
+    result = function(*args)
+    return result, (perf_counter() - start) * 1000
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rand = random.Random(1)
+    # half of the places around cities, half anywhere
+    cities = [(rand.uniform(-60, 70), rand.uniform(-180, 180))
+              for _ in range(200)]
+    points = []
+    for i in range(count):
+        if i % 2:
+            lat, lon = rand.choice(cities)
+            lat, lon = lat + rand.gauss(0, 0.2), lon + rand.gauss(0, 0.2)
+        else:
+            lat, lon = rand.uniform(-90, 90), rand.uniform(-180, 180)
+        points.append(Point(str(i), max(-90, min(90, lat)),
+                            (lon + 180) % 360 - 180))
+    index, build_time = timed(GridIndex, 0.25, points)
+    print(f"{count} places, index built in {build_time:.0f} ms")
+
+    def scan_nearby(lat, lon, radius_km):
+        return sorted(
+            (distance, point.id) for point, distance in (
+                (point, haversine(lat, lon, point.latitude, point.longitude))
+                for point in points
+            ) if distance <= radius_km
+        )
+
+    def scan_within(min_lat, min_lon, max_lat, max_lon):
+        return [
+            point.id for point in points
+            if min_lat <= point.latitude <= max_lat
+            and min_lon <= point.longitude <= max_lon
+        ]
+
+    lat, lon = cities[0]
+    for radius_km in (5, 50, 500):
+        expected, scan_time = timed(scan_nearby, lat, lon, radius_km)
+        found, index_time = timed(index.nearby, lat, lon, radius_km)
+        assert found == expected
+        print(
+            f"nearby {radius_km:>4} km ({len(found):>6} places): "
+            f"scan {scan_time:8.1f} ms, index {index_time:8.1f} ms "
+            f"({scan_time / index_time:.0f}x)"
+        )
+    box = (lat - 1, lon - 1, lat + 1, lon + 1)
+    expected, scan_time = timed(scan_within, *box)
+    found, index_time = timed(index.within, *box)
+    assert sorted(found) == sorted(expected)
+    print(
+        f"within 2x2 degrees ({len(found):>6} places): "
+        f"scan {scan_time:8.1f} ms, index {index_time:8.1f} ms "
+        f"({scan_time / index_time:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
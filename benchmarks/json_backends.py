@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""
+JSON backends benchmark:
+compares the encode and decode throughput of the installed JSON
+backends (orjson, msgspec, ujson, json) on the records of a synthetic
+store, encoded one object at a time as the storage does
+(the records are made and timed in chunks of 100000, so the whole
+store never has to be held in memory)
+
+usage: ./benchmarks/json_backends.py [number of objects]
+"""
+
+
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine import json_backend  # noqa: E402
+from models.engine.json_backend import Backend  # noqa: E402
+
+CHUNK = 100000
+
+
+def records(start, count):
+    """returns count Review records, as given by to_dict()"""
+    return [
+        {
+            "id": f"{i:08d}-0000-4000-8000-000000000000",
+            "created_at": "2023-08-08T12:34:56.789012",
+            "updated_at": "2023-08-08T12:34:56.789012",
+            "place_id": f"place-{i % 1000}", "user_id": f"user-{i % 97}",
+            "text": f"review number {i} " * 4, "__class__": "Review"
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    names = json_backend.available()
+    print(f"{count} objects, backends: {', '.join(names)}")
+    print(f"{'backend':>8} {'encode/s':>12} {'decode/s':>12} {'MB':>8}")
+    for name in names:
+        backend = Backend(name)
+        encoding = decoding = 0.0
+        size = 0
+        for start in range(0, count, CHUNK):
+            chunk = records(start, min(CHUNK, count - start))
+            begin = perf_counter()
+            texts = [backend.dumps(record) for record in chunk]
+            encoding += perf_counter() - begin
+            begin = perf_counter()
+            decoded = [backend.loads(text) for text in texts]
+            decoding += perf_counter() - begin
+            assert decoded == chunk
+            size += sum(len(text) for text in texts)
+        print(
+            f"{name:>8} {count / encoding:12,.0f} {count / decoding:12,.0f}"
+            f" {size / 1e6:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
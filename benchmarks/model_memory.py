@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+"""
+Model memory benchmark:
+compares, for every model class, the memory retained per instance
+loaded by FileStorage.reload() by default, without text_cache (the
+JSON text kept for the next save) and with compact_objects (which
+drops the JSON text too)
+
+usage: ./benchmarks/model_memory.py [number of objects per class]
+"""
+
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine.file_storage import FileStorage  # noqa: E402
+
+
+def make_record(class_name, i):
+    """returns a synthetic to_dict() of the i-th object of class_name"""
+    record = {
+        "id": f"{i:08d}-0000-4000-8000-000000000000",
+        "created_at": "2023-08-08T12:34:56.789012",
+        "updated_at": "2023-08-08T12:34:56.789012",
+        "__class__": class_name
+    }
+    extra = {
+        "User": {"email": f"user{i}@mail.com", "first_name": "Betty"},
+        "State": {"name": f"State {i}"},
+        "City": {"state_id": f"state-{i % 50}", "name": f"City {i}"},
+        "Amenity": {"name": f"Amenity {i % 100}"},
+        "Place": {
+            "city_id": f"city-{i % 500}", "user_id": f"user-{i % 97}",
+            "name": f"Place {i}", "price_by_night": i % 300,
+            "latitude": 6.5, "longitude": 3.4,
+            "amenity_ids": [f"amenity-{j}" for j in range(i % 5)]
+        },
+        "Review": {
+            "place_id": f"place-{i % 1000}", "user_id": f"user-{i % 97}",
+            "text": "Great stay"
+        }
+    }
+    record.update(extra.get(class_name, {}))
+    return record
+
+
+def measure(path, count, compact, text_cache=True):
+    """returns the bytes retained per object after reloading path"""
+    FileStorage.compact_objects = compact
+    FileStorage.text_cache = text_cache
+    FileStorage._FileStorage__objects.clear()
+    FileStorage._FileStorage__by_class.clear()
+    FileStorage._FileStorage__by_attr.clear()
+    FileStorage._FileStorage__cache.clear()
+    gc.collect()
+    tracemalloc.start()
+    FileStorage().reload()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return retained / count
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    FileStorage._FileStorage__file_path = path
+    print(f"{count} objects per class, bytes retained per object")
+    try:
+        for class_name in FileStorage.classes_dict:
+            with open(path, "w") as file:
+                json.dump({
+                    f"{class_name}.{record['id']}": record
+                    for record in (
+                        make_record(class_name, i) for i in range(count)
+                    )
+                }, file)
+            plain = measure(path, count, False)
+            textless = measure(path, count, False, text_cache=False)
+            compact = measure(path, count, True)
+            print(
+                f"{class_name:>10}: default {plain:7.0f}, "
+                f"no text_cache {textless:7.0f} "
+                f"({textless / plain - 1:+.0%}), "
+                f"compact {compact:7.0f} ({compact / plain - 1:+.0%})"
+            )
+    finally:
+        FileStorage.compact_objects = False
+        FileStorage.text_cache = True
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
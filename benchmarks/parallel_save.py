@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Parallel save benchmark:
+times a full save() (every object encoded) of a synthetic store
+with parallel_workers from 1 to the number of cores, and the CPU time
+of the parent process alone: the part of the save the workers can't
+take, which bounds the speed-up on any number of cores
+
+usage: ./benchmarks/parallel_save.py [number of objects] [max workers]
+"""
+
+
+import os
+import sys
+import tempfile
+from time import perf_counter, process_time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine.file_storage import FileStorage  # noqa: E402
+from models.review import Review  # noqa: E402
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    most = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    storage = FileStorage()
+    for i in range(count):
+        storage.new(Review(
+            id=f"{i:08d}-0000-4000-8000-000000000000",
+            created_at="2023-08-08T12:34:56.789012",
+            updated_at="2023-08-08T12:34:56.789012",
+            place_id=f"place-{i % 1000}", user_id=f"user-{i % 97}",
+            text=f"review number {i} " * 4
+        ))
+    FileStorage.parallel_threshold = 1
+    workers = 1
+    counts = []
+    while workers < most:
+        counts.append(workers)
+        workers *= 2
+    counts.append(most)
+    print(f"{count} objects, {os.cpu_count()} cores")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        FileStorage._FileStorage__file_path = os.path.join(
+            tmp_dir, "file.json"
+        )
+        base = None
+        for workers in counts:
+            FileStorage.parallel_workers = workers
+            FileStorage._FileStorage__cache.clear()
+            start, cpu = perf_counter(), process_time()
+            storage.save()
+            elapsed = perf_counter() - start
+            cpu = process_time() - cpu
+            base = base or elapsed
+            print(
+                f"{workers:>3} workers: {elapsed * 1000:9.1f} ms "
+                f"({base / elapsed:.2f}x), parent CPU {cpu * 1000:9.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
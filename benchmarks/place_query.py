@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""
+Place query benchmark:
+compares a range filter looping over the Place objects
+with storage.query(Place).where() over the columnar mirror
+(NumPy is used when it is installed, the array module otherwise)
+
+usage: ./benchmarks/place_query.py [number of places]
+"""
+
+
+import os
+import sys
+from timeit import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine import columns  # noqa: E402
+from models.engine.file_storage import FileStorage  # noqa: E402
+from models.place import Place  # noqa: E402
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    storage = FileStorage()
+    for i in range(count):
+        storage.new(Place(
+            id=f"place-{i}", created_at="2023-08-08T12:34:56.789012",
+            updated_at="2023-08-08T12:34:56.789012",
+            price_by_night=i * 7919 % 500, max_guest=i % 10
+        ))
+
+    def loop():
+        return [
+            obj.id for obj in storage.all(Place).values()
+            if obj.price_by_night < 100 and obj.max_guest >= 4
+        ]
+
+    def query():
+        return storage.query(Place).where(
+            price_by_night__lt=100, max_guest__gte=4
+        )
+
+    expected = sorted(loop())
+    FileStorage.columnar = True
+    assert sorted(query()) == expected
+    backend = "numpy" if columns.numpy else "array"
+    print(f"{count} places, {len(expected)} matches, columns: {backend}")
+    runs = 5
+    loop_time = timeit(loop, number=runs) / runs
+    query_time = timeit(query, number=runs) / runs
+    print(f"{'Python loop':>14}: {loop_time * 1000:8.1f} ms")
+    print(
+        f"{'query().where':>14}: {query_time * 1000:8.1f} ms "
+        f"({loop_time / query_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""
+reload() memory benchmark:
+compares the peak and retained memory of loading a JSON file with
+json.load() and then building the instances, with the streaming
+FileStorage.reload(), keeping the JSON text of each object for the next
+save (text_cache, the default) or not
+
+usage: ./benchmarks/reload_memory.py [number of objects]
+"""
+
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine.file_storage import FileStorage  # noqa: E402
+
+
+def write_store(path, count):
+    """writes a synthetic store of count Reviews to path"""
+    with open(path, "w") as file:
+        file.write("{")
+        for i in range(count):
+            obj_id = f"{i:08d}-0000-4000-8000-000000000000"
+            record = {
+                "id": obj_id, "created_at": "2023-08-08T12:34:56.789012",
+                "updated_at": "2023-08-08T12:34:56.789012",
+                "place_id": f"place-{i % 1000}", "user_id": f"user-{i % 97}",
+                "text": f"review number {i} " * 4, "__class__": "Review"
+            }
+            separator = ", " if i else ""
+            file.write(f'{separator}"Review.{obj_id}": {json.dumps(record)}')
+        file.write("}")
+
+
+def measure(load):
+    """returns (peak, retained) bytes allocated while running load()"""
+    FileStorage._FileStorage__objects.clear()
+    FileStorage._FileStorage__by_class.clear()
+    FileStorage._FileStorage__by_attr.clear()
+    FileStorage._FileStorage__cache.clear()
+    gc.collect()
+    tracemalloc.start()
+    load()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, retained
+
+
+def load_whole(path):
+    """loads path the way reload() used to: json.load() first"""
+    objects = FileStorage._FileStorage__objects
+    with open(path, "r") as file:
+        data = json.load(file)
+    for key, obj_dict in data.items():
+        cls = FileStorage.classes_dict[obj_dict["__class__"]]
+        objects[key] = cls(**obj_dict)
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    FileStorage._FileStorage__file_path = path
+    try:
+        write_store(path, count)
+        print(f"{count} objects, {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        print(f"{'':>26} {'peak MiB':>9} {'retained MiB':>13} "
+              f"{'peak vs json.load()':>20}")
+        base = None
+        for name, text_cache, load in (
+            ("json.load()", True, lambda: load_whole(path)),
+            ("reload()", True, FileStorage().reload),
+            ("reload(), no text_cache", False, FileStorage().reload),
+        ):
+            FileStorage.text_cache = text_cache
+            peak, retained = measure(load)
+            base = base or peak
+            print(
+                f"{name:>26} {peak / 2 ** 20:9.1f} "
+                f"{retained / 2 ** 20:13.1f} {peak / base:19.2f}x"
+            )
+    finally:
+        FileStorage.text_cache = True
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""
+Serializers benchmark:
+the cost per object, for each class, of to_dict() and cls(**obj_dict)
+compared with the encode() and decode() of the class codec,
+over objects with distinct timestamps (the memo of the parsed
+timestamps only helps when objects share them)
+
+usage: ./benchmarks/serializers.py [number of objects per class]
+"""
+
+
+import os
+import sys
+from timeit import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.engine import serializers  # noqa: E402
+from models.engine.file_storage import FileStorage  # noqa: E402
+
+
+def sample(cls, i):
+    """returns an object of cls with the attributes of its class set"""
+    obj = cls(
+        id=f"{i:08d}-0000-4000-8000-000000000000",
+        created_at=f"2023-08-08T12:34:56.{i:06d}",
+        updated_at=f"2023-08-09T08:00:00.{i:06d}"
+    )
+    for name, value in vars(cls).items():
+        if not name.startswith("_") and not callable(value):
+            setattr(obj, name, value)
+    return obj
+
+
+def main():
+    """runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    runs = 3
+    print(f"{'class':>10} {'to_dict':>9} {'encode':>9} "
+          f"{'cls(**)':>9} {'decode':>9}  (us per object)")
+    for class_name, cls in FileStorage.classes_dict.items():
+        objs = [sample(cls, i) for i in range(count)]
+        dicts = [obj.to_dict() for obj in objs]
+        codec = serializers.codec(cls)
+        times = [
+            timeit(lambda: [obj.to_dict() for obj in objs], number=runs),
+            timeit(lambda: [codec.encode(obj) for obj in objs],
+                   number=runs),
+            timeit(lambda: [cls(**obj_dict) for obj_dict in dicts],
+                   number=runs),
+            timeit(lambda: [codec.decode(obj_dict) for obj_dict in dicts],
+                   number=runs)
+        ]
+        print(f"{class_name:>10}", *(
+            f"{elapsed / runs / count * 1e6:9.2f}" for elapsed in times
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ that contains the entry point of the command interpreter:
 
 
 import cmd
+import math
 import re
 import shlex
 from models import storage
@@ -27,11 +28,13 @@ class HBNBCommand(cmd.Cmd):
 
     def do_quit(self, arg):
         """Quit command to exit the program\n"""
+        storage.flush()
         return True
 
     def do_EOF(self, arg):
         """Exit the program on EOF (Ctrl-D)\n"""
         print()
+        storage.flush()
         return True
 
     def emptyline(self):
@@ -65,9 +68,9 @@ class HBNBCommand(cmd.Cmd):
             print("** instance id missing **")
             return
         instance_id = args_list[1]
-        key = f"{class_name}.{instance_id}"
-        if key in storage.all():
-            print(storage.all()[key])
+        instance = storage.get(class_name, instance_id)
+        if instance is not None:
+            print(instance)
         else:
             print("** no instance found **")
 
@@ -85,9 +88,9 @@ class HBNBCommand(cmd.Cmd):
             print("** instance id missing **")
             return
         instance_id = args_list[1]
-        key = f"{class_name}.{instance_id}"
-        if key in storage.all():
-            del storage.all()[key]
+        instance = storage.get(class_name, instance_id)
+        if instance is not None:
+            storage.delete(instance)
             storage.save()
         else:
             print("** no instance found **")
@@ -102,9 +105,8 @@ class HBNBCommand(cmd.Cmd):
             return
         class_name = arg.split()[0]
         if class_name in storage.classes_dict:
-            for key, value in storage.all().items():
-                if class_name in key:
-                    instance_list.append(str(value))
+            for value in storage.all(class_name).values():
+                instance_list.append(str(value))
             print(instance_list)
         else:
             print("** class doesn't exist **")
@@ -123,8 +125,8 @@ class HBNBCommand(cmd.Cmd):
             print("** instance id missing **")
             return
         instance_id = args_list[1]
-        key = f"{class_name}.{instance_id}"
-        if key not in storage.all():
+        instance = storage.get(class_name, instance_id)
+        if instance is None:
             print("** no instance found **")
             return
         if len(args_list) < 3:
@@ -136,7 +138,6 @@ class HBNBCommand(cmd.Cmd):
             return
         attr_value = args_list[3].strip('"')
         attr_type = None
-        instance = storage.all()[key]
         if hasattr(instance, attr_name):
             attr_type = type(getattr(instance, attr_name))
         try:
@@ -148,22 +149,84 @@ class HBNBCommand(cmd.Cmd):
 
     def do_count(self, arg):
         """Retrieves the number of instances of a class\n"""
-        num_of_instance = 0
         if not arg:
-            num_of_instance = len(storage.all())
-            print(num_of_instance)
+            print(storage.count())
             return
         class_name = arg.split()[0]
         if class_name in storage.classes_dict:
-            for key in storage.all():
-                if class_name in key:
-                    num_of_instance += 1
-            print(num_of_instance)
+            print(storage.count(class_name))
         else:
             print("** class doesn't exist **")
 
+    def do_nearby(self, arg):
+        """Prints the Places within a radius (km) of a point, nearest first
+        Usage: nearby <latitude> <longitude> <radius_km> [limit]\n"""
+        numbers = self.parse_numbers(
+            arg, ("latitude", "longitude", "radius")
+        )
+        if numbers is None:
+            return
+        limit = int(numbers[3]) if len(numbers) > 3 else None
+        print([
+            str(place)
+            for place in storage.nearby(*numbers[:3], limit=limit)
+        ])
+
+    def do_within(self, arg):
+        """Prints the Places in a bounding box
+        Usage: within <min_lat> <min_lon> <max_lat> <max_lon>\n"""
+        numbers = self.parse_numbers(
+            arg, ("min_lat", "min_lon", "max_lat", "max_lon")
+        )
+        if numbers is None:
+            return
+        print([str(place) for place in storage.within(*numbers[:4])])
+
+    def do_search(self, arg):
+        """Prints the instances matching words, best match first
+        Usage: search [<class name>] <words> [--page <n>]\n"""
+        args_list = arg.split()
+        page = 1
+        if "--page" in args_list:
+            position = args_list.index("--page")
+            try:
+                page = int(args_list[position + 1])
+            except (IndexError, ValueError):
+                page = 0
+            if page < 1:
+                print("** invalid page **")
+                return
+            del args_list[position:position + 2]
+        class_name = None
+        if args_list and args_list[0] in storage.classes_dict:
+            class_name = args_list.pop(0)
+        if not args_list:
+            print("** search words missing **")
+            return
+        print([
+            str(instance) for instance in storage.search(
+                " ".join(args_list), class_name, page
+            )
+        ])
+
+    def parse_numbers(self, arg, names):
+        """A function that parses the numbers given to nearby and within"""
+        args_list = arg.split()
+        if len(args_list) < len(names):
+            print(f"** {names[len(args_list)]} missing **")
+            return None
+        try:
+            numbers = [float(value) for value in args_list]
+        except ValueError:
+            numbers = None
+        if numbers is None or not all(map(math.isfinite, numbers)):
+            print("** invalid number **")
+            return None
+        return numbers
+
     def precmd(self, line):
         """Called before the command is executed by onecmd()\n"""
+        storage.refresh()
         pattern = r'([A-Za-z]+)\.([A-Za-z]+)\(("([^"]+)",?\s?(.*)?)?\)'
         arg_parts = re.match(pattern, line)
         if arg_parts is None:
@@ -188,8 +251,11 @@ class HBNBCommand(cmd.Cmd):
             if len(kwargs) == 1:
                 return f"{pre_args} {kwargs[0]}"
             else:
-                for i in range(1, len(kwargs), 2):
-                    self.onecmd(f"{pre_args} {kwargs[i - 1]} {kwargs[i]}")
+                with storage.batch():
+                    for i in range(1, len(kwargs), 2):
+                        self.onecmd(
+                            f"{pre_args} {kwargs[i - 1]} {kwargs[i]}"
+                        )
                 return ""
         return line
 
@@ -1,12 +1,40 @@
 #!/usr/bin/python3
 """
-FileStorage Instance initialization Module:
-that creates a unique FileStorage instance for our application
+Storage Instance initialization Module:
+that creates a unique storage instance for our application
+(a FileStorage, or a SQLiteStorage when HBNB_TYPE_STORAGE is sqlite)
+reloaded from its files, except when HBNB_STORAGE_WORKER is set
+(in processes that only need the model classes)
 """
 
 
+from models.engine.base_storage import BaseStorage
 from models.engine.file_storage import FileStorage
+from os import getenv
 
 
-storage = FileStorage()
-storage.reload()
+if getenv("HBNB_STORAGE_COMPACT"):
+    BaseStorage.compact_objects = True
+if getenv("HBNB_TYPE_STORAGE") == "sqlite":
+    from models.engine.sqlite_storage import SQLiteStorage
+    if getenv("HBNB_STORAGE_CACHE"):
+        SQLiteStorage.cache_entries = int(getenv("HBNB_STORAGE_CACHE"))
+    storage = SQLiteStorage()
+else:
+    if getenv("HBNB_STORAGE_LAZY"):
+        FileStorage.lazy = True
+    if getenv("HBNB_STORAGE_JOURNAL"):
+        FileStorage.journal = True
+    if getenv("HBNB_STORAGE_SHARED"):
+        FileStorage.shared = True
+    if getenv("HBNB_STORAGE_SHARDED"):
+        FileStorage.sharded = True
+        if getenv("HBNB_STORAGE_SHARDED").isdigit():
+            FileStorage.shard_buckets = int(getenv("HBNB_STORAGE_SHARDED"))
+    if getenv("HBNB_STORAGE_COMPRESSION"):
+        FileStorage.compression = getenv("HBNB_STORAGE_COMPRESSION")
+    if getenv("HBNB_STORAGE_WRITE_BEHIND"):
+        FileStorage.write_behind = True
+    storage = FileStorage()
+if not getenv("HBNB_STORAGE_WORKER"):
+    storage.reload()
@@ -5,10 +5,16 @@ A class that defines all common attributes/methods for other classes
 """
 
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import uuid4
 
 
+EPOCH = datetime(1970, 1, 1)
+# the old value passed to storage.touch() for an attribute that was not
+# set on the instance (its value was the class default, if any)
+_UNSET = object()
+
+
 class BaseModel:
     """
     BaseModel class:
@@ -20,11 +26,16 @@ class BaseModel:
         __init__() method:
         Initialize instance attributes based on keyword arguments or defaults.
         If no kwargs are provided, default values will be used.
+        created_at/updated_at are ISO format strings or integers
+        (microseconds since 1970-01-01T00:00:00).
         """
         if kwargs:
             for key, value in kwargs.items():
                 if key == "created_at" or key == "updated_at":
-                    value = datetime.fromisoformat(value)
+                    if isinstance(value, int):
+                        value = EPOCH + timedelta(microseconds=value)
+                    else:
+                        value = datetime.fromisoformat(value)
                 if key != "__class__":
                     setattr(self, key, value)
         else:
@@ -34,6 +45,18 @@ class BaseModel:
             self.updated_at = self.created_at
             storage.new(self)
 
+    def __setattr__(self, name, value):
+        """
+        __setattr__() method:
+        sets the attribute and marks the instance as changed in storage
+        so that the next save only re-serializes changed instances
+        """
+        old_value = self.__dict__.get(name, _UNSET)
+        super().__setattr__(name, value)
+        if "id" in self.__dict__:
+            from models import storage
+            storage.touch(self, name, old_value)
+
     def __str__(self):
         """
         __str__() method:
@@ -50,6 +73,7 @@ class BaseModel:
         """
         from models import storage
         self.updated_at = datetime.now()
+        storage.touch(self)
         storage.save()
 
     def to_dict(self):
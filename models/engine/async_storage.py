@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+"""
+AsyncFileStorage Module:
+an asyncio facade over a FileStorage for event-loop servers
+"""
+
+
+import asyncio
+import models
+
+
+class AsyncFileStorage:
+    """
+    AsyncFileStorage class:
+    runs the blocking work of a FileStorage (encoding and writing
+    the file, reading and decoding it) in an executor so the event
+    loop goes on, and coalesces the saves requested while a save
+    is running into one more save
+    """
+
+    def __init__(self, storage=None, executor=None, chunk_size=1000):
+        """
+        __init__() method:
+        Initialize the facade over storage (models.storage by default),
+        running the blocking work in executor (the default executor of
+        the loop by default); the async iteration gives control back to
+        the loop every chunk_size objects
+        storage must be in thread_safe mode, since the objects can
+        change on the loop while a save encodes them in the executor
+        """
+        self.storage = models.storage if storage is None else storage
+        if not self.storage.thread_safe:
+            raise ValueError("AsyncFileStorage needs a thread_safe storage")
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.__next = None
+        self.__flusher = None
+
+    async def __run(self, function, *args):
+        """
+        __run() method:
+        runs function(*args) in the executor and returns its result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def save(self):
+        """
+        save() method:
+        saves the storage in the executor; the saves requested while
+        a save is running wait for one more save, started when it ends
+        """
+        if self.__next is None:
+            self.__next = asyncio.get_running_loop().create_future()
+        waiting = self.__next
+        if self.__flusher is None:
+            self.__flusher = asyncio.create_task(self.__flush())
+        await asyncio.shield(waiting)
+
+    async def __flush(self):
+        """
+        __flush() method:
+        saves the storage until no save is requested anymore,
+        resolving the requests waiting for each save
+        """
+        try:
+            while self.__next is not None:
+                waiting, self.__next = self.__next, None
+                try:
+                    await self.__run(self.storage.save)
+                except Exception as error:
+                    waiting.set_exception(error)
+                else:
+                    waiting.set_result(None)
+        finally:
+            self.__flusher = None
+
+    async def reload(self):
+        """
+        reload() method:
+        reloads the storage in the executor
+        """
+        await self.__run(self.storage.reload)
+
+    async def get(self, cls, id):
+        """
+        get() method:
+        returns the object of class cls with the given id, or None
+        (loaded in the executor when the storage is lazy)
+        """
+        if self.storage.lazy:
+            return await self.__run(self.storage.get, cls, id)
+        return self.storage.get(cls, id)
+
+    def new(self, obj):
+        """
+        new() method:
+        adds obj to the storage
+        """
+        self.storage.new(obj)
+
+    def delete(self, obj=None):
+        """
+        delete() method:
+        deletes obj from the storage
+        """
+        self.storage.delete(obj)
+
+    async def objects(self, cls=None):
+        """
+        objects() method:
+        an async iterator over the objects (of class cls if given),
+        giving control back to the loop every chunk_size objects
+        """
+        def values():
+            return list(self.storage.all(cls).values())
+
+        if self.storage.lazy:
+            objects = await self.__run(values)
+        else:
+            objects = values()
+        for count, obj in enumerate(objects, 1):
+            yield obj
+            if not count % self.chunk_size:
+                await asyncio.sleep(0)
+
+    def __aiter__(self):
+        """
+        __aiter__() method:
+        an async iterator over all the objects
+        """
+        return self.objects()
@@ -0,0 +1,240 @@
+#!/usr/bin/python3
+"""
+BaseStorage class Module:
+the interface every storage engine implements
+"""
+
+
+from models.base_model import BaseModel
+from models.engine.columns import Query
+from models.engine.geo import GridIndex
+from models.engine.join_index import JoinIndex
+from models.engine.text_index import TextIndex
+from models.user import User
+from models.state import State
+from models.city import City
+from models.amenity import Amenity
+from models.place import Place
+from models.review import Review
+
+
+class BaseStorage:
+    """
+    BaseStorage class:
+    the interface every storage engine implements
+    (all/new/save/reload/delete must be overridden,
+    the other methods have defaults built on them)
+    compact_objects: when True, the loaded objects are compacted
+    (see models/engine/compact.py)
+    """
+
+    classes_dict = {
+        "BaseModel": BaseModel, "User": User, "State": State,
+        "City": City, "Amenity": Amenity, "Place": Place,
+        "Review": Review
+    }
+    indexed_attrs = {
+        "City": ("state_id",), "Place": ("city_id", "user_id"),
+        "Review": ("place_id",)
+    }
+    column_attrs = {
+        "Place": (
+            "number_rooms", "number_bathrooms", "max_guest",
+            "price_by_night", "latitude", "longitude"
+        )
+    }
+    text_attrs = {
+        "Review": ("text",), "Place": ("name", "description"),
+        "City": ("name",), "State": ("name",), "Amenity": ("name",)
+    }
+    compact_objects = False
+
+    def all(self, cls=None):
+        """
+        all() method:
+        returns a dictionary of all the objects keyed by <class name>.id
+        or only the objects of cls (a class or a class name)
+        """
+        raise NotImplementedError
+
+    def new(self, obj):
+        """
+        new() method:
+        adds obj to the storage
+        """
+        raise NotImplementedError
+
+    def save(self):
+        """
+        save() method:
+        persists the changes made since the last save
+        """
+        raise NotImplementedError
+
+    def reload(self):
+        """
+        reload() method:
+        loads the persisted objects
+        """
+        raise NotImplementedError
+
+    def delete(self, obj=None):
+        """
+        delete() method:
+        deletes obj from the storage if it's inside
+        """
+        raise NotImplementedError
+
+    def batch(self):
+        """
+        batch() method:
+        returns a context manager that defers every save() made inside it
+        to a single save when it ends, and restores the objects changed
+        inside it if an exception is raised
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """
+        flush() method:
+        writes the changes an engine deferred, if any
+        """
+        pass
+
+    def refresh(self):
+        """
+        refresh() method:
+        reads the changes made by other processes, if the engine
+        doesn't see them already
+        """
+        pass
+
+    def touch(self, obj, name=None, old_value=None):
+        """
+        touch() method:
+        called when the attribute name of obj was changed from old_value
+        (a private sentinel when name was not set on obj)
+        """
+        pass
+
+    def get(self, cls, id):
+        """
+        get() method:
+        returns the object of cls (a class or a class name) with id
+        or None if there is none
+        """
+        class_name = cls if isinstance(cls, str) else cls.__name__
+        return self.all(class_name).get(f"{class_name}.{id}")
+
+    def count(self, cls=None):
+        """
+        count() method:
+        returns the number of objects
+        or only the number of objects of cls (a class or a class name)
+        """
+        return len(self.all(cls))
+
+    def find(self, cls, **equals):
+        """
+        find() method:
+        returns the list of objects of cls (a class or a class name)
+        whose attributes are equal to the given values
+        """
+        return [
+            obj for obj in self.all(cls).values()
+            if all(
+                getattr(obj, attr, None) == value
+                for attr, value in equals.items()
+            )
+        ]
+
+    def query(self, cls):
+        """
+        query() method:
+        returns a Query over the objects of cls (a class or a class name),
+        e.g. query(Place).where(price_by_night__lt=100) returns the ids
+        of the places whose price_by_night is lower than 100
+        """
+        return Query({obj.id: obj for obj in self.all(cls).values()})
+
+    def nearby(self, lat, lon, radius_km, limit=None):
+        """
+        nearby() method:
+        returns the list of Places within radius_km of (lat, lon),
+        nearest first, at most limit of them
+        """
+        places = {obj.id: obj for obj in self.all(Place).values()}
+        index = GridIndex(objects=places.values())
+        return [
+            places[obj_id]
+            for _, obj_id in index.nearby(lat, lon, radius_km, limit)
+        ]
+
+    def within(self, min_lat, min_lon, max_lat, max_lon):
+        """
+        within() method:
+        returns the list of Places in the bounding box
+        (min_lon greater than max_lon crosses the antimeridian)
+        """
+        places = {obj.id: obj for obj in self.all(Place).values()}
+        index = GridIndex(objects=places.values())
+        return [
+            places[obj_id]
+            for obj_id in index.within(min_lat, min_lon, max_lat, max_lon)
+        ]
+
+    def search(self, text, cls=None, page=1, per_page=10):
+        """
+        search() method:
+        returns the page (numbered from 1) of the objects whose
+        text_attrs contain words of text, best match first,
+        only the objects of cls (a class or a class name) if given
+        """
+        index = TextIndex(self.text_attrs)
+        objects = {}
+        for class_name in self.text_attrs:
+            for key, obj in self.all(class_name).items():
+                index.add(key, obj)
+                objects[key] = obj
+        if cls is not None and not isinstance(cls, str):
+            cls = cls.__name__
+        keys = index.search(text, cls)
+        start = (page - 1) * per_page
+        return [objects[key] for key in keys[start:start + per_page]]
+
+    def link(self, place, amenity):
+        """
+        link() method:
+        adds amenity (an Amenity or its id) to the amenity_ids of place
+        (a new list is assigned: the class-level [] is never changed)
+        """
+        amenity_id = getattr(amenity, "id", amenity)
+        if amenity_id not in place.amenity_ids:
+            place.amenity_ids = place.amenity_ids + [amenity_id]
+
+    def unlink(self, place, amenity):
+        """
+        unlink() method:
+        removes amenity (an Amenity or its id) from the amenity_ids
+        of place
+        """
+        amenity_id = getattr(amenity, "id", amenity)
+        if amenity_id in place.amenity_ids:
+            place.amenity_ids = [
+                other for other in place.amenity_ids if other != amenity_id
+            ]
+
+    def places_with(self, *amenities):
+        """
+        places_with() method:
+        returns the list of Places having every one of amenities
+        (Amenities or their ids), sorted by id
+        """
+        places = {obj.id: obj for obj in self.all(Place).values()}
+        index = JoinIndex()
+        for place in places.values():
+            index.set(place.id, place.amenity_ids)
+        found = index.with_all(
+            getattr(amenity, "id", amenity) for amenity in amenities
+        )
+        return [places[place_id] for place_id in sorted(found)]
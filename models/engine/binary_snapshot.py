@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+"""
+Binary snapshot Module:
+a snapshot format that can be memory-mapped and read one record at a time
+
+Layout (little-endian):
+    header: magic b"HBNB", version (H), flags (H), number of records (I)
+    table:  for each record: offset (Q), length (I), key length (H), key
+    records: for each record: length (I), payload
+A payload is the compact JSON text of a to_dict() in which created_at
+and updated_at are integers (microseconds since 1970-01-01T00:00:00).
+(./tools/binary_snapshot.py converts file.json to file.hbnb and back)
+"""
+
+
+import json
+import struct
+from datetime import datetime, timedelta
+from models.base_model import EPOCH
+from models.engine.json_stream import iter_items
+
+
+MAGIC = b"HBNB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+ENTRY = struct.Struct("<QIH")
+LENGTH = struct.Struct("<I")
+TIMESTAMPS = ("created_at", "updated_at")
+
+
+def to_micros(value):
+    """
+    to_micros() function:
+    returns a datetime as microseconds since EPOCH
+    """
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def from_micros(value):
+    """
+    from_micros() function:
+    returns the datetime of microseconds since EPOCH
+    """
+    return EPOCH + timedelta(microseconds=value)
+
+
+def encode(obj):
+    """
+    encode() function:
+    returns the payload of obj, built like its to_dict()
+    """
+    record = obj.__dict__.copy()
+    record["__class__"] = obj.__class__.__name__
+    for key in TIMESTAMPS:
+        record[key] = to_micros(getattr(obj, key))
+    return json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+
+def decode(payload):
+    """
+    decode() function:
+    returns the dictionary of a payload, with integer timestamps
+    (BaseModel accepts them as keyword arguments)
+    """
+    return json.loads(bytes(payload))
+
+
+def dump(file, records, source=None):
+    """
+    dump() function:
+    writes a snapshot of records, a dictionary of key: payload, to the
+    binary file and returns the (offset, length) of each payload in it
+    (a payload given as an (offset, length) tuple is copied from source)
+    """
+    keys = [(key, key.encode("utf-8")) for key in records]
+    lengths = [
+        payload[1] if isinstance(payload, tuple) else len(payload)
+        for payload in records.values()
+    ]
+    position = HEADER.size + sum(
+        ENTRY.size + len(key_bytes) for _, key_bytes in keys
+    )
+    offsets = {}
+    file.write(HEADER.pack(MAGIC, VERSION, 0, len(records)))
+    for (key, key_bytes), length in zip(keys, lengths):
+        offsets[key] = (position + LENGTH.size, length)
+        file.write(ENTRY.pack(position + LENGTH.size, length, len(key_bytes)))
+        file.write(key_bytes)
+        position += LENGTH.size + length
+    for payload, length in zip(records.values(), lengths):
+        if isinstance(payload, tuple):
+            payload = source[payload[0]:payload[0] + payload[1]]
+        file.write(LENGTH.pack(length))
+        file.write(payload)
+    return offsets
+
+
+def load_table(buffer):
+    """
+    load_table() function:
+    returns the (offset, length) of each payload of the snapshot
+    in buffer (e.g. an mmap) keyed by <class name>.id
+    """
+    magic, version, _, count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a binary snapshot")
+    table = {}
+    position = HEADER.size
+    for _ in range(count):
+        offset, length, key_length = ENTRY.unpack_from(buffer, position)
+        position += ENTRY.size
+        key = bytes(buffer[position:position + key_length]).decode("utf-8")
+        position += key_length
+        table[key] = (offset, length)
+    return table
+
+
+def convert(source, destination):
+    """
+    convert() function:
+    converts the JSON file source to the binary snapshot destination
+    or the binary snapshot source to the JSON file destination
+    (depending on the extension of destination)
+    """
+    if destination.endswith(".json"):
+        with open(source, "rb") as file:
+            buffer = file.read()
+        with open(destination, "w", encoding="utf-8") as file:
+            file.write("{")
+            separator = ""
+            for key, (offset, length) in load_table(buffer).items():
+                record = decode(buffer[offset:offset + length])
+                for name in TIMESTAMPS:
+                    record[name] = from_micros(record[name]).isoformat()
+                file.write(
+                    f"{separator}{json.dumps(key)}: {json.dumps(record)}"
+                )
+                separator = ", "
+            file.write("}")
+        return
+    records = {}
+    with open(source, "r", encoding="utf-8") as file:
+        for key, record, _ in iter_items(file):
+            for name in TIMESTAMPS:
+                value = datetime.fromisoformat(record[name])
+                record[name] = to_micros(value)
+            records[key] = json.dumps(
+                record, separators=(",", ":")
+            ).encode("utf-8")
+    with open(destination, "wb") as file:
+        dump(file, records)
@@ -0,0 +1,232 @@
+#!/usr/bin/python3
+"""
+Columnar store Module:
+keeps the numeric attributes of the objects of a class in one array
+per attribute so that range filters run over arrays instead of objects
+(with NumPy when it is installed, with the array module otherwise)
+"""
+
+
+import operator
+from array import array
+from contextlib import nullcontext
+from functools import partial
+from itertools import compress
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+OPERATORS = {
+    "eq": operator.eq, "ne": operator.ne, "lt": operator.lt,
+    "lte": operator.le, "gt": operator.gt, "gte": operator.ge
+}
+# the operators with their operands swapped: value <op> column
+SWAPPED = {
+    "eq": operator.eq, "ne": operator.ne, "lt": operator.gt,
+    "lte": operator.ge, "gt": operator.lt, "gte": operator.le
+}
+
+
+def parse(conditions):
+    """
+    parse() function:
+    returns the list of (attribute, operator name, value) of keyword
+    conditions like price_by_night__lt=100 (no suffix means __eq)
+    """
+    parsed = []
+    for name, value in conditions.items():
+        attr, _, op = name.rpartition("__")
+        if not attr:
+            attr, op = name, "eq"
+        if op not in OPERATORS:
+            raise ValueError(f"unknown operator: {op}")
+        parsed.append((attr, op, value))
+    return parsed
+
+
+def is_number(value):
+    """
+    is_number() function:
+    returns True if value can be kept in a column
+    """
+    return isinstance(value, (int, float))
+
+
+def matches(obj, conditions):
+    """
+    matches() function:
+    returns True if obj meets every (attribute, operator name, value)
+    (values that can't be compared never match)
+    """
+    for attr, op, value in conditions:
+        try:
+            if not OPERATORS[op](getattr(obj, attr, None), value):
+                return False
+        except TypeError:
+            return False
+    return True
+
+
+class ColumnStore:
+    """
+    ColumnStore class:
+    the values of attrs of a set of objects, one array of doubles
+    per attribute and one row per object (values that are not numbers
+    are kept as NaN, which only matches ne, as when comparing objects)
+    """
+
+    def __init__(self, attrs, objects=()):
+        """
+        __init__() method:
+        Initialize the columns of attrs with the given objects
+        """
+        self.attrs = tuple(attrs)
+        self.ids = []
+        self.rows = {}
+        self.columns = {attr: array("d") for attr in self.attrs}
+        for obj in objects:
+            self.add(obj)
+
+    def __len__(self):
+        """
+        __len__() method:
+        returns the number of rows
+        """
+        return len(self.ids)
+
+    @staticmethod
+    def value(obj, attr):
+        """
+        value() method:
+        returns the value of the attribute attr of obj as a double
+        """
+        value = getattr(obj, attr, None)
+        return float(value) if is_number(value) else float("nan")
+
+    def add(self, obj):
+        """
+        add() method:
+        adds the row of obj, or updates it if obj already has one
+        """
+        row = self.rows.get(obj.id)
+        if row is None:
+            self.rows[obj.id] = len(self.ids)
+            self.ids.append(obj.id)
+            for attr, column in self.columns.items():
+                column.append(self.value(obj, attr))
+        else:
+            for attr, column in self.columns.items():
+                column[row] = self.value(obj, attr)
+
+    def update(self, obj, attr):
+        """
+        update() method:
+        updates the value of attr in the row of obj
+        """
+        row = self.rows.get(obj.id)
+        if row is not None and attr in self.columns:
+            self.columns[attr][row] = self.value(obj, attr)
+
+    def remove(self, obj_id):
+        """
+        remove() method:
+        removes the row of obj_id by moving the last row in its place
+        """
+        row = self.rows.pop(obj_id, None)
+        if row is None:
+            return
+        last_id = self.ids.pop()
+        for column in self.columns.values():
+            last = column.pop()
+            if row < len(self.ids):
+                column[row] = last
+        if row < len(self.ids):
+            self.ids[row] = last_id
+            self.rows[last_id] = row
+
+    def select(self, conditions):
+        """
+        select() method:
+        returns the ids of the rows meeting every
+        (attribute, operator name, number) of conditions
+        """
+        if not self.ids:
+            return []
+        if numpy is not None:
+            mask = numpy.ones(len(self.ids), dtype=bool)
+            for attr, op, value in conditions:
+                column = numpy.frombuffer(self.columns[attr], numpy.float64)
+                mask &= OPERATORS[op](column, value)
+            return [self.ids[row] for row in numpy.flatnonzero(mask)]
+        mask = None
+        for attr, op, value in conditions:
+            column = self.columns[attr]
+            selected = map(partial(SWAPPED[op], value), column)
+            mask = list(selected if mask is None else map(
+                operator.and_, mask, selected
+            ))
+        if mask is None:
+            return list(self.ids)
+        return list(compress(self.ids, mask))
+
+
+class Query:
+    """
+    Query class:
+    the filter of storage.query(cls) over the objects of a class
+    """
+
+    def __init__(self, objects, columns=None, lock=nullcontext):
+        """
+        __init__() method:
+        Initialize the query over objects, a dictionary of id: object,
+        and over their ColumnStore if there is one; lock() returns the
+        context manager held while they are read (the storage read lock
+        when other threads may change them)
+        """
+        self.objects = objects
+        self.columns = columns
+        self.lock = lock
+
+    def where(self, **conditions):
+        """
+        where() method:
+        returns the ids of the objects meeting every condition,
+        e.g. where(price_by_night__lt=100, max_guest__gte=4)
+        (operators: eq (default), ne, lt, lte, gt, gte)
+        the conditions on numbers over a column are evaluated
+        on the arrays, the others object by object
+        """
+        conditions = parse(conditions)
+        with self.lock():
+            return self.__select(conditions)
+
+    def __select(self, conditions):
+        """
+        __select() method:
+        where() over the parsed conditions
+        """
+        if self.columns is None:
+            return [
+                obj_id for obj_id, obj in self.objects.items()
+                if matches(obj, conditions)
+            ]
+        vectorized = [
+            condition for condition in conditions
+            if condition[0] in self.columns.columns
+            and is_number(condition[2])
+        ]
+        others = [
+            condition for condition in conditions
+            if not any(condition is other for other in vectorized)
+        ]
+        ids = self.columns.select(vectorized)
+        if not others:
+            return ids
+        return [
+            obj_id for obj_id in ids
+            if matches(self.objects[obj_id], others)
+        ]
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+"""
+Compact objects Module:
+shrinks the __dict__ of loaded instances without changing its content,
+so that to_dict() and __str__() give the same output
+"""
+
+
+import sys
+
+
+def is_identifier(name):
+    """
+    is_identifier() function:
+    returns True if the attribute name holds an id or a list of ids
+    (id, <name>_id and <name>_ids), values repeated across objects
+    """
+    return name == "id" or name.endswith("_id") or name.endswith("_ids")
+
+
+def intern_ids(obj_dict):
+    """
+    intern_ids() function:
+    interns the ids held by obj_dict, a to_dict() or an instance
+    __dict__ (so that every object referring to the same State, City,
+    User or Place shares one string), then returns obj_dict
+    """
+    for name, value in obj_dict.items():
+        if not is_identifier(name):
+            continue
+        if isinstance(value, str):
+            obj_dict[name] = sys.intern(value)
+        elif isinstance(value, list):
+            value[:] = [
+                sys.intern(item) if isinstance(item, str) else item
+                for item in value
+            ]
+    return obj_dict
+
+
+def share_timestamps(obj):
+    """
+    share_timestamps() function:
+    makes updated_at the created_at object of obj when both are equal,
+    then returns obj (set with object.__setattr__(), which neither
+    notifies storage nor builds the __dict__ of an instance that has
+    none yet)
+    """
+    created_at = getattr(obj, "created_at", None)
+    updated_at = getattr(obj, "updated_at", None)
+    if created_at is not None and updated_at is not created_at and (
+        updated_at == created_at
+    ):
+        object.__setattr__(obj, "updated_at", created_at)
+    return obj
+
+
+def compact(obj):
+    """
+    compact() function:
+    interns the ids held by obj and shares its equal timestamps,
+    then returns obj (its __dict__ is changed in place: storage is not
+    notified); storage engines call intern_ids() on the to_dict() the
+    object is built from instead, as reading obj.__dict__ gives the
+    instance a dict of its own
+    """
+    intern_ids(obj.__dict__)
+    return share_timestamps(obj)
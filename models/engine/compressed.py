@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+"""
+Compressed files Module:
+opens the storage files through a compression codec, streaming:
+gzip, lzma and bz2 from the standard library, zstd and lz4 when the
+zstandard and lz4 packages are installed
+"""
+
+
+import bz2
+import gzip
+import lzma
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+EXTENSIONS = {
+    "gzip": ".gz", "lzma": ".xz", "bz2": ".bz2", "zstd": ".zst", "lz4": ".lz4"
+}
+# the codecs "auto" picks from, fastest first
+FASTEST = ("zstd", "lz4", "gzip")
+# the compression level of each codec: fast rather than small,
+# as the files are written on every save
+LEVELS = {"gzip": 6, "lzma": 1, "bz2": 9, "zstd": 3, "lz4": 0}
+
+
+def available():
+    """
+    available() function:
+    returns the names of the codecs that can be used
+    """
+    return [
+        name for name in EXTENSIONS
+        if (name != "zstd" or zstandard) and (name != "lz4" or lz4_frame)
+    ]
+
+
+def resolve(name):
+    """
+    resolve() function:
+    returns the codec name, the fastest one available for "auto"
+    (raises ValueError for an unknown or unavailable codec)
+    """
+    if name == "auto":
+        return next(name for name in FASTEST if name in available())
+    if name not in EXTENSIONS:
+        raise ValueError(f"unknown compression: {name}")
+    if name not in available():
+        raise ValueError(f"{name} compression needs a package to be installed")
+    return name
+
+
+def codec_of(path):
+    """
+    codec_of() function:
+    returns the name of the codec of path, from its extension,
+    or None if path has no compressed file extension
+    """
+    for name, extension in EXTENSIONS.items():
+        if path.endswith(extension):
+            return name
+    return None
+
+
+def wrap(fileobj, mode, name, level=None):
+    """
+    wrap() function:
+    returns a text file ("rt" or "wt" mode) decompressing
+    or compressing fileobj (a path or an open binary file)
+    with the codec name
+    """
+    if level is None:
+        level = LEVELS[name]
+    writing = mode.startswith("w")
+    if name == "gzip":
+        return gzip.open(fileobj, mode, compresslevel=level, encoding="utf-8")
+    if name == "lzma":
+        return lzma.open(fileobj, mode, preset=level if writing else None,
+                         encoding="utf-8")
+    if name == "bz2":
+        return bz2.open(fileobj, mode, compresslevel=level, encoding="utf-8")
+    if name == "zstd":
+        return zstandard.open(
+            fileobj, mode, encoding="utf-8",
+            cctx=zstandard.ZstdCompressor(level=level) if writing else None
+        )
+    return lz4_frame.open(fileobj, mode, compression_level=level,
+                          encoding="utf-8")
+
+
+def open_text(path, name):
+    """
+    open_text() function:
+    returns the file at path opened to be read as text,
+    decompressed with the codec name if it isn't None
+    """
+    if name is None:
+        return open(path, "r", encoding="utf-8")
+    return wrap(path, "rt", name)
@@ -6,18 +6,39 @@ and deserializes JSON file to instances
 """
 
 
+import atexit
 import json
-from models.base_model import BaseModel
-from models.user import User
-from models.state import State
-from models.city import City
-from models.amenity import Amenity
-from models.place import Place
-from models.review import Review
-from os.path import exists
+import mmap
+import os
+import sys
+import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from models.base_model import _UNSET
+from models.engine import binary_snapshot, compressed, json_backend
+from models.engine import parallel, serializers, shards
+from models.engine.base_storage import BaseStorage
+from models.engine.columns import ColumnStore, Query
+from models.engine.geo import GridIndex
+from models.engine.join_index import JoinIndex
+from models.engine.compact import intern_ids, share_timestamps
+from models.engine.json_stream import iter_items
+from models.engine.lazy import LazyDict, UNLOADED
+from models.engine.rwlock import RWLock
+from models.engine.text_index import TextIndex
+from os.path import exists, getsize
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
-class FileStorage:
+
+class FileStorage(BaseStorage):
     """
     FileStorage class:
     a class that serializes instances to a JSON file
@@ -26,37 +47,1273 @@ class FileStorage:
 
     __file_path = "file.json"
     __objects = {}
-    classes_dict = {
-        "BaseModel": BaseModel, "User": User, "State": State,
-        "City": City, "Amenity": Amenity, "Place": Place,
-        "Review": Review
+    __by_class = {}
+    __by_attr = {}
+    __cache = {}
+    __dirty = set()
+    __deleted = set()
+    __lazy_classes = set()
+    __mmap = None
+    __source = None
+    __cache_format = "json"
+    __saves = 0
+    __columns = {}
+    __geo = None
+    __text = None
+    __text_stamp = None
+    __amenities = None
+    __stamp = None
+    __journal_offset = 0
+    __shards_loaded = None
+    __local = threading.local()
+    __rwlock = RWLock()
+    __save_lock = threading.RLock()
+    __flush_wanted = threading.Condition()
+    __flusher = None
+    __pending_since = None
+    __metrics = {
+        "flushes": 0, "last_flush_ms": 0.0, "max_flush_ms": 0.0,
+        "total_flush_ms": 0.0, "last_flushed": 0, "failures": 0,
+        "last_error": None
     }
+    snapshot_format = "json"
+    fsync_dir = False
+    lazy = False
+    journal = False
+    journal_threshold = 1024 * 1024
+    columnar = False
+    shared = False
+    thread_safe = False
+    write_behind = False
+    flush_interval_ms = 1000
+    flush_threshold = 1000
+    parallel_workers = 1
+    parallel_threshold = 50000
+    sharded = False
+    shard_buckets = 1
+    compression = None
+    compression_level = None
+    text_cache = True
+    shard_workers = 4
+
+    def __threaded(self):
+        """
+        __threaded() method:
+        returns True if other threads may use the storage
+        (in thread_safe mode, or in write_behind mode since
+        the saves are then made by a background thread)
+        """
+        return self.thread_safe or self.write_behind
+
+    def __reading(self):
+        """
+        __reading() method:
+        returns the context manager to hold while reading the objects
+        in thread_safe mode (to write when some are not loaded yet,
+        since reading them loads them)
+        """
+        if not self.__threaded():
+            return nullcontext()
+        if isinstance(self.__objects, LazyDict):
+            return self.__rwlock.writing()
+        return self.__rwlock.reading()
+
+    def __writing(self):
+        """
+        __writing() method:
+        returns the context manager to hold while changing the objects
+        or the indexes in thread_safe mode
+        """
+        if not self.__threaded():
+            return nullcontext()
+        return self.__rwlock.writing()
+
+    def __saving(self):
+        """
+        __saving() method:
+        returns the context manager to hold while writing the files
+        in thread_safe mode, so that saves run one at a time
+        """
+        return self.__save_lock if self.__threaded() else nullcontext()
 
-    def all(self):
+    def all(self, cls=None):
         """
         all() method:
-        returns the dictionary __objects
+        returns the dictionary __objects (a copy of it in thread_safe
+        mode) or only the objects of cls (a class or a class name)
+        """
+        self.__need(cls)
+        with self.__reading():
+            if cls is None:
+                if self.__threaded():
+                    return dict(self.__objects.items())
+                return self.__objects
+            class_name = cls if isinstance(cls, str) else cls.__name__
+            keys = [
+                f"{class_name}.{obj_id}"
+                for obj_id in self.__by_class.get(class_name, {})
+            ]
+            if class_name in self.__lazy_classes:
+                self.__hydrate([
+                    key for key in keys
+                    if dict.get(self.__objects, key) is UNLOADED
+                ])
+                self.__lazy_classes.discard(class_name)
+            return {key: self.__objects[key] for key in keys}
+
+    def get(self, cls, id):
+        """
+        get() method:
+        returns the object of cls (a class or a class name) with id
+        or None if there is none
+        """
+        self.__need(cls)
+        with self.__reading():
+            class_name = cls if isinstance(cls, str) else cls.__name__
+            return self.__objects.get(f"{class_name}.{id}")
+
+    def count(self, cls=None):
+        """
+        count() method:
+        returns the number of objects in __objects
+        or only the number of objects of cls (a class or a class name)
+        """
+        self.__need(cls)
+        with self.__reading():
+            if cls is None:
+                return len(self.__objects)
+            class_name = cls if isinstance(cls, str) else cls.__name__
+            return len(self.__by_class.get(class_name, {}))
+
+    def find(self, cls, **equals):
+        """
+        find() method:
+        returns the list of objects of cls (a class or a class name)
+        whose attributes are equal to the given values
+        (lookups on attributes in indexed_attrs only visit the matches)
+        """
+        self.__need(cls)
+        with self.__reading():
+            class_name = cls if isinstance(cls, str) else cls.__name__
+            if class_name in self.__lazy_classes:
+                self.all(class_name)
+            candidates = self.__by_class.get(class_name, {})
+            indexes = self.__by_attr.get(class_name, {})
+            for attr, value in equals.items():
+                if attr in self.indexed_attrs.get(class_name, ()):
+                    try:
+                        bucket = indexes.get(attr, {}).get(value, {})
+                    except TypeError:
+                        continue
+                    if len(bucket) < len(candidates):
+                        candidates = bucket
+            return [
+                obj for obj in candidates.values()
+                if all(
+                    getattr(obj, attr, None) == value
+                    for attr, value in equals.items()
+                )
+            ]
+
+    def query(self, cls):
+        """
+        query() method:
+        returns a Query over the objects of cls (a class or a class name)
+        when columnar is True, the attributes of column_attrs are kept
+        in arrays from the first query on, and the conditions on them
+        are evaluated on the arrays
+        (where() reads the objects and arrays under the read lock)
+        """
+        self.__need(cls)
+        with self.__writing():
+            class_name = cls if isinstance(cls, str) else cls.__name__
+            if class_name in self.__lazy_classes:
+                self.all(class_name)
+            objects = self.__by_class.get(class_name, {})
+            columns = self.__columns.get(class_name)
+            if columns is None and self.columnar:
+                if class_name in self.column_attrs:
+                    columns = ColumnStore(
+                        self.column_attrs[class_name], objects.values()
+                    )
+                    self.__columns[class_name] = columns
+            return Query(
+                objects, columns if self.columnar else None, self.__reading
+            )
+
+    def __geo_index(self):
+        """
+        __geo_index() method:
+        returns the grid index of the Places, built on first use
+        and then kept up to date
+        """
+        self.__need("Place")
+        if "Place" in self.__lazy_classes:
+            self.all("Place")
+        if FileStorage.__geo is None:
+            FileStorage.__geo = GridIndex(
+                objects=self.__by_class.get("Place", {}).values()
+            )
+        return FileStorage.__geo
+
+    def nearby(self, lat, lon, radius_km, limit=None):
+        """
+        nearby() method:
+        returns the list of Places within radius_km of (lat, lon),
+        nearest first, at most limit of them
+        (the Places are found through a grid index)
         """
-        return self.__objects
+        with self.__writing():
+            places = self.__by_class.get("Place", {})
+            return [
+                places[obj_id] for _, obj_id in self.__geo_index().nearby(
+                    lat, lon, radius_km, limit
+                )
+            ]
+
+    def within(self, min_lat, min_lon, max_lat, max_lon):
+        """
+        within() method:
+        returns the list of Places in the bounding box
+        (min_lon greater than max_lon crosses the antimeridian)
+        """
+        with self.__writing():
+            places = self.__by_class.get("Place", {})
+            return [
+                places[obj_id] for obj_id in self.__geo_index().within(
+                    min_lat, min_lon, max_lat, max_lon
+                )
+            ]
+
+    def __amenity_index(self):
+        """
+        __amenity_index() method:
+        returns the Place <-> Amenity join index, built on first use
+        from the amenity_ids of the Places and then kept up to date
+        """
+        self.__need("Place")
+        if "Place" in self.__lazy_classes:
+            self.all("Place")
+        if FileStorage.__amenities is None:
+            index = JoinIndex()
+            for place in self.__by_class.get("Place", {}).values():
+                index.set(place.id, self.__amenity_ids(place))
+            FileStorage.__amenities = index
+        return FileStorage.__amenities
+
+    @staticmethod
+    def __amenity_ids(place):
+        """
+        __amenity_ids() method:
+        returns the amenity_ids of place, or () if it isn't a list
+        """
+        amenity_ids = getattr(place, "amenity_ids", None)
+        return amenity_ids if isinstance(amenity_ids, list) else ()
+
+    def places_with(self, *amenities):
+        """
+        places_with() method:
+        returns the list of Places having every one of amenities
+        (Amenities or their ids), sorted by id
+        (the Places are found through the join index)
+        """
+        with self.__writing():
+            places = self.__by_class.get("Place", {})
+            found = self.__amenity_index().with_all(
+                getattr(amenity, "id", amenity) for amenity in amenities
+            )
+            return [places[place_id] for place_id in sorted(found)]
+
+    def __text_index(self):
+        """
+        __text_index() method:
+        returns the full-text index, read from the text index file
+        or built on first use, and then kept up to date
+        """
+        if FileStorage.__text is None:
+            index = self.__reload_text_index()
+            if index is None:
+                index = TextIndex(self.text_attrs)
+                for class_name in self.text_attrs:
+                    for key, obj in self.all(class_name).items():
+                        index.add(key, obj)
+            FileStorage.__text = index
+        return FileStorage.__text
+
+    def search(self, text, cls=None, page=1, per_page=10):
+        """
+        search() method:
+        returns the page (numbered from 1) of the objects whose
+        text_attrs contain words of text, best match first,
+        only the objects of cls (a class or a class name) if given
+        (the objects are found through an inverted index)
+        """
+        for class_name in self.text_attrs:
+            self.__need(class_name)
+        with self.__writing():
+            if cls is not None and not isinstance(cls, str):
+                cls = cls.__name__
+            keys = self.__text_index().search(text, cls)
+            start = (page - 1) * per_page
+            return [
+                self.__objects[key] for key in keys[start:start + per_page]
+            ]
 
     def new(self, obj):
         """
         new() method:
         sets in __objects the obj with key <obj class name>.id
         """
-        key = f"{obj.__class__.__name__}.{obj.id}"
-        self.__objects[key] = obj
+        with self.__writing():
+            key = f"{obj.__class__.__name__}.{obj.id}"
+            self.__record(key)
+            self.__objects[key] = obj
+            self.__index(key, obj)
+            self.__deleted.discard(key)
+            self.__dirty.add(key)
+
+    def touch(self, obj, name=None, old_value=None):
+        """
+        touch() method:
+        marks a stored obj as changed since the last save
+        and moves it in the attribute index when name is an indexed
+        attribute whose value was old_value
+        (objects that are not in __objects are ignored)
+        """
+        with self.__writing():
+            class_name = obj.__class__.__name__
+            key = f"{class_name}.{obj.__dict__.get('id')}"
+            if dict.get(self.__objects, key) is not obj:
+                return
+            self.__record(key, name, old_value)
+            self.__dirty.add(key)
+            if old_value is _UNSET:
+                old_value = getattr(type(obj), name, None)
+            if name in self.indexed_attrs.get(class_name, ()):
+                self.__unindex_attr(class_name, name, old_value, obj.id)
+                self.__index_attr(class_name, name, getattr(obj, name), obj)
+            if class_name in self.__columns:
+                if name is None:
+                    self.__columns[class_name].add(obj)
+                else:
+                    self.__columns[class_name].update(obj, name)
+            if class_name == "Place" and self.__geo is not None:
+                if name in (None, "latitude", "longitude"):
+                    self.__geo.add(obj)
+            if self.__text is not None:
+                if name is None or name in self.text_attrs.get(class_name, ()):
+                    self.__text.add(key, obj)
+            if class_name == "Place" and self.__amenities is not None:
+                if name in (None, "amenity_ids"):
+                    self.__amenities.set(obj.id, self.__amenity_ids(obj))
+
+    def delete(self, obj=None):
+        """
+        delete() method:
+        deletes obj from __objects if it's inside
+        """
+        with self.__writing():
+            if obj is None:
+                return
+            key = f"{obj.__class__.__name__}.{obj.id}"
+            self.__record(key)
+            if self.__objects.pop(key, None) is not None:
+                self.__unindex(key)
+                self.__dirty.discard(key)
+                self.__deleted.add(key)
 
     def save(self):
         """
         save() method:
         serializes __objects to the JSON file (path: __file_path)
+        or to the binary snapshot when snapshot_format is "binary"
+        in journal mode, only the changes since the last save
+        are appended to the journal file
+        inside batch(), the save is done once, when the batch ends
+        in shared mode, the changes made by other processes are merged
+        first, under an exclusive lock on the lock file
+        in write_behind mode, the changes are only written by the
+        background flusher thread (see flush())
+        in sharded mode, only the shard files of the changed objects
+        are written
         """
-        data = {}
-        for key, obj in self.__objects.items():
-            data[key] = obj.to_dict()
-        with open(self.__file_path, "w") as file:
-            json.dump(data, file)
+        batch = getattr(self.__local, "batch", None)
+        if batch is not None:
+            batch["save"] = True
+            return
+        if self.write_behind:
+            self.__schedule_flush()
+            return
+        self.__save()
+
+    def __save(self):
+        """
+        __save() method:
+        writes the changes since the last save to the files
+        """
+        with self.__saving(), self.__locked(True), self.__keeping_changes():
+            if self.sharded:
+                self.__save_shards()
+                return
+            if self.shared:
+                with self.__writing():
+                    self.__refresh()
+            if not self.journal:
+                self.compact()
+            else:
+                with self.__writing():
+                    self.__append_journal()
+                log_path = self.journal_path()
+                log_size = getsize(log_path) if exists(log_path) else 0
+                if log_size >= self.journal_threshold:
+                    self.compact()
+            self.__sync_stamp()
+
+    @contextmanager
+    def __keeping_changes(self):
+        """
+        __keeping_changes() method:
+        a context manager marking the objects changed before it as
+        changed again when the write inside it fails, so that the next
+        save writes them (encoding them clears the changed objects)
+        and counts the writes (see __rollback())
+        """
+        with self.__writing():
+            dirty, deleted = set(self.__dirty), set(self.__deleted)
+            FileStorage.__saves += 1
+        try:
+            yield
+        except BaseException:
+            with self.__writing():
+                objects = self.__objects
+                self.__dirty.update(key for key in dirty if key in objects)
+                self.__deleted.update(
+                    key for key in deleted if key not in objects
+                )
+            raise
+
+    def __schedule_flush(self):
+        """
+        __schedule_flush() method:
+        asks the flusher thread, started on first use, to write the
+        changes within flush_interval_ms, or right away once
+        flush_threshold objects are waiting
+        """
+        with self.__flush_wanted:
+            if self.__pending_since is None:
+                FileStorage.__pending_since = time.monotonic()
+            if self.__flusher is None or not self.__flusher.is_alive():
+                if self.__flusher is None:
+                    atexit.register(self.flush)
+                FileStorage.__flusher = threading.Thread(
+                    target=self.__flush_loop, name="FileStorage flusher",
+                    daemon=True
+                )
+                self.__flusher.start()
+            self.__flush_wanted.notify()
+
+    def __queue_depth(self):
+        """
+        __queue_depth() method:
+        returns the number of objects waiting to be written
+        """
+        return len(self.__dirty) + len(self.__deleted)
+
+    def __flush_loop(self):
+        """
+        __flush_loop() method:
+        the loop of the flusher thread: waits for changes, then for
+        flush_interval_ms or flush_threshold changed objects, and flushes
+        """
+        while True:
+            with self.__flush_wanted:
+                while self.__pending_since is None:
+                    self.__flush_wanted.wait()
+                while self.__pending_since is not None:
+                    remaining = self.__pending_since + (
+                        self.flush_interval_ms / 1000
+                    ) - time.monotonic()
+                    if remaining <= 0 or (
+                        self.__queue_depth() >= self.flush_threshold
+                    ):
+                        break
+                    self.__flush_wanted.wait(remaining)
+            try:
+                self.flush()
+            except Exception:
+                # flush() kept the changes pending: retry them after
+                # flush_interval_ms (or with the next changes)
+                with self.__flush_wanted:
+                    self.__flush_wanted.wait(self.flush_interval_ms / 1000)
+
+    def flush(self):
+        """
+        flush() method:
+        in write_behind mode, writes the changes waiting for the
+        flusher thread now (called by the console on quit and at exit)
+        if the write fails, the changes stay pending, the failure is
+        counted in flush_metrics() and the exception is raised
+        the save lock is held from the start, so that a flush finding
+        nothing pending returns only once a save in progress (e.g. by
+        the flusher thread) is written
+        """
+        with self.__saving():
+            with self.__flush_wanted:
+                if self.__pending_since is None:
+                    return
+                FileStorage.__pending_since = None
+            self.__flush()
+
+    def __flush(self):
+        """
+        __flush() method:
+        flush() once the pending changes are claimed
+        """
+        queued = self.__queue_depth()
+        start = time.perf_counter()
+        try:
+            self.__save()
+        except BaseException as error:
+            with self.__flush_wanted:
+                if self.__pending_since is None:
+                    FileStorage.__pending_since = time.monotonic()
+            self.__metrics["failures"] += 1
+            self.__metrics["last_error"] = repr(error)
+            raise
+        elapsed = (time.perf_counter() - start) * 1000
+        metrics = self.__metrics
+        metrics["flushes"] += 1
+        metrics["last_flush_ms"] = elapsed
+        metrics["max_flush_ms"] = max(metrics["max_flush_ms"], elapsed)
+        metrics["total_flush_ms"] += elapsed
+        metrics["last_flushed"] = queued
+
+    def flush_metrics(self):
+        """
+        flush_metrics() method:
+        returns the write_behind metrics: number of flushes, last, max
+        and average flush latency in ms, number of objects written by
+        the last flush, number of failed flushes and the last error,
+        and queue depth (objects waiting to be written)
+        """
+        metrics = dict(self.__metrics)
+        total = metrics.pop("total_flush_ms")
+        metrics["avg_flush_ms"] = total / metrics["flushes"] if metrics[
+            "flushes"
+        ] else 0.0
+        metrics["queue_depth"] = self.__queue_depth()
+        return metrics
+
+    @contextmanager
+    def batch(self):
+        """
+        batch() method:
+        a context manager that defers every save() made inside it
+        to a single save when it ends; if an exception is raised inside
+        it, the objects created, changed or deleted are restored instead
+        (nested batches are part of the outermost one)
+        each thread has its own batch: the changes and saves made by
+        other threads meanwhile are not part of it
+        """
+        if getattr(self.__local, "batch", None) is not None:
+            yield self
+            return
+        with self.__writing():
+            batch = self.__local.batch = {
+                "save": False, "before": {}, "states": {},
+                "deleted": set(self.__deleted), "dirty": set(self.__dirty),
+                "saves": self.__saves
+            }
+        try:
+            yield self
+        except BaseException:
+            self.__local.batch = None
+            with self.__writing():
+                self.__rollback(batch)
+            raise
+        self.__local.batch = None
+        if batch["save"]:
+            self.save()
+
+    def __record(self, key, name=None, old_value=None):
+        """
+        __record() method:
+        remembers the object stored at key and a copy of its attributes
+        before the batch changes it (touch() is called once the
+        attribute name was changed from old_value: the copy gets
+        old_value back, or loses name when it was not set on the
+        instance, old_value being then _UNSET)
+        """
+        batch = getattr(self.__local, "batch", None)
+        if batch is None or key in batch["before"]:
+            return
+        obj = dict.get(self.__objects, key)
+        batch["before"][key] = obj
+        if obj is None or obj is UNLOADED:
+            return
+        state = obj.__dict__.copy()
+        if name is not None:
+            if old_value is _UNSET:
+                state.pop(name, None)
+            else:
+                state[name] = old_value
+        batch["states"][key] = state
+
+    def __rollback(self, batch):
+        """
+        __rollback() method:
+        restores the objects changed during a batch as they were before it
+        (from the copy of their attributes made by __record())
+        when other threads saved during the batch, the files may hold
+        its changes: the objects restored are then written again
+        """
+        saved = batch["saves"] != self.__saves
+        for key, obj in batch["before"].items():
+            if dict.get(self.__objects, key) is not None:
+                self.__objects.pop(key)
+                self.__unindex(key)
+            self.__dirty.discard(key)
+            if obj is None:
+                if saved or key in batch["deleted"]:
+                    self.__deleted.add(key)
+                continue
+            if obj is UNLOADED:
+                class_name, obj_id = key.split(".", 1)
+                dict.__setitem__(self.__objects, key, UNLOADED)
+                self.__by_class.setdefault(class_name, {})[obj_id] = UNLOADED
+                continue
+            if saved or key in batch["dirty"]:
+                self.__dirty.add(key)
+            obj.__dict__.clear()
+            obj.__dict__.update(batch["states"][key])
+            self.__objects[key] = obj
+            self.__index(key, obj)
+            self.__deleted.discard(key)
+
+    def compact(self):
+        """
+        compact() method:
+        writes a full snapshot of __objects to the JSON file
+        (or to the binary snapshot) and folds the journal file into it
+        in sharded mode, rewrites every shard file
+        """
+        with self.__saving(), self.__locked(True), self.__keeping_changes():
+            if self.sharded:
+                self.__save_shards(everything=True)
+                return
+            self.__compact()
+            self.__sync_stamp()
+
+    def __compact(self):
+        """
+        __compact() method:
+        compact() without taking the lock on the lock file
+        in thread_safe mode, the objects are only locked while the
+        changed ones are encoded: a JSON snapshot is then written from
+        a copy of the serialized objects while other threads go on
+        """
+        with self.__writing():
+            data = self.__serialize()
+            if self.__threaded() and self.snapshot_format == "json" and not (
+                self.lazy or isinstance(self.__objects, LazyDict)
+            ):
+                data = dict(data)
+            else:
+                self.__write_snapshot(data)
+                return
+        self.__write_snapshot(data)
+
+    def __write_snapshot(self, data):
+        """
+        __write_snapshot() method:
+        writes the snapshot of the serialized objects in data and the
+        files kept next to it, then removes the journal file
+        """
+        offsets = {}
+        lazy = isinstance(self.__objects, LazyDict)
+        if self.snapshot_format == "binary":
+            def write(file):
+                offsets.update(binary_snapshot.dump(file, data, self.__mmap))
+            self.__atomic_write(self.snapshot_path(), write, "wb")
+            self.__map()
+        else:
+            if lazy and self.__codec() is not None:
+                # offsets into a compressed file can't be read later
+                self.__objects.load()
+
+            def write(file):
+                offsets.update(self.__dump(data, file))
+            self.__atomic_write(
+                self.snapshot_path(), write, codec=self.__codec()
+            )
+            if self.snapshot_path() != self.__file_path and (
+                exists(self.__file_path)
+            ):
+                # the uncompressed snapshot written before compression
+                # was turned on
+                os.remove(self.__file_path)
+        if lazy:
+            unloaded = False
+            for key, raw in data.items():
+                if isinstance(raw, tuple):
+                    data[key] = offsets[key]
+                    unloaded = True
+            if unloaded and self.snapshot_format == "json":
+                self.__open_source(open(self.__file_path, "rb"))
+        if self.lazy and self.snapshot_format != "binary" and (
+            self.__codec() is None
+        ):
+            self.__write_index(offsets)
+        with self.__reading():
+            if self.__text is not None:
+                self.__write_text_index()
+        if exists(self.journal_path()):
+            os.remove(self.journal_path())
+        self.__drop_text()
+
+    def shards_path(self):
+        """
+        shards_path() method:
+        returns the path of the directory of the shard files
+        kept next to __file_path in sharded mode
+        """
+        return f"{os.path.splitext(self.__file_path)[0]}.shards"
+
+    def __check_sharded(self):
+        """
+        __check_sharded() method:
+        raises a ValueError if sharded mode is combined with a mode
+        that needs the single snapshot file
+        """
+        if self.journal or self.shared or self.snapshot_format != "json":
+            raise ValueError(
+                "sharded mode can't be combined with journal, "
+                "shared or binary snapshots"
+            )
+
+    def __need(self, cls=None):
+        """
+        __need() method:
+        in sharded lazy mode, reads the shard files of cls (a class or
+        a class name), or of every class if None, if not done yet
+        """
+        if self.__shards_loaded is None:
+            return
+        if cls is None:
+            self.__reload_shards(
+                self.__shard_classes() - self.__shards_loaded
+            )
+            FileStorage.__shards_loaded = None
+            return
+        class_name = cls if isinstance(cls, str) else cls.__name__
+        if class_name not in self.__shards_loaded:
+            self.__reload_shards({class_name})
+
+    def __shard_classes(self):
+        """
+        __shard_classes() method:
+        returns the set of the class names having shard files
+        """
+        return {
+            shards.class_of(name)
+            for name in shards.shard_names(self.shards_path())
+        }
+
+    def __save_shards(self, everything=False):
+        """
+        __save_shards() method:
+        writes the shard files of the objects changed since the last
+        save (every shard file if everything is True), after reading
+        the shard files of their classes if not done yet
+        (the classes whose shard files were written for another
+        number of buckets are rewritten whole)
+        """
+        self.__check_sharded()
+        buckets = self.shard_buckets
+        directory = self.shards_path()
+        with self.__writing():
+            if everything:
+                self.__need()
+                classes = set(self.__by_class) | self.__shard_classes()
+                names = set()
+            else:
+                names = {
+                    shards.shard_name(key, buckets)
+                    for key in self.__dirty | self.__deleted
+                }
+                changed = {shards.class_of(name) for name in names}
+                for class_name in changed:
+                    self.__need(class_name)
+                classes = {
+                    shards.class_of(name)
+                    for name in shards.shard_names(directory)
+                    if shards.class_of(name) in changed
+                    and not shards.is_shard_name(name, buckets)
+                }
+            data = self.__serialize()
+            groups = {}
+            for class_name in classes | {
+                shards.class_of(name) for name in names
+            }:
+                for obj_id in self.__by_class.get(class_name, {}):
+                    key = f"{class_name}.{obj_id}"
+                    name = shards.shard_name(key, buckets)
+                    if class_name in classes or name in names:
+                        groups.setdefault(name, {})[key] = data[key]
+            os.makedirs(directory, exist_ok=True)
+            for name, group in groups.items():
+                self.__atomic_write(
+                    os.path.join(directory, name),
+                    lambda file, group=group: self.__dump(group, file)
+                )
+            for name in shards.shard_names(directory):
+                if name not in groups and (
+                    name in names or shards.class_of(name) in classes
+                ):
+                    os.remove(os.path.join(directory, name))
+            self.__drop_text()
+
+    def __reload_shards(self, classes=None):
+        """
+        __reload_shards() method:
+        reads the shard files of classes (every class if None),
+        shard_workers files at a time, without replacing the objects
+        already in __objects or deleted since the last save
+        (in lazy mode, reload() reads none of them and the shard
+        files of a class are read on its first use instead)
+        """
+        self.__check_sharded()
+        directory = self.shards_path()
+        names = [
+            name for name in shards.shard_names(directory)
+            if classes is None or shards.class_of(name) in classes
+        ]
+        with self.__writing():
+            if classes is None:
+                FileStorage.__shards_loaded = None
+            elif self.__shards_loaded is not None:
+                self.__shards_loaded.update(classes)
+            if not names:
+                return
+            with ThreadPoolExecutor(
+                min(self.shard_workers, len(names))
+            ) as executor:
+                records = executor.map(shards.read, [
+                    os.path.join(directory, name) for name in names
+                ])
+                for items in records:
+                    for key, obj_dict, raw in items:
+                        if key not in self.__objects and (
+                            key not in self.__deleted
+                        ):
+                            self.__load_record(key, obj_dict, raw)
+
+    def __index(self, key, obj):
+        """
+        __index() method:
+        adds obj to the per-class and attribute indexes under key
+        """
+        class_name, obj_id = key.split(".", 1)
+        if obj_id in self.__by_class.get(class_name, {}):
+            # the full-text index replaces the words of key in add()
+            self.__unindex(key, text=False)
+        if self.compact_objects:
+            obj_id = sys.intern(obj_id)
+        self.__by_class.setdefault(class_name, {})[obj_id] = obj
+        for attr in self.indexed_attrs.get(class_name, ()):
+            self.__index_attr(class_name, attr, getattr(obj, attr, None), obj)
+        if class_name in self.__columns:
+            self.__columns[class_name].add(obj)
+        if class_name == "Place" and self.__geo is not None:
+            self.__geo.add(obj)
+        if self.__text is not None:
+            self.__text.add(key, obj)
+        if class_name == "Place" and self.__amenities is not None:
+            self.__amenities.set(obj.id, self.__amenity_ids(obj))
+
+    def __unindex(self, key, text=True):
+        """
+        __unindex() method:
+        removes key from the per-class and attribute indexes
+        (and from the full-text index if text is True)
+        """
+        class_name, obj_id = key.split(".", 1)
+        obj = self.__by_class.get(class_name, {}).pop(obj_id, None)
+        if class_name in self.__columns:
+            self.__columns[class_name].remove(obj_id)
+        if class_name == "Place" and self.__geo is not None:
+            self.__geo.remove(obj_id)
+        if text and self.__text is not None:
+            self.__text.remove(key)
+        if class_name == "Place" and self.__amenities is not None:
+            self.__amenities.set(obj_id, ())
+        if obj is None or obj is UNLOADED:
+            return
+        for attr in self.indexed_attrs.get(class_name, ()):
+            self.__unindex_attr(
+                class_name, attr, getattr(obj, attr, None), obj_id
+            )
+
+    def __index_attr(self, class_name, attr, value, obj):
+        """
+        __index_attr() method:
+        adds obj to the bucket of value in the index of attr
+        (unhashable values are not indexed)
+        """
+        indexes = self.__by_attr.setdefault(class_name, {})
+        try:
+            indexes.setdefault(attr, {}).setdefault(value, {})[obj.id] = obj
+        except TypeError:
+            pass
+
+    def __unindex_attr(self, class_name, attr, value, obj_id):
+        """
+        __unindex_attr() method:
+        removes obj_id from the bucket of value in the index of attr
+        """
+        index = self.__by_attr.get(class_name, {}).get(attr, {})
+        try:
+            bucket = index.get(value)
+        except TypeError:
+            return
+        if bucket is not None:
+            bucket.pop(obj_id, None)
+            if not bucket:
+                del index[value]
+
+    def __serialize(self):
+        """
+        __serialize() method:
+        returns the JSON text of each object of __objects keyed like it,
+        only encoding the objects changed since the last save
+        """
+        self.__check_format()
+        cache = self.__cache
+        for key in self.__deleted:
+            cache.pop(key, None)
+        changed = {}
+        for key in self.__dirty:
+            obj = self.__objects.get(key)
+            if obj is None:
+                cache.pop(key, None)
+            else:
+                changed[key] = obj
+        self.__encode_into(cache, changed)
+        self.__dirty.clear()
+        self.__deleted.clear()
+        if len(cache) != len(self.__objects):
+            for key in [key for key in cache if key not in self.__objects]:
+                del cache[key]
+            self.__encode_into(cache, {
+                key: self.__objects[key]
+                for key in self.__objects if key not in cache
+            })
+        return cache
+
+    def __encode_into(self, cache, objects):
+        """
+        __encode_into() method:
+        stores in cache the serialized form of each object of objects
+        (a dictionary of key: object), encoded across parallel_workers
+        forked processes when there are at least parallel_threshold of
+        them and processes can be forked
+        """
+        workers = self.parallel_workers
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(objects) >= self.parallel_threshold and (
+            parallel.available()
+        ):
+            texts = parallel.encode(
+                list(objects.values()), self.snapshot_format, workers
+            )
+            cache.update(zip(objects, texts))
+            return
+        for key, obj in objects.items():
+            cache[key] = self.__encode(obj)
+
+    def __check_format(self):
+        """
+        __check_format() method:
+        rebuilds the serialized forms kept for the next save when
+        snapshot_format was changed since they were made
+        """
+        if self.__cache_format == self.snapshot_format:
+            return
+        if isinstance(self.__objects, LazyDict):
+            self.__objects.load()
+        self.__cache.clear()
+        FileStorage.__cache_format = self.snapshot_format
+
+    def __encode(self, obj):
+        """
+        __encode() method:
+        returns the serialized form of obj in the snapshot format
+        (its JSON text, or its binary snapshot payload)
+        """
+        if self.snapshot_format == "binary":
+            return binary_snapshot.encode(obj)
+        return json_backend.dumps(serializers.encode(obj))
+
+    def __dump(self, data, file):
+        """
+        __dump() method:
+        writes the JSON object made of the JSON texts in data to file,
+        the same way json.dump() would, and returns the byte
+        (offset, length) of each JSON text in the written file
+        (JSON texts of objects not loaded yet are given as the
+        (offset, length) tuple of the text in the snapshot opened
+        by reload(), see __open_source())
+        """
+        offsets = {}
+        position = 1
+        separator = ""
+        file.write("{")
+        for key, raw in data.items():
+            if isinstance(raw, tuple):
+                source = self.__source
+                source.seek(raw[0])
+                raw = source.read(raw[1]).decode("utf-8")
+            prefix = f"{separator}{json.dumps(key)}: "
+            file.write(prefix)
+            file.write(raw)
+            position += len(prefix)
+            if raw.isascii():
+                length = len(raw)
+            else:
+                length = len(raw.encode("utf-8"))
+            offsets[key] = (position, length)
+            position += length
+            separator = ", "
+        file.write("}")
+        return offsets
+
+    def __atomic_write(self, path, write, mode="w", codec=None):
+        """
+        __atomic_write() method:
+        calls write(file) on a temporary file next to path,
+        fsyncs it and renames it over path, so a crash leaves
+        either the previous or the new file, never a truncated one
+        (the directory is fsynced too when fsync_dir is set)
+        with codec, the text written is compressed as it is written
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        name = os.path.basename(path)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", dir=directory)
+        try:
+            if codec is not None:
+                self.__compressed_write(fd, write, codec)
+            else:
+                encoding = None if "b" in mode else "utf-8"
+                with os.fdopen(fd, mode, encoding=encoding) as file:
+                    write(file)
+                    file.flush()
+                    os.fsync(file.fileno())
+            if exists(path):
+                file_mode = stat.S_IMODE(os.stat(path).st_mode)
+            else:
+                file_mode = 0o644
+            os.chmod(tmp_path, file_mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if self.fsync_dir:
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def __compressed_write(self, fd, write, codec):
+        """
+        __compressed_write() method:
+        calls write(file) on a text file compressing to fd with codec,
+        then fsyncs fd (through a copy of it, as some codecs close
+        the file they write to)
+        """
+        sync_fd = os.dup(fd)
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with compressed.wrap(
+                    raw, "wt", codec, self.compression_level
+                ) as file:
+                    write(file)
+            os.fsync(sync_fd)
+        finally:
+            os.close(sync_fd)
+
+    def __codec(self):
+        """
+        __codec() method:
+        returns the name of the codec compressing the JSON snapshot:
+        the one of compression if set ("auto" for the fastest one
+        available), else the one of the extension of __file_path,
+        or None
+        """
+        if self.snapshot_format != "json":
+            return None
+        if self.compression is not None:
+            return compressed.resolve(self.compression)
+        return compressed.codec_of(self.__file_path)
+
+    def __snapshot_source(self):
+        """
+        __snapshot_source() method:
+        returns the (path, codec) of the JSON snapshot to read, or None:
+        the most recently written of snapshot_path(), __file_path and
+        __file_path with the extension of a codec, so that the snapshot
+        is still found when compression was turned on or off since it
+        was written, and a stale one is never read over a newer one
+        """
+        path = self.snapshot_path()
+        candidates = [path, self.__file_path] + [
+            f"{self.__file_path}{extension}"
+            for extension in compressed.EXTENSIONS.values()
+        ]
+        newest = None
+        for candidate in candidates:
+            try:
+                mtime = os.stat(candidate).st_mtime_ns
+            except OSError:
+                continue
+            if newest is None or mtime > newest[0]:
+                newest = mtime, candidate
+        if newest is None:
+            return None
+        if newest[1] == path:
+            return path, self.__codec()
+        return newest[1], compressed.codec_of(newest[1])
+
+    def journal_path(self):
+        """
+        journal_path() method:
+        returns the path of the journal file kept next to __file_path
+        """
+        return f"{self.__file_path}.log"
+
+    def snapshot_path(self):
+        """
+        snapshot_path() method:
+        returns the path of the snapshot: __file_path, or the same path
+        with a .hbnb extension when snapshot_format is "binary", or
+        with the extension of the codec of compression (e.g. .gz)
+        """
+        if self.snapshot_format == "binary":
+            return f"{os.path.splitext(self.__file_path)[0]}.hbnb"
+        codec = self.__codec()
+        if codec is not None and (
+            compressed.codec_of(self.__file_path) != codec
+        ):
+            return f"{self.__file_path}{compressed.EXTENSIONS[codec]}"
+        return self.__file_path
+
+    def __map(self):
+        """
+        __map() method:
+        memory-maps the binary snapshot (after closing the previous map)
+        and returns the (offset, length) of its records keyed by key
+        """
+        if self.__mmap is not None:
+            self.__mmap.close()
+            FileStorage.__mmap = None
+        with open(self.snapshot_path(), "rb") as file:
+            FileStorage.__mmap = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        return binary_snapshot.load_table(self.__mmap)
+
+    def index_path(self):
+        """
+        index_path() method:
+        returns the path of the lazy mode index file kept next to
+        __file_path, that maps each key to the position of its object
+        """
+        return f"{self.__file_path}.idx"
+
+    def __write_index(self, offsets):
+        """
+        __write_index() method:
+        writes the byte (offset, length) of each object in __file_path
+        to the index file, stamped with the size and mtime of __file_path
+        """
+        file_stat = os.stat(self.__file_path)
+        index = {
+            "stamp": [file_stat.st_size, file_stat.st_mtime_ns],
+            "objects": offsets
+        }
+        with open(self.index_path(), "w") as file:
+            json.dump(index, file, separators=(",", ":"))
+
+    def text_index_path(self):
+        """
+        text_index_path() method:
+        returns the path of the full-text index file kept next to
+        __file_path, that maps each key to the words of its object
+        """
+        return f"{self.__file_path}.fts"
+
+    def __snapshot_stat(self):
+        """
+        __snapshot_stat() method:
+        returns the [size, mtime] of the snapshot, or None if there is none
+        """
+        try:
+            file_stat = os.stat(self.snapshot_path())
+        except OSError:
+            return None
+        return [file_stat.st_size, file_stat.st_mtime_ns]
+
+    def __text_header(self):
+        """
+        __text_header() method:
+        returns the first line of the text index file: the [size, mtime]
+        of the snapshot it matches, padded to a fixed length so that
+        it can be rewritten in place
+        """
+        header = json.dumps({"stamp": self.__snapshot_stat()})
+        return f"{header:<63}\n"
+
+    def __write_text_index(self):
+        """
+        __write_text_index() method:
+        writes the word counts of each object to the text index file,
+        after a header stamped with the size and mtime of the snapshot
+        when the index didn't change since it was read or written,
+        only the header is rewritten
+        """
+        path = self.text_index_path()
+        # (in shared mode, another process may have written the file)
+        if not self.__text.changed and not self.shared and exists(path):
+            with open(path, "r+") as file:
+                file.write(self.__text_header())
+            return
+        with open(path, "w") as file:
+            file.write(self.__text_header())
+            json.dump(self.__text.docs, file, separators=(",", ":"))
+        self.__text.changed = False
+
+    def __reload_text_index(self):
+        """
+        __reload_text_index() method:
+        returns the full-text index read from the text index file, or
+        None unless it matches the snapshot read by reload() and the
+        objects didn't change since (no journal, nothing to save)
+        """
+        stamp = self.__text_stamp
+        if stamp is None or self.__snapshot_stat() != stamp or (
+            self.__dirty or self.__deleted or exists(self.journal_path())
+        ):
+            return None
+        try:
+            with open(self.text_index_path(), "r") as file:
+                if json.loads(file.readline()).get("stamp") != stamp:
+                    return None
+                docs = json.load(file)
+        except (OSError, ValueError, AttributeError):
+            return None
+        return TextIndex(self.text_attrs, docs)
 
     def reload(self):
         """
@@ -65,12 +1322,400 @@ class FileStorage:
         (only if the JSON file (__file_path) exists
         otherwise, do nothing. If the file doesn't exist,
         no exception should be raised)
+        then replays the journal file over it if there is one
+        the file is streamed, one object at a time
+        in lazy mode, only the keys are read from the index file
+        and each object is built the first time it is accessed
+        (a binary snapshot is memory-mapped and always read that way)
+        the full-text index is read from its file by the first search()
+        in shared mode, the files are read under a shared lock
+        """
+        with self.__locked(False), self.__writing():
+            self.__reload()
+            self.__sync_stamp()
+
+    def __reload(self):
+        """
+        __reload() method:
+        reload() without taking the lock
+        """
+        self.__check_format()
+        FileStorage.__text = None
+        FileStorage.__text_stamp = self.__snapshot_stat()
+        if self.sharded:
+            if self.lazy:
+                self.__check_sharded()
+                FileStorage.__shards_loaded = set()
+            else:
+                self.__reload_shards()
+            return
+        if self.snapshot_format == "binary":
+            if exists(self.snapshot_path()):
+                self.__register_unloaded(self.__map())
+        elif self.lazy and self.__codec() is None and self.__reload_index():
+            pass
+        elif self.__snapshot_source() is not None:
+            for key, obj_dict, raw in self.__read_snapshot():
+                self.__load_record(key, obj_dict, raw)
+        if exists(self.journal_path()):
+            self.__replay_journal()
+
+    def lock_path(self):
+        """
+        lock_path() method:
+        returns the path of the lock file kept next to __file_path
+        (the snapshot itself is replaced on every write, so it can't be
+        the one locked)
+        """
+        return f"{self.__file_path}.lock"
+
+    @contextmanager
+    def __locked(self, exclusive):
+        """
+        __locked() method:
+        a context manager holding an advisory lock (fcntl.flock) on the
+        lock file, exclusive or shared, in shared mode only
+        (the lock is only taken by the outermost call of each thread)
+        """
+        depth = getattr(self.__local, "depth", 0)
+        if not self.shared or fcntl is None or depth:
+            self.__local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self.__local.depth = depth
+            return
+        with open(self.lock_path(), "a") as file:
+            fcntl.flock(
+                file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            )
+            self.__local.depth = 1
+            try:
+                yield
+            finally:
+                self.__local.depth = 0
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+    def __file_stamp(self):
+        """
+        __file_stamp() method:
+        returns the (inode, size, mtime) of the snapshot, which change
+        whenever a process writes a new one, or None if there is none
+        """
+        try:
+            file_stat = os.stat(self.snapshot_path())
+        except OSError:
+            return None
+        return file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns
+
+    def __sync_stamp(self):
+        """
+        __sync_stamp() method:
+        remembers the stamp of the snapshot and the size of the journal
+        as they are once this process is up to date with them
+        """
+        FileStorage.__stamp = self.__file_stamp()
+        log_path = self.journal_path()
+        FileStorage.__journal_offset = getsize(log_path) if exists(
+            log_path
+        ) else 0
+
+    def refresh(self):
+        """
+        refresh() method:
+        in shared mode, merges the changes written by other processes
+        since this one last read or wrote the files, if there are any:
+        the snapshot is re-read only when its stamp changed, and only
+        the new records of the journal are read
+        """
+        if not self.shared:
+            return
+        with self.__locked(False), self.__writing():
+            self.__refresh()
+            self.__sync_stamp()
+
+    def __refresh(self):
+        """
+        __refresh() method:
+        refresh() without taking the lock
+        """
+        if self.__file_stamp() != self.__stamp:
+            if isinstance(self.__objects, LazyDict):
+                self.__objects.load()
+            seen = set()
+            for key, obj_dict, raw in self.__read_snapshot():
+                seen.add(key)
+                self.__merge(key, obj_dict, raw)
+            for key in list(self.__objects):
+                if key not in seen and key not in self.__dirty:
+                    # deleted by another process (or in the journal,
+                    # read again below)
+                    self.__objects.pop(key)
+                    self.__unindex(key)
+                    self.__cache.pop(key, None)
+            if self.snapshot_format == "binary" and seen:
+                self.__map()
+            FileStorage.__journal_offset = 0
+        log_path = self.journal_path()
+        if exists(log_path):
+            if getsize(log_path) < self.__journal_offset:
+                FileStorage.__journal_offset = 0
+            self.__replay_journal(self.__journal_offset, merge=True)
+
+    def __read_snapshot(self):
+        """
+        __read_snapshot() method:
+        yields the key, dictionary and serialized form of every object
+        of the snapshot, whatever its format
+        """
+        if self.snapshot_format == "json":
+            source = self.__snapshot_source()
+            if source is not None:
+                with compressed.open_text(*source) as file:
+                    yield from iter_items(file)
+            return
+        if not exists(self.snapshot_path()):
+            return
+        with open(self.snapshot_path(), "rb") as file:
+            buffer = file.read()
+        for key, (offset, length) in binary_snapshot.load_table(
+            buffer
+        ).items():
+            raw = buffer[offset:offset + length]
+            yield key, binary_snapshot.decode(raw), raw
+
+    def __merge(self, key, obj_dict, raw=None):
+        """
+        __merge() method:
+        merges the object written at key by another process:
+        it replaces the object in memory unless that one was deleted,
+        or changed and saved (updated_at) after it, in this process
+        """
+        if key in self.__deleted:
+            return
+        if obj_dict.get("__class__") not in FileStorage.classes_dict:
+            return
+        current = dict.get(self.__objects, key)
+        if current is not None and current is not UNLOADED:
+            if raw is not None and self.__cache.get(key) == raw:
+                return
+            updated_at = obj_dict.get("updated_at")
+            if isinstance(updated_at, int):
+                updated_at = binary_snapshot.from_micros(updated_at)
+            elif isinstance(updated_at, str):
+                updated_at = datetime.fromisoformat(updated_at)
+            if key in self.__dirty and (
+                updated_at is None or current.updated_at >= updated_at
+            ):
+                return
+        self.__load_record(key, obj_dict, raw)
+        self.__dirty.discard(key)
+
+    def __reload_index(self):
+        """
+        __reload_index() method:
+        registers every key of the index file as an object to load later
+        from __file_path, which is kept open for that
+        returns False when there is no index file matching __file_path
+        """
+        try:
+            with open(self.index_path(), "r") as file:
+                index = json.load(file)
+            source = open(self.__file_path, "rb")
+        except (OSError, ValueError):
+            return False
+        file_stat = os.fstat(source.fileno())
+        if index.get("stamp") != [file_stat.st_size, file_stat.st_mtime_ns]:
+            source.close()
+            return False
+        self.__open_source(source)
+        self.__register_unloaded(index["objects"])
+        return True
+
+    def __open_source(self, source):
+        """
+        __open_source() method:
+        keeps source, the snapshot just read or written, open to build
+        the objects not loaded yet from it (closing the previous one):
+        a snapshot written by another process replaces the file, but
+        the objects are still read from the one their offsets are in
+        """
+        if self.__source is not None:
+            self.__source.close()
+        FileStorage.__source = source
+
+    def __register_unloaded(self, offsets):
+        """
+        __register_unloaded() method:
+        registers each key of offsets as an object to load later
+        from the (offset, length) of its serialized form in the snapshot
+        """
+        if not isinstance(self.__objects, LazyDict):
+            FileStorage.__objects = LazyDict(self.__hydrate, self.__objects)
+        for key, offset in offsets.items():
+            class_name, obj_id = key.split(".", 1)
+            if class_name not in FileStorage.classes_dict:
+                continue
+            self.__unindex(key)
+            dict.__setitem__(self.__objects, key, UNLOADED)
+            self.__by_class.setdefault(class_name, {})[obj_id] = UNLOADED
+            self.__cache[key] = tuple(offset)
+            self.__lazy_classes.add(class_name)
+
+    def __hydrate(self, keys):
+        """
+        __hydrate() method:
+        builds the objects stored at keys that are not loaded yet
+        from their serialized form in the snapshot (the memory map of
+        the binary snapshot, or the JSON snapshot kept open by reload())
+        and returns them
+        """
+        if not keys:
+            return []
+        objs = {}
+        source = None if self.__cache_format == "binary" else self.__source
+        for key in sorted(keys, key=lambda key: self.__cache[key]):
+            offset, length = self.__cache[key]
+            if source is None:
+                raw = self.__mmap[offset:offset + length]
+            else:
+                source.seek(offset)
+                raw = source.read(length).decode("utf-8")
+            obj = self.__build(json_backend.loads(raw))
+            dict.__setitem__(self.__objects, key, obj)
+            self.__index(key, obj)
+            if self.__keeps_text():
+                self.__cache[key] = raw
+            else:
+                del self.__cache[key]
+            objs[key] = obj
+        return [objs[key] for key in keys]
+
+    def __build(self, obj_dict):
+        """
+        __build() method:
+        returns the instance described by obj_dict, compacted if needed
+        (built by the codec of its class, see serializers.py)
+        """
+        cls = FileStorage.classes_dict[obj_dict["__class__"]]
+        if not self.compact_objects:
+            return serializers.decode(cls, obj_dict)
+        return share_timestamps(
+            serializers.decode(cls, intern_ids(obj_dict))
+        )
+
+    def __load_record(self, key, obj_dict, raw=None):
+        """
+        __load_record() method:
+        builds the instance described by obj_dict and stores it at key
+        raw is the JSON text of obj_dict, kept for the next save
+        """
+        if obj_dict["__class__"] in FileStorage.classes_dict:
+            obj = self.__build(obj_dict)
+            self.__objects[key] = obj
+            self.__index(key, obj)
+            if raw is None or not self.__keeps_text():
+                self.__cache.pop(key, None)
+            else:
+                self.__cache[key] = raw
+
+    def __keeps_text(self):
+        """
+        __keeps_text() method:
+        returns True if the serialized form of the objects is kept
+        for the next save (see text_cache; compact_objects drops it too)
+        """
+        return self.text_cache and not self.compact_objects
+
+    def __drop_text(self):
+        """
+        __drop_text() method:
+        when the serialized forms are not kept, drops the ones made
+        for the save just written (keeping the positions of the objects
+        not loaded yet)
+        """
+        if self.__keeps_text():
+            return
+        with self.__writing():
+            cache = self.__cache
+            for key in [
+                key for key, raw in cache.items()
+                if not isinstance(raw, tuple)
+            ]:
+                del cache[key]
+
+    def __append_journal(self):
+        """
+        __append_journal() method:
+        appends one upsert/delete record per changed key to the journal
+        """
+        if not self.__dirty and not self.__deleted:
+            return
+        with open(self.journal_path(), "a") as file:
+            if file.tell() and not self.__journal_ends_line():
+                # the last record was torn by a crash: end its line so
+                # that the records appended now are read on their own
+                file.write("\n")
+            for key in self.__deleted:
+                self.__cache.pop(key, None)
+                record = {"op": "delete", "key": key}
+                file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            for key in self.__dirty:
+                if key not in self.__objects:
+                    continue
+                raw = self.__encode(self.__objects[key])
+                if self.__keeps_text():
+                    self.__cache[key] = raw
+                else:
+                    self.__cache.pop(key, None)
+                if isinstance(raw, bytes):
+                    raw = raw.decode("utf-8")
+                file.write(
+                    f'{{"op":"upsert","key":{json.dumps(key)},"data":{raw}}}\n'
+                )
+            file.flush()
+            os.fsync(file.fileno())
+        self.__dirty.clear()
+        self.__deleted.clear()
+
+    def __journal_ends_line(self):
+        """
+        __journal_ends_line() method:
+        returns True if the journal ends with a newline
+        """
+        with open(self.journal_path(), "rb") as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b"\n"
+
+    def __replay_journal(self, offset=0, merge=False):
+        """
+        __replay_journal() method:
+        applies the journal records in order over __objects,
+        from the byte offset, merging them when merge is True,
+        and returns the offset of the end of the last record read
+        (a trailing record without its newline, torn by a crash or
+        being appended, is not read; a record torn by a crash, whose
+        line was ended by the next append, is skipped)
         """
-        if exists(self.__file_path):
-            with open(self.__file_path, "r") as file:
-                data = json.load(file)
-                for key, obj_dict in data.items():
-                    class_name = obj_dict["__class__"]
-                    if class_name in FileStorage.classes_dict:
-                        cls = FileStorage.classes_dict[class_name]
-                        self.__objects[key] = cls(**obj_dict)
+        with open(self.journal_path(), "rb") as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                try:
+                    record = json_backend.loads(line)
+                except ValueError:
+                    continue
+                key = record["key"]
+                if record["op"] == "delete":
+                    if merge and key in self.__dirty:
+                        continue
+                    self.__objects.pop(key, None)
+                    self.__unindex(key)
+                    self.__cache.pop(key, None)
+                elif merge:
+                    self.__merge(key, record["data"])
+                else:
+                    self.__load_record(key, record["data"])
+        return offset
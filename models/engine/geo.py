@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+"""
+Geospatial index Module:
+a grid of latitude/longitude cells to find the points in a bounding box
+or within a distance of a point without looking at every point
+"""
+
+
+import heapq
+from math import asin, cos, degrees, floor, radians, sin, sqrt
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = radians(EARTH_RADIUS_KM)
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    haversine() function:
+    returns the great-circle distance in km between two points
+    """
+    lat1, lon1, lat2, lon2 = map(radians, (lat1, lon1, lat2, lon2))
+    a = (
+        sin((lat2 - lat1) / 2) ** 2
+        + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+def location(obj):
+    """
+    location() function:
+    returns the (latitude, longitude) of obj
+    or None if they are not valid coordinates
+    """
+    lat = getattr(obj, "latitude", None)
+    lon = getattr(obj, "longitude", None)
+    for value in (lat, lon):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return float(lat), float(lon)
+
+
+def lon_ranges(min_lon, max_lon):
+    """
+    lon_ranges() function:
+    returns the list of (min, max) longitude ranges within [-180, 180]
+    covering min_lon to max_lon eastward (across the antimeridian
+    when min_lon is greater than max_lon or out of range)
+    """
+    if max_lon - min_lon >= 360:
+        return [(-180.0, 180.0)]
+    min_lon = (min_lon + 180) % 360 - 180
+    max_lon = (max_lon + 180) % 360 - 180
+    if min_lon <= max_lon:
+        return [(min_lon, max_lon)]
+    return [(min_lon, 180.0), (-180.0, max_lon)]
+
+
+class GridIndex:
+    """
+    GridIndex class:
+    the points of a set of objects, by id, bucketed in square cells
+    of cell_size degrees
+    """
+
+    def __init__(self, cell_size=0.25, objects=()):
+        """
+        __init__() method:
+        Initialize the index with the location of the given objects
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.points = {}
+        for obj in objects:
+            self.add(obj)
+
+    def __len__(self):
+        """
+        __len__() method:
+        returns the number of points
+        """
+        return len(self.points)
+
+    def cell(self, lat, lon):
+        """
+        cell() method:
+        returns the (row, column) of the cell of a point
+        """
+        return floor(lat / self.cell_size), floor(lon / self.cell_size)
+
+    def add(self, obj):
+        """
+        add() method:
+        adds the location of obj, or moves it if obj was already inside
+        (an obj without valid coordinates is removed)
+        """
+        point = location(obj)
+        old = self.points.get(obj.id)
+        if old is not None and point == old[:2]:
+            return
+        self.remove(obj.id)
+        if point is None:
+            return
+        cell = self.cell(*point)
+        self.cells.setdefault(cell, {})[obj.id] = point
+        self.points[obj.id] = point + (cell,)
+
+    def remove(self, obj_id):
+        """
+        remove() method:
+        removes the location of obj_id
+        """
+        old = self.points.pop(obj_id, None)
+        if old is None:
+            return
+        bucket = self.cells[old[2]]
+        del bucket[obj_id]
+        if not bucket:
+            del self.cells[old[2]]
+
+    def __buckets(self, min_lat, max_lat, ranges):
+        """
+        __buckets() method:
+        yields the cells that can hold points of the bounding box
+        (visiting the occupied cells instead when there are fewer)
+        """
+        min_row, max_row = floor(min_lat / self.cell_size), floor(
+            max_lat / self.cell_size
+        )
+        columns = [
+            (floor(low / self.cell_size), floor(high / self.cell_size))
+            for low, high in ranges
+        ]
+        visits = (max_row - min_row + 1) * sum(
+            high - low + 1 for low, high in columns
+        )
+        if visits > len(self.cells):
+            for (row, column), bucket in self.cells.items():
+                if min_row <= row <= max_row and any(
+                    low <= column <= high for low, high in columns
+                ):
+                    yield bucket
+            return
+        for row in range(min_row, max_row + 1):
+            for low, high in columns:
+                for column in range(low, high + 1):
+                    bucket = self.cells.get((row, column))
+                    if bucket:
+                        yield bucket
+
+    def within(self, min_lat, min_lon, max_lat, max_lon):
+        """
+        within() method:
+        returns the ids of the points in the bounding box
+        (min_lon greater than max_lon crosses the antimeridian)
+        """
+        ranges = lon_ranges(min_lon, max_lon)
+        return [
+            obj_id
+            for bucket in self.__buckets(min_lat, max_lat, ranges)
+            for obj_id, (lat, lon) in bucket.items()
+            if min_lat <= lat <= max_lat and any(
+                low <= lon <= high for low, high in ranges
+            )
+        ]
+
+    def nearby(self, lat, lon, radius_km, limit=None):
+        """
+        nearby() method:
+        returns the (distance in km, id) of the points within radius_km
+        of (lat, lon), nearest first, at most limit of them
+        """
+        lat_span = radius_km / KM_PER_DEGREE
+        min_lat, max_lat = max(lat - lat_span, -90), min(lat + lat_span, 90)
+        angle = radius_km / EARTH_RADIUS_KM
+        if min_lat <= -90 or max_lat >= 90 or sin(angle) >= cos(
+            radians(lat)
+        ):
+            ranges = [(-180.0, 180.0)]
+        else:
+            lon_span = degrees(asin(sin(angle) / cos(radians(lat))))
+            ranges = lon_ranges(lon - lon_span, lon + lon_span)
+        found = []
+        for bucket in self.__buckets(min_lat, max_lat, ranges):
+            for obj_id, (point_lat, point_lon) in bucket.items():
+                if min_lat <= point_lat <= max_lat:
+                    distance = haversine(lat, lon, point_lat, point_lon)
+                    if distance <= radius_km:
+                        found.append((distance, obj_id))
+        if limit is not None:
+            return heapq.nsmallest(limit, found)
+        return sorted(found)
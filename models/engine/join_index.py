@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Join index Module:
+a many-to-many association between two sets of ids,
+indexed in both directions
+"""
+
+
+class JoinIndex:
+    """
+    JoinIndex class:
+    the links between left ids and right ids (e.g. Place ids and
+    Amenity ids), kept as left id -> set of right ids and
+    right id -> set of left ids
+    """
+
+    def __init__(self):
+        """
+        __init__() method:
+        Initialize an empty index
+        """
+        self.lefts = {}
+        self.rights = {}
+
+    def __len__(self):
+        """
+        __len__() method:
+        returns the number of links
+        """
+        return sum(len(rights) for rights in self.lefts.values())
+
+    def add(self, left_id, right_id):
+        """
+        add() method:
+        links left_id and right_id
+        """
+        self.lefts.setdefault(left_id, set()).add(right_id)
+        self.rights.setdefault(right_id, set()).add(left_id)
+
+    def remove(self, left_id, right_id):
+        """
+        remove() method:
+        unlinks left_id and right_id
+        """
+        for index, key, value in (
+            (self.lefts, left_id, right_id), (self.rights, right_id, left_id)
+        ):
+            values = index.get(key)
+            if values is not None:
+                values.discard(value)
+                if not values:
+                    del index[key]
+
+    def set(self, left_id, right_ids):
+        """
+        set() method:
+        makes right_ids the only right ids linked to left_id
+        """
+        old = self.lefts.get(left_id, set())
+        new = set(right_ids)
+        for right_id in old - new:
+            self.remove(left_id, right_id)
+        for right_id in new - old:
+            self.add(left_id, right_id)
+
+    def of_left(self, left_id):
+        """
+        of_left() method:
+        returns the set of right ids linked to left_id
+        """
+        return self.lefts.get(left_id, set())
+
+    def of_right(self, right_id):
+        """
+        of_right() method:
+        returns the set of left ids linked to right_id
+        """
+        return self.rights.get(right_id, set())
+
+    def with_all(self, right_ids):
+        """
+        with_all() method:
+        returns the set of left ids linked to every id of right_ids,
+        intersecting the sets from the smallest one
+        """
+        groups = sorted((self.of_right(right_id) for right_id in right_ids),
+                        key=len)
+        if not groups:
+            return set()
+        found = set(groups[0])
+        for group in groups[1:]:
+            if not found:
+                break
+            found &= group
+        return found
@@ -0,0 +1,161 @@
+#!/usr/bin/python3
+"""
+JSON backend Module:
+the JSON encoder/decoder the storage engines use for the objects:
+orjson, msgspec or ujson when one of them is installed (picked in
+that order), the json module otherwise, or the one named by the
+HBNB_JSON_BACKEND environment variable
+every backend writes JSON that the others read back the same
+(only the whitespace and the escaping of non-ASCII characters differ;
+NaN and infinite floats are written and read by the json module)
+"""
+
+
+import json
+import math
+from importlib import import_module
+from os import getenv
+
+
+BACKENDS = ("orjson", "msgspec", "ujson", "json")
+
+
+def finite(obj):
+    """
+    finite() function:
+    returns False if obj is, or holds, a NaN or infinite float
+    """
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(finite(value) for value in obj)
+    return True
+
+
+class Backend:
+    """
+    Backend class:
+    the name and the dumps()/loads() functions of a JSON library,
+    dumps() returning a str and falling back to the json module for
+    the values the library can't encode (e.g. integers over 64 bits,
+    or NaN and infinite floats, which orjson and msgspec write as null)
+    and loads() for the text it can't decode (e.g. NaN)
+    """
+
+    def __init__(self, name):
+        """
+        __init__() method:
+        Initialize the backend of the library name
+        (raises ImportError if it isn't installed)
+        """
+        if name not in BACKENDS:
+            raise ValueError(f"unknown JSON backend: {name}")
+        self.name = name
+        # the libraries writing null for NaN and infinite floats
+        self.nulls = name in ("orjson", "msgspec")
+        if name == "json":
+            self.encode = json.dumps
+            self.decode = json.loads
+            return
+        module = import_module(name)
+        if name == "orjson":
+            self.encode = lambda obj: module.dumps(obj).decode("utf-8")
+            self.decode = module.loads
+        elif name == "msgspec":
+            self.encode = lambda obj: module.json.encode(obj).decode("utf-8")
+
+            def decode(text):
+                """returns the value of text, as json.loads() would"""
+                try:
+                    return module.json.decode(text)
+                except module.DecodeError as error:
+                    raise ValueError(str(error)) from None
+
+            self.decode = decode
+        else:
+            self.encode = lambda obj: module.dumps(
+                obj, ensure_ascii=False, escape_forward_slashes=False
+            )
+            self.decode = module.loads
+
+    def dumps(self, obj):
+        """
+        dumps() method:
+        returns the JSON text of obj
+        """
+        try:
+            text = self.encode(obj)
+        except (TypeError, ValueError, OverflowError):
+            return json.dumps(obj)
+        if self.nulls and "null" in text and not finite(obj):
+            return json.dumps(obj)
+        return text
+
+    def loads(self, text):
+        """
+        loads() method:
+        returns the value of the JSON text (str or bytes)
+        (raises ValueError if it is invalid for the json module too)
+        """
+        try:
+            return self.decode(text)
+        except ValueError:
+            if self.decode is json.loads:
+                raise
+            return json.loads(text)
+
+
+def select(name="auto"):
+    """
+    select() function:
+    makes the backend of the library name ("auto" for the fastest one
+    installed) the one used by dumps() and loads(), and returns it
+    """
+    global current
+    if name != "auto":
+        current = Backend(name)
+        return current
+    for name in BACKENDS:
+        try:
+            current = Backend(name)
+        except ImportError:
+            continue
+        return current
+
+
+def available():
+    """
+    available() function:
+    returns the names of the installed backends
+    """
+    names = []
+    for name in BACKENDS:
+        try:
+            Backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def dumps(obj):
+    """
+    dumps() function:
+    returns the JSON text of obj with the current backend
+    """
+    return current.dumps(obj)
+
+
+def loads(text):
+    """
+    loads() function:
+    returns the value of the JSON text (str or bytes)
+    with the current backend
+    """
+    return current.loads(text)
+
+
+current = None
+select(getenv("HBNB_JSON_BACKEND", "auto"))
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+"""
+JSON streaming Module:
+reads the top level JSON object of a file one member at a time
+so a whole document never has to be held in memory
+"""
+
+
+import json
+import re
+
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+DECODER = json.JSONDecoder()
+
+
+class JSONStream:
+    """
+    JSONStream class:
+    a window over a text file that decodes one JSON value at a time
+    """
+
+    def __init__(self, file, chunk_size=65536):
+        """
+        __init__() method:
+        Initialize the stream over an open text file
+        """
+        self.file = file
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """
+        fill() method:
+        drops the consumed text and reads the next chunk of the file
+        returns False once the end of the file is reached
+        """
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """
+        peek() method:
+        skips whitespace and returns the next character
+        without consuming it ("" at the end of the file)
+        """
+        while True:
+            self.pos = WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        """
+        expect() method:
+        consumes the next character, which has to be one of chars
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self.text, self.pos
+            )
+        self.pos += 1
+        return char
+
+    def decode(self):
+        """
+        decode() method:
+        decodes the next JSON value and returns it
+        along with its source text
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if end < len(self.text) or not self.fill():
+                break
+        raw = self.text[self.pos:end]
+        self.pos = end
+        return value, raw
+
+
+def iter_items(file, chunk_size=65536):
+    """
+    iter_items() function:
+    yields (key, value, raw) for each member of the JSON object in file,
+    raw being the JSON text of value
+    """
+    stream = JSONStream(file, chunk_size)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key, _ = stream.decode()
+        stream.expect(":")
+        value, raw = stream.decode()
+        yield key, value, raw
+        if stream.expect(",}") == "}":
+            return
@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+"""
+Lazy objects Module:
+a dictionary whose values are only built the first time they are read
+"""
+
+
+class Unloaded:
+    """
+    Unloaded class:
+    the placeholder stored for a value that is not built yet
+    """
+
+    def __repr__(self):
+        """
+        __repr__() method:
+        string represention of the placeholder
+        """
+        return "<unloaded>"
+
+
+UNLOADED = Unloaded()
+
+
+class LazyDict(dict):
+    """
+    LazyDict class:
+    a dict whose UNLOADED values are built by loader(keys),
+    which returns the built values in the order of keys,
+    as soon as they are read
+    """
+
+    def __init__(self, loader, *args, **kwargs):
+        """
+        __init__() method:
+        Initialize the dict with the loader of its UNLOADED values
+        """
+        super().__init__(*args, **kwargs)
+        self.loader = loader
+
+    def __getitem__(self, key):
+        """
+        __getitem__() method:
+        returns the value of key, building it if needed
+        """
+        value = super().__getitem__(key)
+        if value is UNLOADED:
+            value = self.loader([key])[0]
+        return value
+
+    def __iter__(self):
+        """
+        __iter__() method:
+        iterates over the keys (defined so that dict(), {**lazy} and
+        dict.update() read the values through __getitem__() instead of
+        copying the placeholders)
+        """
+        return super().__iter__()
+
+    def copy(self):
+        """
+        copy() method:
+        returns a dict of the keys and values, building the UNLOADED ones
+        """
+        return dict(self.items())
+
+    def __or__(self, other):
+        """
+        __or__() method:
+        returns the copy() of the dict updated with other
+        """
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def get(self, key, default=None):
+        """
+        get() method:
+        returns the value of key, building it if needed, or default
+        """
+        return self[key] if key in self else default
+
+    def unloaded(self):
+        """
+        unloaded() method:
+        returns the list of the keys whose value is not built yet
+        """
+        return [
+            key for key, value in super().items() if value is UNLOADED
+        ]
+
+    def load(self):
+        """
+        load() method:
+        builds all the UNLOADED values at once
+        """
+        keys = self.unloaded()
+        if keys:
+            self.loader(keys)
+
+    def values(self):
+        """
+        values() method:
+        returns the values, building the UNLOADED ones
+        """
+        self.load()
+        return super().values()
+
+    def items(self):
+        """
+        items() method:
+        returns the (key, value) pairs, building the UNLOADED values
+        """
+        self.load()
+        return super().items()
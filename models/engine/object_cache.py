@@ -0,0 +1,211 @@
+#!/usr/bin/python3
+"""
+Object cache Module:
+a cache of the objects in use, bounded by a number of entries and/or
+an estimated number of bytes, evicting the least recently used (LRU)
+or the least frequently used (LFU) object first
+"""
+
+
+import sys
+from collections import OrderedDict
+
+
+def sizeof(obj):
+    """
+    sizeof() function:
+    returns an estimate of the bytes used by obj:
+    the instance, its __dict__ and the values inside it
+    """
+    size = sys.getsizeof(obj) + sys.getsizeof(obj.__dict__)
+    return size + sum(sys.getsizeof(value) for value in obj.__dict__.values())
+
+
+class ObjectCache:
+    """
+    ObjectCache class:
+    objects keyed by <class name>.id, at most max_entries of them and
+    at most max_bytes (as estimated by sizeof()) when they are set;
+    on_evict(key, obj) is called for each evicted object
+    """
+
+    POLICIES = ("lru", "lfu")
+
+    def __init__(self, max_entries=None, max_bytes=None, policy="lru",
+                 on_evict=None):
+        """
+        __init__() method:
+        Initialize an empty cache
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"unknown cache policy: {policy}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.on_evict = on_evict
+        self.objects = {}
+        self.sizes = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # lru: the keys from the least to the most recently used
+        self.recent = OrderedDict()
+        # lfu: the use count of each key, and the keys of each count
+        # from the least to the most recently used
+        self.counts = {}
+        self.buckets = {}
+        self.min_count = 0
+
+    def __len__(self):
+        """
+        __len__() method:
+        returns the number of cached objects
+        """
+        return len(self.objects)
+
+    def __contains__(self, key):
+        """
+        __contains__() method:
+        returns True if key is cached (not counted as a use)
+        """
+        return key in self.objects
+
+    def __use(self, key):
+        """
+        __use() method:
+        records a use of the cached key
+        """
+        if self.policy == "lru":
+            self.recent.move_to_end(key)
+            return
+        count = self.counts[key]
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+            if self.min_count == count:
+                self.min_count = count + 1
+        self.counts[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def get(self, key):
+        """
+        get() method:
+        returns the object cached at key (a hit), or None (a miss)
+        """
+        obj = self.objects.get(key)
+        if obj is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__use(key)
+        return obj
+
+    def put(self, key, obj):
+        """
+        put() method:
+        caches obj at key (or updates its size if it is cached),
+        evicting other objects until the cache is within its budget
+        (an object bigger than the budget is still cached, alone)
+        """
+        size = sizeof(obj) if self.max_bytes is not None else 0
+        if key in self.objects:
+            self.bytes += size - self.sizes[key]
+            self.sizes[key] = size
+            self.objects[key] = obj
+            self.__use(key)
+            self.__shrink(0, 0, key)
+            return
+        self.__shrink(1, size)
+        if self.policy == "lru":
+            self.recent[key] = None
+        else:
+            self.counts[key] = 1
+            self.buckets.setdefault(1, OrderedDict())[key] = None
+            self.min_count = 1
+        self.objects[key] = obj
+        self.sizes[key] = size
+        self.bytes += size
+
+    def __shrink(self, entries, size, keep=None):
+        """
+        __shrink() method:
+        evicts objects (never keep) until entries more objects
+        of size more bytes fit in the budget
+        """
+        while self.objects and self.__over(entries, size):
+            victim = self.__victim()
+            if victim == keep:
+                return
+            evicted = self.objects[victim]
+            self.discard(victim)
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(victim, evicted)
+
+    def __over(self, entries=0, size=0):
+        """
+        __over() method:
+        returns True if the cache would be over its budget
+        with entries more objects of size more bytes
+        """
+        if self.max_entries is not None and (
+            len(self.objects) + entries > self.max_entries
+        ):
+            return True
+        return self.max_bytes is not None and (
+            self.bytes + size > self.max_bytes
+        )
+
+    def __victim(self):
+        """
+        __victim() method:
+        returns the key to evict next
+        """
+        if self.policy == "lru":
+            return next(iter(self.recent))
+        while self.min_count not in self.buckets:
+            self.min_count += 1
+        return next(iter(self.buckets[self.min_count]))
+
+    def discard(self, key):
+        """
+        discard() method:
+        removes key from the cache if it is cached
+        """
+        if self.objects.pop(key, None) is None:
+            return
+        self.bytes -= self.sizes.pop(key)
+        if self.policy == "lru":
+            del self.recent[key]
+            return
+        count = self.counts.pop(key)
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+
+    def clear(self):
+        """
+        clear() method:
+        removes every object (the counters are kept)
+        """
+        self.objects.clear()
+        self.sizes.clear()
+        self.bytes = 0
+        self.recent.clear()
+        self.counts.clear()
+        self.buckets.clear()
+        self.min_count = 0
+
+    def stats(self):
+        """
+        stats() method:
+        returns the counters of the cache
+        """
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "evictions": self.evictions, "entries": len(self.objects),
+            "bytes": self.bytes
+        }
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+"""
+Parallel encoding Module:
+encodes the objects of a large save in chunks across forked processes
+the processes are forked for each save, so they inherit the objects
+to encode: only the (start, stop) range of each chunk is sent to them,
+and the serialized text of each object comes back, which the storage
+writes into one JSON object as usual (sending the objects themselves
+would cost the parent more pickling than encoding them)
+"""
+
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from models.engine import binary_snapshot, json_backend, serializers
+
+
+# the (objects, snapshot format) of the save, inherited by the workers
+_shared = None
+
+
+def available():
+    """
+    available() function:
+    returns True if the processes can be forked (not on Windows)
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def encode_range(start, stop):
+    """
+    encode_range() function:
+    returns the serialized form of the objects inherited from the
+    parent from start to stop, in the snapshot format
+    (run in a worker process)
+    """
+    objects, snapshot_format = _shared
+    if snapshot_format == "binary":
+        return [binary_snapshot.encode(obj) for obj in objects[start:stop]]
+    return [
+        json_backend.dumps(serializers.encode(obj))
+        for obj in objects[start:stop]
+    ]
+
+
+def encode(objects, snapshot_format="json", workers=2):
+    """
+    encode() function:
+    returns the serialized form of each object of the list objects,
+    in order, encoded in workers forked processes (4 chunks per process
+    so that a slow chunk doesn't leave the other processes idle)
+    """
+    global _shared
+    if not objects:
+        return []
+    size = -(-len(objects) // (workers * 4))
+    starts = range(0, len(objects), size)
+    _shared = objects, snapshot_format
+    try:
+        with ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            results = executor.map(
+                encode_range, starts, [start + size for start in starts]
+            )
+            return [text for chunk in results for text in chunk]
+    finally:
+        _shared = None
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Reader-writer lock Module:
+a lock that many threads can hold to read, or one thread to write
+"""
+
+
+import threading
+from contextlib import contextmanager
+
+
+class RWLock:
+    """
+    RWLock class:
+    a reader-writer lock, reentrant for the thread holding it
+    (the writer can also read), that makes new readers wait
+    while a writer is waiting so writers are not starved
+    """
+
+    def __init__(self):
+        """
+        __init__() method:
+        Initialize a lock held by nobody
+        """
+        self.__condition = threading.Condition(threading.Lock())
+        self.__readers = {}
+        self.__writer = None
+        self.__depth = 0
+        self.__waiting = 0
+
+    @contextmanager
+    def reading(self):
+        """
+        reading() method:
+        a context manager holding the lock to read
+        """
+        me = threading.get_ident()
+        with self.__condition:
+            if self.__writer != me and me not in self.__readers:
+                while self.__writer is not None or self.__waiting:
+                    self.__condition.wait()
+            self.__readers[me] = self.__readers.get(me, 0) + 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__readers[me] -= 1
+                if not self.__readers[me]:
+                    del self.__readers[me]
+                    self.__condition.notify_all()
+
+    @contextmanager
+    def writing(self):
+        """
+        writing() method:
+        a context manager holding the lock to write
+        (a thread holding it to read can't also hold it to write)
+        """
+        me = threading.get_ident()
+        with self.__condition:
+            if self.__writer == me:
+                self.__depth += 1
+            else:
+                if me in self.__readers:
+                    raise RuntimeError("can't write while reading")
+                self.__waiting += 1
+                while self.__writer is not None or self.__readers:
+                    self.__condition.wait()
+                self.__waiting -= 1
+                self.__writer = me
+                self.__depth = 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__depth -= 1
+                if not self.__depth:
+                    self.__writer = None
+                    self.__condition.notify_all()
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+"""
+Serializers Module:
+per-class codecs doing what to_dict() and cls(**obj_dict) do for the
+storage, without their generic loops: the codec of a class is made
+once, from the class (its name, whether it overrides to_dict(),
+__init__() or __setattr__()), and then reused for every object
+"""
+
+
+from datetime import datetime, timedelta
+from models.base_model import BaseModel, EPOCH
+
+
+_codecs = {}
+_parsed = {}
+PARSED_MAX = 4096
+
+
+def parse_timestamp(value):
+    """
+    parse_timestamp() function:
+    returns the datetime of an ISO string (or of integer microseconds
+    since EPOCH), reusing the datetime of the last strings parsed
+    (datetimes are immutable, so objects can share them)
+    """
+    if isinstance(value, int):
+        return EPOCH + timedelta(microseconds=value)
+    parsed = _parsed.get(value)
+    if parsed is None:
+        if len(_parsed) >= PARSED_MAX:
+            _parsed.clear()
+        parsed = _parsed[value] = datetime.fromisoformat(value)
+    return parsed
+
+
+def make_encoder(cls):
+    """
+    make_encoder() function:
+    returns the function giving the to_dict() of an object of cls
+    (to_dict() itself when cls overrides it)
+    """
+    if cls.to_dict is not BaseModel.to_dict:
+        return cls.to_dict
+    class_name = cls.__name__
+    isoformat = datetime.isoformat
+
+    def encode(obj):
+        """returns the to_dict() of obj"""
+        attrs = obj.__dict__
+        created_at = attrs["created_at"]
+        updated_at = attrs["updated_at"]
+        obj_dict = attrs.copy()
+        obj_dict["__class__"] = class_name
+        obj_dict["created_at"] = created = isoformat(created_at)
+        obj_dict["updated_at"] = created if (
+            updated_at is created_at
+        ) else isoformat(updated_at)
+        return obj_dict
+
+    return encode
+
+
+def make_decoder(cls):
+    """
+    make_decoder() function:
+    returns the function building the object of cls described by a
+    to_dict() (cls(**obj_dict) itself when cls overrides __init__()
+    or __setattr__(), which the decoder would bypass)
+    the attributes are set one by one with object.__setattr__(), in
+    order, so that the instances share the keys of their __dict__
+    (updating __dict__ at once gives each instance its own keys)
+    """
+    if cls.__init__ is not BaseModel.__init__ or (
+        cls.__setattr__ is not BaseModel.__setattr__
+    ):
+        return lambda obj_dict: cls(**obj_dict)
+    new = object.__new__
+    set_attr = object.__setattr__
+
+    def decode(obj_dict):
+        """returns the object described by obj_dict"""
+        obj = new(cls)
+        created_at = obj_dict.get("created_at")
+        updated_at = obj_dict.get("updated_at")
+        timestamps = {}
+        if created_at is not None:
+            timestamps["created_at"] = created = parse_timestamp(created_at)
+        if updated_at is not None:
+            timestamps["updated_at"] = created if (
+                updated_at == created_at
+            ) else parse_timestamp(updated_at)
+        for name, value in obj_dict.items():
+            if name in timestamps:
+                value = timestamps[name]
+            elif name == "__class__":
+                continue
+            set_attr(obj, name, value)
+        return obj
+
+    return decode
+
+
+class Codec:
+    """
+    Codec class:
+    the encode() and decode() functions of a class
+    """
+
+    def __init__(self, cls):
+        """
+        __init__() method:
+        Initialize the codec of cls
+        """
+        self.cls = cls
+        self.encode = make_encoder(cls)
+        self.decode = make_decoder(cls)
+
+
+def codec(cls):
+    """
+    codec() function:
+    returns the Codec of cls, made on first use
+    """
+    found = _codecs.get(cls)
+    if found is None:
+        found = _codecs[cls] = Codec(cls)
+    return found
+
+
+def encode(obj):
+    """
+    encode() function:
+    returns the to_dict() of obj through the codec of its class
+    """
+    return codec(obj.__class__).encode(obj)
+
+
+def decode(cls, obj_dict):
+    """
+    decode() function:
+    returns the object of cls described by obj_dict
+    through the codec of cls
+    """
+    return codec(cls).decode(obj_dict)
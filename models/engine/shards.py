@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+"""
+Shards Module:
+the sharded layout of the storage: a directory holding one JSON file
+per class (<class name>.json), or per class and id-hash bucket
+(<class name>.<bucket>.json), each in the format of file.json
+(./tools/shards.py converts a store between file.json and file.shards)
+"""
+
+
+import json
+import os
+from zlib import crc32
+from models.engine.json_stream import iter_items
+
+
+def bucket(obj_id, buckets):
+    """
+    bucket() function:
+    returns the bucket of obj_id among buckets, the same in every
+    process (unlike hash() of a str)
+    """
+    return crc32(obj_id.encode("utf-8")) % buckets
+
+
+def shard_name(key, buckets=1):
+    """
+    shard_name() function:
+    returns the name of the shard file of key (<class name>.id)
+    """
+    class_name, obj_id = key.split(".", 1)
+    if buckets <= 1:
+        return f"{class_name}.json"
+    return f"{class_name}.{bucket(obj_id, buckets)}.json"
+
+
+def is_shard_name(name, buckets=1):
+    """
+    is_shard_name() function:
+    returns True if name is the name of a shard file
+    for the given number of buckets
+    """
+    parts = name.split(".")
+    if buckets <= 1:
+        return len(parts) == 2
+    return len(parts) == 3 and parts[1].isdigit() and (
+        int(parts[1]) < buckets
+    )
+
+
+def shard_names(directory):
+    """
+    shard_names() function:
+    returns the names of the shard files in directory
+    """
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        name for name in os.listdir(directory)
+        if name.endswith(".json") and not name.startswith(".")
+    )
+
+
+def class_of(name):
+    """
+    class_of() function:
+    returns the class name of the shard file name
+    """
+    return name.split(".", 1)[0]
+
+
+def read(path):
+    """
+    read() function:
+    returns the list of (key, value, raw) of the shard file at path
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return list(iter_items(file))
+
+
+def split(source, directory, buckets=1):
+    """
+    split() function:
+    writes the objects of the JSON file source to shard files
+    in directory, streaming them one at a time
+    """
+    os.makedirs(directory, exist_ok=True)
+    files = {}
+    try:
+        with open(source, "r", encoding="utf-8") as file:
+            for key, _, raw in iter_items(file):
+                name = shard_name(key, buckets)
+                shard = files.get(name)
+                if shard is None:
+                    shard = files[name] = open(
+                        os.path.join(directory, name), "w", encoding="utf-8"
+                    )
+                    shard.write("{")
+                else:
+                    shard.write(", ")
+                shard.write(f"{json.dumps(key)}: {raw}")
+    finally:
+        for shard in files.values():
+            shard.write("}")
+            shard.close()
+
+
+def merge(directory, destination):
+    """
+    merge() function:
+    writes the objects of the shard files in directory
+    to the JSON file destination
+    """
+    with open(destination, "w", encoding="utf-8") as file:
+        file.write("{")
+        separator = ""
+        for name in shard_names(directory):
+            for key, _, raw in read(os.path.join(directory, name)):
+                file.write(f"{separator}{json.dumps(key)}: {raw}")
+                separator = ", "
+        file.write("}")
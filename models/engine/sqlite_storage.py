@@ -0,0 +1,399 @@
+#!/usr/bin/python3
+"""
+SQLiteStorage class Module:
+a storage engine that keeps each class in its own SQLite table
+"""
+
+
+import sqlite3
+from contextlib import contextmanager
+from models.engine.base_storage import BaseStorage
+from models.engine import json_backend, serializers
+from models.engine.compact import intern_ids, share_timestamps
+from models.engine.object_cache import ObjectCache
+from os import getenv
+from weakref import WeakValueDictionary
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    SQLiteStorage class:
+    a storage engine that keeps each class of classes_dict
+    in its own SQLite table, one row per object.
+    new() and delete() are written right away and save() writes
+    the objects changed since the last save, each row in its own
+    transaction. Only the objects in use are kept in memory.
+    cache_entries/cache_bytes: when set, the last objects used are
+    also kept in an ObjectCache of at most that many objects/bytes
+    (with the cache_policy "lru" or "lfu"), and the changed objects
+    it evicts are written right away, so that at most that many
+    objects are held by the storage
+    """
+
+    cache_entries = None
+    cache_bytes = None
+    cache_policy = "lru"
+
+    def __init__(self, path=None):
+        """
+        __init__() method:
+        Initialize the engine on the database at path
+        (default: $HBNB_SQLITE_PATH or file.db)
+        """
+        self.path = path or getenv("HBNB_SQLITE_PATH", "file.db")
+        self.__connection = None
+        self.__objects = WeakValueDictionary()
+        self.__dirty = {}
+        self.__batch = None
+        self.__cache = None
+        self.__writebacks = 0
+
+    def __db(self):
+        """
+        __db() method:
+        returns the database connection, creating the tables
+        and the attribute indexes on first use
+        """
+        if self.__connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for class_name in self.classes_dict:
+                connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{class_name}" ('
+                    "id TEXT PRIMARY KEY, created_at TEXT, "
+                    "updated_at TEXT, data TEXT NOT NULL)"
+                )
+                for attr in self.indexed_attrs.get(class_name, ()):
+                    connection.execute(
+                        "CREATE INDEX IF NOT EXISTS "
+                        f'"{class_name}_{attr}" ON "{class_name}" '
+                        f"(json_extract(data, '$.{attr}'))"
+                    )
+            self.__connection = connection
+        return self.__connection
+
+    def __class_name(self, cls):
+        """
+        __class_name() method:
+        returns the name of cls (a class or a class name)
+        or None if it isn't in classes_dict
+        """
+        class_name = cls if isinstance(cls, str) else cls.__name__
+        return class_name if class_name in self.classes_dict else None
+
+    def __class_names(self, cls):
+        """
+        __class_names() method:
+        returns the names of the tables holding the objects of cls
+        (every table when cls is None)
+        """
+        if cls is None:
+            return list(self.classes_dict)
+        class_name = self.__class_name(cls)
+        return [class_name] if class_name else []
+
+    def __cached(self):
+        """
+        __cached() method:
+        returns the ObjectCache, made on first use, or None
+        if neither cache_entries nor cache_bytes is set
+        """
+        if self.__cache is None and (
+            self.cache_entries is not None or self.cache_bytes is not None
+        ):
+            self.__cache = ObjectCache(
+                self.cache_entries, self.cache_bytes, self.cache_policy,
+                self.__evicted
+            )
+        return self.__cache
+
+    def __evicted(self, key, obj):
+        """
+        __evicted() method:
+        writes obj back if it was changed since the last save,
+        as the cache doesn't keep it anymore
+        """
+        if self.__dirty.pop(key, None) is not None:
+            self.__write(obj)
+            self.__writebacks += 1
+
+    def __use(self, key, obj):
+        """
+        __use() method:
+        keeps obj in the cache, if there is one
+        """
+        cache = self.__cached()
+        if cache is not None:
+            cache.put(key, obj)
+
+    def cache_stats(self):
+        """
+        cache_stats() method:
+        returns the counters of the cache (hits, misses, evictions,
+        write-backs of evicted changed objects, entries, bytes)
+        or None if there is no cache
+        """
+        cache = self.__cached()
+        if cache is None:
+            return None
+        stats = cache.stats()
+        stats["writebacks"] = self.__writebacks
+        return stats
+
+    def __build(self, class_name, data):
+        """
+        __build() method:
+        returns the object stored in a row of the table of class_name,
+        reusing the instance already in memory if there is one
+        """
+        obj_dict = json_backend.loads(data)
+        key = f"{class_name}.{obj_dict['id']}"
+        obj = self.__objects.get(key)
+        if obj is None:
+            cls = self.classes_dict[class_name]
+            if self.compact_objects:
+                obj = share_timestamps(
+                    serializers.decode(cls, intern_ids(obj_dict))
+                )
+            else:
+                obj = serializers.decode(cls, obj_dict)
+            self.__objects[key] = obj
+        self.__use(key, obj)
+        return obj
+
+    def __write(self, obj):
+        """
+        __write() method:
+        inserts or replaces the row of obj
+        """
+        obj_dict = serializers.encode(obj)
+        self.__db().execute(
+            f'INSERT OR REPLACE INTO "{obj.__class__.__name__}" '
+            "(id, created_at, updated_at, data) VALUES (?, ?, ?, ?)",
+            (
+                obj.id, obj_dict["created_at"], obj_dict["updated_at"],
+                json_backend.dumps(obj_dict)
+            )
+        )
+
+    def all(self, cls=None):
+        """
+        all() method:
+        returns a dictionary of all the objects keyed by <class name>.id
+        or only the objects of cls (a class or a class name)
+        """
+        objects = {}
+        for class_name in self.__class_names(cls):
+            rows = self.__db().execute(f'SELECT data FROM "{class_name}"')
+            for data, in rows:
+                obj = self.__build(class_name, data)
+                objects[f"{class_name}.{obj.id}"] = obj
+        return objects
+
+    def new(self, obj):
+        """
+        new() method:
+        adds obj to the storage
+        """
+        if self.__class_name(obj.__class__) is None:
+            return
+        key = f"{obj.__class__.__name__}.{obj.id}"
+        self.__record(key)
+        self.__objects[key] = obj
+        self.__use(key, obj)
+        self.__write(obj)
+
+    def touch(self, obj, name=None, old_value=None):
+        """
+        touch() method:
+        marks a stored obj as changed since the last save
+        """
+        key = f"{obj.__class__.__name__}.{obj.__dict__.get('id')}"
+        if self.__objects.get(key) is obj:
+            self.__record(key)
+            self.__dirty[key] = obj
+            self.__use(key, obj)
+
+    def save(self):
+        """
+        save() method:
+        writes the objects changed since the last save
+        inside batch(), the save is done once, when the batch ends
+        """
+        if self.__batch is not None:
+            self.__batch["save"] = True
+            return
+        dirty, self.__dirty = self.__dirty, {}
+        for obj in dirty.values():
+            self.__write(obj)
+
+    @contextmanager
+    def batch(self):
+        """
+        batch() method:
+        a context manager that runs everything inside it in one
+        transaction and defers every save() to a single save when it
+        ends; if an exception is raised inside it, the transaction is
+        rolled back and the objects in memory are restored
+        (nested batches are part of the outermost one)
+        """
+        if self.__batch is not None:
+            yield self
+            return
+        self.__batch = {
+            "save": False, "before": {},
+            "dirty": {
+                key: obj.__dict__.copy() for key, obj in self.__dirty.items()
+            }
+        }
+        self.__db().execute("BEGIN")
+        try:
+            yield self
+            if self.__batch["save"]:
+                batch, self.__batch = self.__batch, None
+                self.save()
+                self.__batch = batch
+        except BaseException:
+            self.__db().execute("ROLLBACK")
+            batch, self.__batch = self.__batch, None
+            self.__rollback(batch)
+            raise
+        self.__db().execute("COMMIT")
+        self.__batch = None
+
+    def __record(self, key):
+        """
+        __record() method:
+        remembers the object stored at key before the batch changes it
+        """
+        if self.__batch is not None and key not in self.__batch["before"]:
+            self.__batch["before"][key] = self.__objects.get(key)
+
+    def __rollback(self, batch):
+        """
+        __rollback() method:
+        restores the objects in memory changed during a batch
+        as they were before it (from the state of the unsaved ones
+        when the batch started, or else from the database)
+        """
+        for key, obj in batch["before"].items():
+            self.__objects.pop(key, None)
+            self.__dirty.pop(key, None)
+            if obj is None:
+                continue
+            class_name, obj_id = key.split(".", 1)
+            row = self.__db().execute(
+                f'SELECT data FROM "{class_name}" WHERE id = ?', (obj_id,)
+            ).fetchone()
+            if key in batch["dirty"]:
+                state = batch["dirty"][key]
+                self.__dirty[key] = obj
+            elif row is not None:
+                state = obj.__class__(
+                    **json_backend.loads(row[0])
+                ).__dict__
+            else:
+                continue
+            obj.__dict__.clear()
+            obj.__dict__.update(state)
+            self.__objects[key] = obj
+
+    def reload(self):
+        """
+        reload() method:
+        opens the database, objects are then loaded when needed
+        """
+        self.__objects = WeakValueDictionary()
+        self.__dirty = {}
+        if self.__cache is not None:
+            self.__cache.clear()
+        self.__db()
+
+    def delete(self, obj=None):
+        """
+        delete() method:
+        deletes obj from the storage if it's inside
+        """
+        if obj is None or self.__class_name(obj.__class__) is None:
+            return
+        key = f"{obj.__class__.__name__}.{obj.id}"
+        self.__record(key)
+        self.__objects.pop(key, None)
+        self.__dirty.pop(key, None)
+        if self.__cache is not None:
+            self.__cache.discard(key)
+        self.__db().execute(
+            f'DELETE FROM "{obj.__class__.__name__}" WHERE id = ?', (obj.id,)
+        )
+
+    def get(self, cls, id):
+        """
+        get() method:
+        returns the object of cls (a class or a class name) with id
+        or None if there is none
+        """
+        class_name = self.__class_name(cls)
+        if class_name is None:
+            return None
+        key = f"{class_name}.{id}"
+        cache = self.__cached()
+        obj = self.__objects.get(key) if cache is None else cache.get(key)
+        if obj is None and cache is not None:
+            obj = self.__objects.get(key)
+            if obj is not None:
+                cache.put(key, obj)
+        if obj is not None:
+            return obj
+        row = self.__db().execute(
+            f'SELECT data FROM "{class_name}" WHERE id = ?', (id,)
+        ).fetchone()
+        return None if row is None else self.__build(class_name, row[0])
+
+    def count(self, cls=None):
+        """
+        count() method:
+        returns the number of objects
+        or only the number of objects of cls (a class or a class name)
+        """
+        return sum(
+            self.__db().execute(
+                f'SELECT COUNT(*) FROM "{class_name}"'
+            ).fetchone()[0]
+            for class_name in self.__class_names(cls)
+        )
+
+    def find(self, cls, **equals):
+        """
+        find() method:
+        returns the list of objects of cls (a class or a class name)
+        whose attributes are equal to the given values
+        (the attributes in indexed_attrs are looked up through an index)
+        """
+        class_name = self.__class_name(cls)
+        if class_name is None:
+            return []
+        clauses = []
+        params = []
+        for attr, value in equals.items():
+            if attr.isidentifier() and isinstance(value, (str, int, float)):
+                clauses.append(f"json_extract(data, '$.{attr}') = ?")
+                params.append(value)
+        sql = f'SELECT data FROM "{class_name}"'
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        found = {}
+        candidates = [
+            self.__build(class_name, data)
+            for data, in self.__db().execute(sql, params)
+        ] + [
+            obj for obj in self.__dirty.values()
+            if obj.__class__.__name__ == class_name
+        ]
+        for obj in candidates:
+            if all(
+                getattr(obj, attr, None) == value
+                for attr, value in equals.items()
+            ):
+                found[obj.id] = obj
+        return list(found.values())
@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+"""
+Full-text index Module:
+an inverted index from words to the objects whose text attributes
+contain them, ranked with BM25
+"""
+
+
+import re
+from collections import Counter
+from math import log
+
+
+WORD = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    tokenize() function:
+    returns the list of lowercase words of text
+    """
+    return WORD.findall(text.lower())
+
+
+class TextIndex:
+    """
+    TextIndex class:
+    the words of the text attributes (text_attrs, a dictionary of
+    class name: attribute names) of objects keyed by <class name>.id
+    docs maps each key to its word counts, postings each word
+    to the keys containing it and their count, lengths each key
+    to its number of words; changed is set when docs change
+    (the storage clears it once it has written them)
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, text_attrs, docs=None):
+        """
+        __init__() method:
+        Initialize the index, with the word counts of docs if given
+        """
+        self.text_attrs = text_attrs
+        self.docs = {}
+        self.postings = {}
+        self.lengths = {}
+        self.length = 0
+        for key, counts in (docs or {}).items():
+            self.__insert(key, counts)
+        self.changed = not docs
+
+    def __len__(self):
+        """
+        __len__() method:
+        returns the number of indexed objects
+        """
+        return len(self.docs)
+
+    def __insert(self, key, counts):
+        """
+        __insert() method:
+        adds the word counts of key to the postings
+        """
+        self.docs[key] = counts
+        self.changed = True
+        for word, count in counts.items():
+            self.postings.setdefault(word, {})[key] = count
+        self.lengths[key] = sum(counts.values())
+        self.length += self.lengths[key]
+
+    def add(self, key, obj):
+        """
+        add() method:
+        indexes the text attributes of obj under key,
+        replacing what was indexed under key before
+        """
+        attrs = self.text_attrs.get(key.split(".", 1)[0], ())
+        counts = Counter()
+        for attr in attrs:
+            value = getattr(obj, attr, None)
+            if isinstance(value, str):
+                counts.update(tokenize(value))
+        if self.docs.get(key) == counts:
+            return
+        self.remove(key)
+        if counts:
+            self.__insert(key, dict(counts))
+
+    def remove(self, key):
+        """
+        remove() method:
+        removes what is indexed under key
+        """
+        counts = self.docs.pop(key, None)
+        if counts is None:
+            return
+        self.changed = True
+        for word in counts:
+            keys = self.postings[word]
+            del keys[key]
+            if not keys:
+                del self.postings[word]
+        self.length -= self.lengths.pop(key)
+
+    def search(self, text, class_name=None):
+        """
+        search() method:
+        returns the keys of the objects containing any word of text,
+        best match first (BM25), only those of class_name if given
+        """
+        if not self.docs:
+            return []
+        average = self.length / len(self.docs)
+        scores = {}
+        for word in set(tokenize(text)):
+            keys = self.postings.get(word, {})
+            if not keys:
+                continue
+            idf = log(1 + (len(self.docs) - len(keys) + 0.5)
+                      / (len(keys) + 0.5))
+            for key, count in keys.items():
+                if class_name and not key.startswith(f"{class_name}."):
+                    continue
+                norm = self.K1 * (
+                    1 - self.B + self.B * self.lengths[key] / average
+                )
+                scores[key] = scores.get(key, 0) + idf * count * (
+                    self.K1 + 1
+                ) / (count + norm)
+        return sorted(scores, key=lambda key: (-scores[key], key))
@@ -9,6 +9,7 @@ import unittest
 from unittest.mock import patch
 from io import StringIO
 from console import HBNBCommand
+from models import storage
 from models.engine.file_storage import FileStorage
 from models.user import User
 
@@ -59,8 +60,11 @@ class TestHBNBCommand(unittest.TestCase):
         Test quit command:
         Ensure the quit command exits the program
         """
-        with patch("sys.stdout", new=StringIO()) as f:
+        with patch("sys.stdout", new=StringIO()) as f, patch.object(
+            storage, "flush"
+        ) as flush:
             self.assertTrue(self.console.onecmd("quit"))
+            flush.assert_called_once_with()
             output = f.getvalue().strip()
             self.assertEqual(output, "")
 
@@ -69,8 +73,11 @@ class TestHBNBCommand(unittest.TestCase):
         Test EOF command:
         Ensure the EOF command exits the program
         """
-        with patch("sys.stdout", new=StringIO()) as f:
+        with patch("sys.stdout", new=StringIO()) as f, patch.object(
+            storage, "flush"
+        ) as flush:
             self.assertTrue(self.console.onecmd("EOF"))
+            flush.assert_called_once_with()
             output = f.getvalue().strip()
             self.assertEqual(output, "")
 
@@ -332,7 +339,7 @@ class TestHBNBCommand(unittest.TestCase):
         with patch("sys.stdout", new=StringIO()) as f:
             self.console.onecmd("create State")
             instance_id = f.getvalue().strip()
-            expected_output = f"State.{self.file_storage.all()}"
+            expected_output = f"State.{storage.all()}"
             self.assertIn(instance_id, expected_output)
 
     def test_show_valid_instance(self):
@@ -352,7 +359,7 @@ class TestHBNBCommand(unittest.TestCase):
         """
         with patch("sys.stdout", new=StringIO()) as f:
             self.console.onecmd(f"destroy User {self.id}")
-            self.assertTrue(self.id not in self.file_storage.all())
+            self.assertTrue(self.id not in storage.all())
 
     def test_update_valid_instance(self):
         """
@@ -361,7 +368,7 @@ class TestHBNBCommand(unittest.TestCase):
         """
         with patch("sys.stdout", new=StringIO()) as f:
             self.console.onecmd(f'update User {self.id} name "new_name"')
-            updated_instance = self.file_storage.all()[f"User.{self.id}"]
+            updated_instance = storage.all()[f"User.{self.id}"]
             self.assertEqual(updated_instance.name, "new_name")
 
     def test_all_without_class(self):
@@ -405,7 +412,7 @@ class TestHBNBCommand(unittest.TestCase):
         with patch("sys.stdout", new=StringIO()) as f:
             self.console.onecmd("count")
             count = int(f.getvalue().strip())
-            expected_count = len(self.file_storage.all())
+            expected_count = len(storage.all())
             self.assertEqual(count, expected_count)
 
     def test_count_with_class(self):
@@ -417,7 +424,7 @@ class TestHBNBCommand(unittest.TestCase):
             self.console.onecmd("count User")
             count = int(f.getvalue().strip())
             expected_count = sum(
-                1 for key in self.file_storage.all() if "User" in key
+                1 for key in storage.all() if "User" in key
             )
             self.assertEqual(count, expected_count)
 
@@ -431,7 +438,7 @@ class TestHBNBCommand(unittest.TestCase):
             self.console.onecmd("User.count()")
             count = f.getvalue().strip()
             expected_count = sum(
-                1 for key in self.file_storage.all() if "User" in key
+                1 for key in storage.all() if "User" in key
             )
             self.assertIn(count, str(expected_count))
 
@@ -444,7 +451,7 @@ class TestHBNBCommand(unittest.TestCase):
             self.console.onecmd("create State")
             idn = f.getvalue().strip()
             self.console.onecmd(f"destroy User {idn}")
-            self.assertTrue(idn not in self.file_storage.all())
+            self.assertTrue(idn not in storage.all())
 
     def test_destroy_with_class_method(self):
         """
@@ -455,7 +462,7 @@ class TestHBNBCommand(unittest.TestCase):
             self.console.onecmd("create State")
             idn = f.getvalue().strip
             self.console.onecmd(f"User.destroy('{idn}')")
-            self.assertNotIn(self.id, self.file_storage.all())
+            self.assertNotIn(self.id, storage.all())
 
     def test_show_valid_instance(self):
         """
@@ -485,7 +492,7 @@ class TestHBNBCommand(unittest.TestCase):
         """
         with patch("sys.stdout", new=StringIO()) as f:
             self.console.onecmd(f'update User {self.id} name "new_name"')
-            updated_instance = self.file_storage.all()[f"User.{self.id}"]
+            updated_instance = storage.all()[f"User.{self.id}"]
             self.assertEqual(updated_instance.name, "new_name")
 
     def test_update_with_class_method(self):
@@ -498,7 +505,7 @@ class TestHBNBCommand(unittest.TestCase):
             self.console.onecmd(
                 f'User.update("{self.id}", "first_name", "new_name")'
             )
-            updated_instance = self.file_storage.all()[f"User.{self.id}"]
+            updated_instance = storage.all()[f"User.{self.id}"]
             self.assertIn(updated_instance.first_name, "new_name")
 
     def test_update_with_dictionary(self):
@@ -511,9 +518,134 @@ class TestHBNBCommand(unittest.TestCase):
             self.console.onecmd(
                 f'update User {self.id} {{"first_name": "new_name"}}'
             )
-            updated_instance = self.file_storage.all()[f"User.{self.id}"]
+            updated_instance = storage.all()[f"User.{self.id}"]
             self.assertIn(updated_instance.first_name, "new_name")
 
+    def test_update_with_dictionary_saves_once(self):
+        """
+        Test <class_name>.update() method with a dict rep:
+        Ensure that all the attributes are updated in a single
+        storage batch, so they are saved once
+        """
+        with patch.object(storage, "batch", wraps=storage.batch) as batch:
+            with patch("sys.stdout", new=StringIO()):
+                line = self.console.precmd(
+                    f'User.update("{self.id}", '
+                    '{"first_name": "Jane", "last_name": "Roe", "age": 9})'
+                )
+                self.console.onecmd(line)
+        batch.assert_called_once_with()
+        updated_instance = storage.all()[f"User.{self.id}"]
+        self.assertEqual(updated_instance.first_name, "Jane")
+        self.assertEqual(updated_instance.last_name, "Roe")
+
+    def test_update_indexed_attribute(self):
+        """
+        Test update method on an indexed attribute:
+        Ensure that storage.find() sees the updated value
+        """
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("create Place")
+            place_id = f.getvalue().strip()
+            self.console.onecmd(f'update Place {place_id} city_id "city-9"')
+            found = storage.find("Place", city_id="city-9")
+            self.assertEqual([place.id for place in found], [place_id])
+
+    def test_all_with_class_exact_match(self):
+        """
+        Test all method with a valid class name:
+        Ensure that all only displays instances of exactly that class
+        """
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("create BaseModel")
+            base_id = f.getvalue().strip()
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("all User")
+            output = f.getvalue().strip()
+            self.assertIn(self.id, output)
+            self.assertNotIn(base_id, output)
+
+    def test_nearby_and_within(self):
+        """
+        Test nearby and within methods:
+        Ensure that a Place is found once located with update
+        and no longer found once destroyed
+        """
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("create Place")
+            place_id = f.getvalue().strip()
+        self.console.onecmd(f"update Place {place_id} latitude 6.4541")
+        self.console.onecmd(f"update Place {place_id} longitude 3.3947")
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("nearby 6.5244 3.3792 10 5")
+            self.console.onecmd("within 6 3 7 4")
+            self.console.onecmd("nearby 6.5244 3.3792 5")
+            output = f.getvalue().strip().splitlines()
+        self.assertIn(place_id, output[0])
+        self.assertIn(place_id, output[1])
+        self.assertNotIn(place_id, output[2])
+        self.console.onecmd(f"destroy Place {place_id}")
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("nearby 6.5244 3.3792 10")
+            self.assertNotIn(place_id, f.getvalue())
+
+    def test_nearby_invalid_arguments(self):
+        """
+        Test nearby and within methods with missing or invalid arguments:
+        Ensure that an error message is displayed
+        """
+        for command, expected_output in (
+            ("nearby", "** latitude missing **"),
+            ("nearby 6.5 3.3", "** radius missing **"),
+            ("nearby 6.5 3.3 ten", "** invalid number **"),
+            ("nearby nan 3.3 10", "** invalid number **"),
+            ("nearby 6.5 3.3 inf", "** invalid number **"),
+            ("within 6 3 -inf 4", "** invalid number **"),
+            ("nearby 6.5 3.3 10 inf", "** invalid number **"),
+            ("within 6 3 7", "** max_lon missing **"),
+        ):
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.console.onecmd(command)
+                self.assertEqual(f.getvalue().strip(), expected_output)
+
+    def test_search(self):
+        """
+        Test search method:
+        Ensure that matching instances are displayed, by class and by page
+        """
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("create Amenity")
+            amenity_id = f.getvalue().strip()
+        self.console.onecmd(f"update Amenity {amenity_id} name Xylophone")
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("search xylophone")
+            self.console.onecmd("search Amenity xylophone")
+            self.console.onecmd("search Place xylophone")
+            self.console.onecmd("search xylophone --page 2")
+            output = f.getvalue().strip().splitlines()
+        self.assertIn(amenity_id, output[0])
+        self.assertIn(amenity_id, output[1])
+        self.assertEqual(output[2:], ["[]", "[]"])
+        self.console.onecmd(f"destroy Amenity {amenity_id}")
+        with patch("sys.stdout", new=StringIO()) as f:
+            self.console.onecmd("search xylophone")
+            self.assertEqual(f.getvalue().strip(), "[]")
+
+    def test_search_invalid_arguments(self):
+        """
+        Test search method with missing words or an invalid page:
+        Ensure that an error message is displayed
+        """
+        for command, expected_output in (
+            ("search", "** search words missing **"),
+            ("search Place", "** search words missing **"),
+            ("search pool --page", "** invalid page **"),
+            ("search pool --page 0", "** invalid page **"),
+        ):
+            with patch("sys.stdout", new=StringIO()) as f:
+                self.console.onecmd(command)
+                self.assertEqual(f.getvalue().strip(), expected_output)
+
     def test_documentations(self):
         """
         Documentation Test:
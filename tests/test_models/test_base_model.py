@@ -11,6 +11,7 @@ from models import storage
 from uuid import UUID
 import os
 import unittest
+from unittest.mock import patch
 
 
 class TestBaseModel(unittest.TestCase):
@@ -239,6 +240,19 @@ class TestBaseModel(unittest.TestCase):
             f"{base_model.__class__.__name__}.{base_model.id}", storage.all()
         )
 
+    def test_setattr_marks_dirty(self):
+        """
+        Dirty Tracking Test:
+        Test if setting an attribute on a stored instance
+        marks it as changed in storage.
+        """
+        base_model = BaseModel()
+        with patch.object(storage, "touch") as touch:
+            base_model.name = "My_First_Model"
+            base_model.name = "My_Second_Model"
+        touch.assert_called_with(base_model, "name", "My_First_Model")
+        self.assertEqual(touch.call_count, 2)
+
     def test_documentations(self):
         """
         Documentation Test:
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+"""
+AsyncFileStorage Test Module
+"""
+
+
+import models
+from models.engine.async_storage import AsyncFileStorage
+from models.engine.file_storage import FileStorage
+from models.user import User
+from models.place import Place
+import asyncio
+import json
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+
+@unittest.skipIf(not isinstance(models.storage, FileStorage),
+                 "the storage engine is not FileStorage")
+class TestAsyncFileStorage(unittest.IsolatedAsyncioTestCase):
+    """
+    AsyncFileStorage Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create the facade over a FileStorage in thread_safe mode
+        before each test
+        """
+        FileStorage.thread_safe = True
+        self.file_storage = FileStorage()
+        self.storage = AsyncFileStorage(self.file_storage)
+
+    def tearDown(self):
+        """
+        tearDown() instance method:
+        Leave thread_safe mode and remove the JSON file
+        """
+        FileStorage.thread_safe = False
+        if os.path.exists(self.file_storage._FileStorage__file_path):
+            os.remove(self.file_storage._FileStorage__file_path)
+
+    def test_needs_thread_safe(self):
+        """
+        Test __init__() method:
+        Verify that a storage not in thread_safe mode is refused
+        and left as it is.
+        """
+        FileStorage.thread_safe = False
+        with self.assertRaises(ValueError):
+            AsyncFileStorage(self.file_storage)
+        self.assertFalse(FileStorage.thread_safe)
+
+    async def test_save_and_reload(self):
+        """
+        Test save() and reload() methods:
+        Verify that the objects are written, then read back.
+        """
+        user = User()
+        user.email = "async@hbnb.io"
+        await self.storage.save()
+        with open(self.file_storage._FileStorage__file_path) as file:
+            self.assertEqual(json.load(file)[f"User.{user.id}"],
+                             user.to_dict())
+        self.file_storage.delete(user)
+        self.assertIsNone(await self.storage.get(User, user.id))
+        await self.storage.reload()
+        self.assertEqual((await self.storage.get(User, user.id)).email,
+                         "async@hbnb.io")
+
+    async def test_save_runs_in_executor(self):
+        """
+        Test save() method:
+        Verify that the loop goes on while a save runs.
+        """
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def save():
+            threads.append(threading.get_ident())
+            time.sleep(0.05)
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(tick())
+        with patch.object(self.file_storage, "save", side_effect=save):
+            await self.storage.save()
+        ticker.cancel()
+        self.assertNotEqual(threads, [loop_thread])
+        self.assertGreater(ticks, 2)
+
+    async def test_saves_coalesce(self):
+        """
+        Test save() method:
+        Verify that the saves requested while a save runs
+        are made by one more save.
+        """
+        calls = []
+
+        def save():
+            calls.append(1)
+            time.sleep(0.05)
+
+        with patch.object(self.file_storage, "save", side_effect=save):
+            first = asyncio.create_task(self.storage.save())
+            await asyncio.sleep(0.01)
+            await asyncio.gather(
+                first, *(self.storage.save() for _ in range(10))
+            )
+        self.assertEqual(len(calls), 2)
+
+    async def test_save_error(self):
+        """
+        Test save() method:
+        Verify that an error of the save reaches the callers waiting.
+        """
+        with patch.object(self.file_storage, "save",
+                          side_effect=OSError("disk full")):
+            results = await asyncio.gather(
+                self.storage.save(), self.storage.save(),
+                return_exceptions=True
+            )
+        self.assertTrue(all(isinstance(result, OSError)
+                            for result in results))
+
+    async def test_objects(self):
+        """
+        Test the async iteration:
+        Verify that it yields every object, or those of a class.
+        """
+        places = [Place() for _ in range(3)]
+        self.storage.chunk_size = 2
+        found = [obj async for obj in self.storage]
+        self.assertEqual(len(found), len(self.file_storage.all()))
+        found = [obj async for obj in self.storage.objects(Place)]
+        self.assertEqual({place.id for place in found} & {
+            place.id for place in places
+        }, {place.id for place in places})
+        self.assertTrue(all(isinstance(obj, Place) for obj in found))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+"""
+Binary snapshot Test Module
+"""
+
+
+from io import BytesIO
+from models.engine import binary_snapshot
+from models.review import Review
+import json
+import os
+import tempfile
+import unittest
+
+
+class TestBinarySnapshot(unittest.TestCase):
+    """
+    Binary snapshot Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create a Review that isn't added to the storage
+        """
+        self.review = Review(
+            id="review-1", created_at="2023-08-08T12:34:56.789012",
+            updated_at="2023-08-09T00:00:00", text="Great place",
+            place_id="place-1"
+        )
+
+    def test_encode_decode(self):
+        """
+        Test encode() and decode() functions:
+        Verify that timestamps are stored as integers and that a Review
+        built from the payload is the same as the original one.
+        """
+        record = binary_snapshot.decode(binary_snapshot.encode(self.review))
+        self.assertIsInstance(record["created_at"], int)
+        self.assertEqual(
+            binary_snapshot.from_micros(record["created_at"]),
+            self.review.created_at
+        )
+        self.assertEqual(Review(**record).to_dict(), self.review.to_dict())
+
+    def test_dump_load_table(self):
+        """
+        Test dump() and load_table() functions:
+        Verify that each payload is found at the offset of the table,
+        including the ones copied from a source snapshot.
+        """
+        payload = binary_snapshot.encode(self.review)
+        file = BytesIO()
+        offsets = binary_snapshot.dump(file, {"Review.review-1": payload})
+        buffer = file.getvalue()
+        table = binary_snapshot.load_table(buffer)
+        self.assertEqual(table, offsets)
+        offset, length = table["Review.review-1"]
+        self.assertEqual(buffer[offset:offset + length], payload)
+        copy = BytesIO()
+        binary_snapshot.dump(copy, dict(table), buffer)
+        self.assertEqual(copy.getvalue(), buffer)
+        with self.assertRaises(ValueError):
+            binary_snapshot.load_table(b"JSON" + buffer[4:])
+
+    def test_convert(self):
+        """
+        Test convert() function:
+        Verify that file.json converted to a binary snapshot
+        and back is unchanged.
+        """
+        data = {"Review.review-1": self.review.to_dict()}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "file.json")
+            snapshot = os.path.join(tmp_dir, "file.hbnb")
+            destination = os.path.join(tmp_dir, "copy.json")
+            with open(source, "w") as file:
+                json.dump(data, file)
+            binary_snapshot.convert(source, snapshot)
+            binary_snapshot.convert(snapshot, destination)
+            with open(destination, "r") as file:
+                self.assertEqual(json.load(file), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""
+Columnar store Test Module
+"""
+
+
+from models.engine import columns
+from models.engine.columns import ColumnStore, Query, parse
+from models.place import Place
+import unittest
+from unittest.mock import patch
+
+
+class TestColumns(unittest.TestCase):
+    """
+    ColumnStore and Query Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create places with different prices and numbers of guests
+        """
+        self.places = {}
+        for i, (price, guests) in enumerate(
+            ((50, 2), (80, 4), (120, 6), (99, 5), ("free", 4))
+        ):
+            place = Place(
+                id=f"place-{i}", created_at="2023-08-08T12:34:56.789",
+                updated_at="2023-08-08T12:34:56.789",
+                price_by_night=price, max_guest=guests
+            )
+            self.places[place.id] = place
+
+    def test_parse(self):
+        """
+        Test parse() function:
+        Verify that the operator suffix is split from the attribute.
+        """
+        self.assertEqual(
+            parse({"max_guest": 4, "price_by_night__lte": 10}),
+            [("max_guest", "eq", 4), ("price_by_night", "lte", 10)]
+        )
+        with self.assertRaises(ValueError):
+            parse({"max_guest__between": 4})
+
+    def test_where(self):
+        """
+        Test Query.where() method:
+        Verify that columns and objects give the same ids,
+        with and without NumPy.
+        """
+        attrs = ("price_by_night", "max_guest")
+        cases = (
+            ({"price_by_night__lt": 100, "max_guest__gte": 4},
+             ["place-1", "place-3"]),
+            ({"price_by_night__ne": 80}, [
+                "place-0", "place-2", "place-3", "place-4"
+            ]),
+            ({"price_by_night": "free"}, ["place-4"]),
+            ({"max_guest": 6.0}, ["place-2"]),
+            ({}, list(self.places)),
+        )
+        for numpy in {columns.numpy, None}:
+            with patch.object(columns, "numpy", numpy):
+                for store in (None, ColumnStore(attrs, self.places.values())):
+                    query = Query(self.places, store)
+                    for conditions, expected in cases:
+                        self.assertEqual(
+                            sorted(query.where(**conditions)), expected
+                        )
+
+    def test_add_update_remove(self):
+        """
+        Test ColumnStore add(), update() and remove() methods:
+        Verify that the rows follow the objects.
+        """
+        store = ColumnStore(("price_by_night",), self.places.values())
+        self.assertEqual(len(store), 5)
+        place = self.places["place-0"]
+        place.__dict__["price_by_night"] = 500
+        store.update(place, "price_by_night")
+        store.remove("place-1")
+        store.remove("nope")
+        self.assertEqual(len(store), 4)
+        self.assertEqual(
+            sorted(store.select([("price_by_night", "gt", 100)])),
+            ["place-0", "place-2"]
+        )
+        store.add(self.places["place-1"])
+        self.assertEqual(store.select([("price_by_night", "eq", 80)]),
+                         ["place-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""
+Compact objects Test Module
+"""
+
+
+from models.engine.compact import compact, intern_ids, is_identifier
+from models.place import Place
+from models.review import Review
+import sys
+import unittest
+
+
+class TestCompact(unittest.TestCase):
+    """
+    compact() Test class
+    """
+
+    def build(self, cls, **kwargs):
+        """
+        build() method:
+        returns an instance of cls built from a fresh copy of its record
+        (as storage does when it reloads it)
+        """
+        record = {
+            "id": "".join(["review-", "1"]),
+            "created_at": "2023-08-08T12:34:56.789012",
+            "updated_at": "2023-08-08T12:34:56.789012",
+            "__class__": cls.__name__,
+        }
+        record.update(kwargs)
+        return cls(**record)
+
+    def test_is_identifier(self):
+        """
+        Test is_identifier() function:
+        Verify that only ids and lists of ids are matched.
+        """
+        for name in ("id", "place_id", "amenity_ids"):
+            self.assertTrue(is_identifier(name))
+        for name in ("text", "name", "idle"):
+            self.assertFalse(is_identifier(name))
+
+    def test_same_output(self):
+        """
+        Test compact() function:
+        Verify that to_dict() and __str__() are unchanged.
+        """
+        for cls, kwargs in (
+            (Review, {"place_id": "place-1", "text": "Great"}),
+            (Place, {"amenity_ids": ["amenity-1"], "latitude": 6.5}),
+        ):
+            obj = self.build(cls, **kwargs)
+            expected = (str(obj), obj.to_dict())
+            self.assertIs(compact(obj), obj)
+            self.assertEqual((str(obj), obj.to_dict()), expected)
+
+    def test_shared_values(self):
+        """
+        Test compact() function:
+        Verify that ids are shared between objects
+        and that equal timestamps are one object.
+        """
+        reviews = [
+            compact(self.build(Review, place_id="".join(["place-", "1"])))
+            for _ in range(2)
+        ]
+        self.assertIs(reviews[0].place_id, reviews[1].place_id)
+        self.assertIs(reviews[0].id, reviews[1].id)
+        self.assertIs(reviews[0].updated_at, reviews[0].created_at)
+        place = compact(self.build(
+            Place, updated_at="2024-01-01T00:00:00",
+            amenity_ids=["".join(["amenity-", "1"])]
+        ))
+        self.assertIsNot(place.updated_at, place.created_at)
+        self.assertIs(place.amenity_ids[0], "amenity-1")
+
+    def test_intern_ids(self):
+        """
+        Test intern_ids() function:
+        Verify that the ids of a record are interned in place
+        before the object is built from it.
+        """
+        record = {
+            "place_id": "".join(["place-", "2"]),
+            "amenity_ids": ["".join(["amenity-", "2"])],
+            "text": "".join(["Gre", "at"]),
+        }
+        self.assertIs(intern_ids(record), record)
+        self.assertIs(record["place_id"], sys.intern("place-2"))
+        self.assertIs(record["amenity_ids"][0], sys.intern("amenity-2"))
+        self.assertIsNot(record["text"], sys.intern("Great"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""
+Compressed files Test Module
+"""
+
+
+from models.engine import compressed
+import os
+import tempfile
+import unittest
+
+
+class TestCompressed(unittest.TestCase):
+    """
+    Compressed files Test class
+    """
+
+    def test_codec_of(self):
+        """
+        Test codec_of() function:
+        Verify that the codec is found from the extension.
+        """
+        self.assertEqual(compressed.codec_of("file.json.gz"), "gzip")
+        self.assertEqual(compressed.codec_of("file.json.xz"), "lzma")
+        self.assertEqual(compressed.codec_of("file.json.zst"), "zstd")
+        self.assertIsNone(compressed.codec_of("file.json"))
+
+    def test_resolve(self):
+        """
+        Test resolve() function:
+        Verify that "auto" picks an available codec and that unknown
+        codecs are refused.
+        """
+        self.assertIn(compressed.resolve("auto"), compressed.available())
+        self.assertEqual(compressed.resolve("gzip"), "gzip")
+        with self.assertRaises(ValueError):
+            compressed.resolve("rar")
+        for name in compressed.EXTENSIONS:
+            if name not in compressed.available():
+                with self.assertRaises(ValueError):
+                    compressed.resolve(name)
+
+    def test_round_trip(self):
+        """
+        Test wrap() and open_text() functions:
+        Verify that each available codec reads back what it writes,
+        and that the file is smaller for repetitive text.
+        """
+        text = '{"id": "é", "__class__": "User"}, ' * 1000
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in compressed.available():
+                path = os.path.join(tmp_dir, f"file{name}")
+                with open(path, "wb") as raw:
+                    with compressed.wrap(raw, "wt", name) as file:
+                        file.write(text)
+                self.assertLess(os.path.getsize(path), len(text) // 10)
+                with compressed.open_text(path, name) as file:
+                    self.assertEqual(file.read(), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
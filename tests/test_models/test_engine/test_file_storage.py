@@ -4,7 +4,10 @@ FileStorage Test Module
 """
 
 
+import models
 from models.engine.file_storage import FileStorage
+from models.engine.lazy import LazyDict, UNLOADED
+from models.engine import compressed, parallel, serializers, shards
 from models.base_model import BaseModel
 from models.user import User
 from models.state import State
@@ -12,10 +15,20 @@ from models.city import City
 from models.amenity import Amenity
 from models.place import Place
 from models.review import Review
+import json
 import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
+from unittest.mock import patch
 
 
+@unittest.skipIf(not isinstance(models.storage, FileStorage),
+                 "the storage engine is not FileStorage")
 class TestFileStorage(unittest.TestCase):
     """
     FileStorage Test class
@@ -33,8 +46,45 @@ class TestFileStorage(unittest.TestCase):
         tearDown() instance method:
         Clean up by removing the test JSON file if it exists after each test
         """
+        self.file_storage.flush()
+        FileStorage.write_behind = False
+        FileStorage.flush_interval_ms = 1000
+        FileStorage.flush_threshold = 1000
+        FileStorage.parallel_workers = 1
+        FileStorage.parallel_threshold = 50000
+        FileStorage.sharded = False
+        FileStorage.shard_buckets = 1
+        for name in compressed.available():
+            FileStorage.compression = name
+            if os.path.exists(self.file_storage.snapshot_path()):
+                os.remove(self.file_storage.snapshot_path())
+        FileStorage.compression = None
+        FileStorage.text_cache = True
+        FileStorage._FileStorage__shards_loaded = None
+        shutil.rmtree(self.file_storage.shards_path(), ignore_errors=True)
+        FileStorage.lazy = False
+        objects = FileStorage._FileStorage__objects
+        if isinstance(objects, LazyDict):
+            FileStorage._FileStorage__objects = dict(objects.items())
+        if os.path.exists(self.file_storage.snapshot_path()):
+            os.remove(self.file_storage.snapshot_path())
+        FileStorage.snapshot_format = "json"
         if os.path.exists(self.file_storage._FileStorage__file_path):
             os.remove(self.file_storage._FileStorage__file_path)
+        if os.path.exists(self.file_storage.journal_path()):
+            os.remove(self.file_storage.journal_path())
+        if os.path.exists(self.file_storage.index_path()):
+            os.remove(self.file_storage.index_path())
+        FileStorage.journal = False
+        FileStorage.compact_objects = False
+        FileStorage.columnar = False
+        FileStorage._FileStorage__columns.clear()
+        FileStorage._FileStorage__geo = None
+        FileStorage._FileStorage__text = None
+        FileStorage._FileStorage__amenities = None
+        FileStorage.thread_safe = False
+        if os.path.exists(self.file_storage.text_index_path()):
+            os.remove(self.file_storage.text_index_path())
 
     def test_all(self):
         """
@@ -72,6 +122,30 @@ class TestFileStorage(unittest.TestCase):
         key = f"{base_model.__class__.__name__}.{base_model.id}"
         self.assertIn(key, new_file_storage.all())
 
+    def test_save_is_atomic(self):
+        """
+        Test save() crash safety:
+        Verify that a save() interrupted while writing leaves the previous
+        JSON file intact and no temporary file behind.
+        """
+        user = User()
+        self.file_storage.save()
+        file_path = self.file_storage._FileStorage__file_path
+        with open(file_path, "r") as file:
+            before = file.read()
+        user.first_name = "Betty"
+        with patch("os.fsync", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.file_storage.save()
+        with open(file_path, "r") as file:
+            self.assertEqual(file.read(), before)
+        leftovers = [
+            name for name in os.listdir(os.path.dirname(
+                os.path.abspath(file_path)
+            )) if name.startswith(f".{os.path.basename(file_path)}.")
+        ]
+        self.assertEqual(leftovers, [])
+
     def test_new_overwrite_existing(self):
         """
         Test new() method overwriting existing object:
@@ -98,6 +172,1051 @@ class TestFileStorage(unittest.TestCase):
         self.file_storage.new(base_model2)
         self.assertIn(key, self.file_storage.all())
 
+    def test_all_with_class(self):
+        """
+        Test all(cls) method:
+        Verify that all() filtered by class (or class name)
+        only returns the objects of that class.
+        """
+        user = User()
+        place = Place()
+        users = self.file_storage.all(User)
+        self.assertIn(f"User.{user.id}", users)
+        self.assertNotIn(f"Place.{place.id}", users)
+        self.assertEqual(users, self.file_storage.all("User"))
+        for key in users:
+            self.assertTrue(key.startswith("User."))
+        self.assertEqual(self.file_storage.all("Nope"), {})
+
+    def test_get(self):
+        """
+        Test get() method:
+        Verify that get() returns the object of a class with an id
+        or None if there is none.
+        """
+        user = User()
+        self.assertIs(self.file_storage.get(User, user.id), user)
+        self.assertIs(self.file_storage.get("User", user.id), user)
+        self.assertIsNone(self.file_storage.get(Place, user.id))
+
+    def test_count(self):
+        """
+        Test count() method:
+        Verify that count() returns the number of objects,
+        overall or per class, and follows new() and delete().
+        """
+        self.assertEqual(
+            self.file_storage.count(), len(self.file_storage.all())
+        )
+        count = self.file_storage.count(Review)
+        review = Review()
+        self.assertEqual(self.file_storage.count("Review"), count + 1)
+        self.file_storage.delete(review)
+        self.assertEqual(self.file_storage.count(Review), count)
+
+    def test_find(self):
+        """
+        Test find() method:
+        Verify that find() returns the objects matching the given
+        attributes and that the attribute indexes follow updates
+        and deletes.
+        """
+        state = State()
+        city = City()
+        city.state_id = state.id
+        other = City()
+        other.state_id = state.id
+        other.name = "Lagos"
+        self.assertCountEqual(
+            self.file_storage.find(City, state_id=state.id), [city, other]
+        )
+        self.assertEqual(
+            self.file_storage.find("City", state_id=state.id, name="Lagos"),
+            [other]
+        )
+        city.state_id = "moved"
+        self.assertEqual(
+            self.file_storage.find(City, state_id=state.id), [other]
+        )
+        self.assertIn(city, self.file_storage.find(City, state_id="moved"))
+        self.file_storage.delete(other)
+        self.assertEqual(self.file_storage.find(City, state_id=state.id), [])
+        self.assertEqual(self.file_storage.find(State, id=state.id), [state])
+
+    def test_find_after_reload(self):
+        """
+        Test find() method after reload():
+        Verify that reload() rebuilds the attribute indexes.
+        """
+        review = Review()
+        review.place_id = "place-1"
+        self.file_storage.save()
+        self.file_storage.delete(review)
+        self.file_storage.reload()
+        found = self.file_storage.find(Review, place_id="place-1")
+        self.assertEqual([obj.id for obj in found], [review.id])
+
+    def test_delete(self):
+        """
+        Test delete() method:
+        Verify that delete() removes the object from __objects
+        and that delete(None) does nothing.
+        """
+        user = User()
+        key = f"User.{user.id}"
+        self.file_storage.delete()
+        self.assertIn(key, self.file_storage.all())
+        self.file_storage.delete(user)
+        self.assertNotIn(key, self.file_storage.all())
+
+    def test_save_only_serializes_dirty(self):
+        """
+        Test save() dirty tracking:
+        Verify that save() only encodes the objects
+        created or changed since the last save.
+        """
+        user = User()
+        State()
+        self.file_storage.save()
+        user.first_name = "Betty"
+        with patch("models.engine.serializers.encode",
+                   wraps=serializers.encode) as encode:
+            self.file_storage.save()
+        encode.assert_called_once_with(user)
+        with open(self.file_storage._FileStorage__file_path, "r") as file:
+            data = json.load(file)
+        self.assertEqual(data[f"User.{user.id}"]["first_name"], "Betty")
+
+    def test_no_text_cache(self):
+        """
+        Test text_cache set to False:
+        Verify that the JSON text of the objects is not kept after
+        reload() and save(), and that saves still write every object.
+        """
+        FileStorage.text_cache = False
+        user = User()
+        self.file_storage.save()
+        cache = FileStorage._FileStorage__cache
+        self.assertEqual(cache, {})
+        self.forget()
+        self.file_storage.reload()
+        self.assertEqual(cache, {})
+        user = self.file_storage.get(User, user.id)
+        user.first_name = "Betty"
+        city = City()
+        self.file_storage.save()
+        self.assertEqual(cache, {})
+        with open(self.file_storage._FileStorage__file_path) as file:
+            saved = json.load(file)
+        self.assertEqual(saved[f"User.{user.id}"]["first_name"], "Betty")
+        self.assertIn(f"City.{city.id}", saved)
+
+    def test_journal_appends_changes(self):
+        """
+        Test save() in journal mode:
+        Verify that save() appends only the changed objects to the journal
+        instead of rewriting the JSON file.
+        """
+        self.file_storage.save()
+        FileStorage.journal = True
+        user = User()
+        self.file_storage.save()
+        with open(self.file_storage.journal_path(), "r") as file:
+            lines = file.readlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["key"], f"User.{user.id}")
+        user.first_name = "Betty"
+        user.save()
+        self.file_storage.delete(user)
+        self.file_storage.save()
+        with open(self.file_storage.journal_path(), "r") as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[1]["data"]["first_name"], "Betty")
+        self.assertEqual(records[2]["op"], "delete")
+
+    def test_journal_reload_replays(self):
+        """
+        Test reload() with a journal:
+        Verify that reload() replays the journal over the last snapshot.
+        """
+        user = User()
+        place = Place()
+        self.file_storage.save()
+        FileStorage.journal = True
+        user.first_name = "Betty"
+        user.save()
+        self.file_storage.delete(place)
+        self.file_storage.save()
+        objects = self.file_storage.all()
+        del objects[f"User.{user.id}"]
+        self.file_storage.reload()
+        self.assertEqual(objects[f"User.{user.id}"].first_name, "Betty")
+        self.assertNotIn(f"Place.{place.id}", objects)
+
+    def test_journal_non_finite(self):
+        """
+        Test reload() in journal mode:
+        Verify that NaN values are read back from the journal and that
+        the records after them are replayed.
+        """
+        FileStorage.journal = True
+        place = Place()
+        place.latitude = float("nan")
+        self.file_storage.save()
+        user = User()
+        self.file_storage.save()
+        self.forget()
+        self.file_storage.reload()
+        latitude = self.file_storage.get(Place, place.id).latitude
+        self.assertNotEqual(latitude, latitude)
+        self.assertIsNotNone(self.file_storage.get(User, user.id))
+
+    def test_journal_torn_record(self):
+        """
+        Test save() and reload() in journal mode:
+        Verify that the records saved after a record torn by a crash
+        are replayed.
+        """
+        self.file_storage.save()
+        FileStorage.journal = True
+        torn = User()
+        self.file_storage.save()
+        path = self.file_storage.journal_path()
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 10)
+        self.forget()
+        self.file_storage.reload()
+        self.assertIsNone(self.file_storage.get(User, torn.id))
+        user = User()
+        self.file_storage.save()
+        self.forget()
+        self.file_storage.reload()
+        self.assertIsNotNone(self.file_storage.get(User, user.id))
+        self.assertIsNone(self.file_storage.get(User, torn.id))
+
+    def test_journal_compaction(self):
+        """
+        Test compact() in journal mode:
+        Verify that the journal is folded into the JSON file
+        once it passes journal_threshold.
+        """
+        FileStorage.journal = True
+        FileStorage.journal_threshold = 1
+        try:
+            user = User()
+            self.file_storage.save()
+        finally:
+            FileStorage.journal_threshold = 1024 * 1024
+        self.assertFalse(os.path.exists(self.file_storage.journal_path()))
+        with open(self.file_storage._FileStorage__file_path, "r") as file:
+            self.assertIn(f"User.{user.id}", json.load(file))
+
+    def test_lazy_reload(self):
+        """
+        Test reload() in lazy mode:
+        Verify that reload() only registers the keys from the index file
+        and that objects are built the first time they are accessed.
+        """
+        FileStorage.lazy = True
+        city = City()
+        city.name = "Lagos"
+        city.state_id = "state-1"
+        user = User()
+        self.file_storage.save()
+        self.assertTrue(os.path.exists(self.file_storage.index_path()))
+        self.file_storage.reload()
+        objects = self.file_storage.all()
+        self.assertIsInstance(objects, LazyDict)
+        city_key = f"City.{city.id}"
+        user_key = f"User.{user.id}"
+        self.assertIs(dict.get(objects, city_key), UNLOADED)
+        self.assertIn(user_key, objects)
+        self.assertEqual(objects[city_key].name, "Lagos")
+        self.assertIsNot(objects[city_key], city)
+        self.assertIs(dict.get(objects, user_key), UNLOADED)
+        found = self.file_storage.find(City, state_id="state-1")
+        self.assertEqual([obj.id for obj in found], [city.id])
+        objects[user_key].first_name = "Betty"
+        self.file_storage.save()
+        self.file_storage.reload()
+        self.assertEqual(objects[user_key].first_name, "Betty")
+        self.assertEqual(objects[city_key].name, "Lagos")
+
+    def test_lazy_reload_replaced_file(self):
+        """
+        Test reload() in lazy mode:
+        Verify that objects are still built from the snapshot reload()
+        read when another process replaced it, and that copies of all()
+        hold the objects, not placeholders.
+        """
+        FileStorage.lazy = True
+        user = User()
+        user.first_name = "Ada"
+        city = City()
+        city.name = "Lagos"
+        self.file_storage.save()
+        self.file_storage.reload()
+        path = self.file_storage._FileStorage__file_path
+        with open(f"{path}.tmp", "w") as file:
+            json.dump({"User.other": {
+                "id": "other", "__class__": "User", "first_name": "Other",
+                "created_at": "2023-08-08T12:34:56.789012",
+                "updated_at": "2023-08-08T12:34:56.789012"
+            }}, file, indent=4)
+        os.replace(f"{path}.tmp", path)
+        objects = self.file_storage.all()
+        self.assertEqual(objects[f"User.{user.id}"].first_name, "Ada")
+        self.assertIs(dict.get(objects, f"City.{city.id}"), UNLOADED)
+        self.file_storage.save()
+        with open(path) as file:
+            saved = json.load(file)
+        self.assertEqual(saved[f"City.{city.id}"]["name"], "Lagos")
+        self.assertEqual(objects[f"City.{city.id}"].name, "Lagos")
+        self.file_storage.reload()
+        for copy in (objects.copy(), {**objects}, dict(objects)):
+            self.assertNotIn(UNLOADED, copy.values())
+            self.assertEqual(copy[f"City.{city.id}"].name, "Lagos")
+
+    def test_query(self):
+        """
+        Test query() method:
+        Verify that the columns follow new(), attribute changes
+        and delete(), and match the objects.
+        """
+        cheap = Place()
+        cheap.price_by_night = 50
+        cheap.max_guest = 4
+        pricey = Place()
+        pricey.price_by_night = 300
+        pricey.max_guest = 4
+        where = {"price_by_night__lt": 100, "max_guest__gte": 4}
+        expected = sorted(self.file_storage.query(Place).where(**where))
+        self.assertIn(cheap.id, expected)
+        self.assertNotIn(pricey.id, expected)
+        FileStorage.columnar = True
+        self.assertEqual(
+            sorted(self.file_storage.query("Place").where(**where)), expected
+        )
+        pricey.price_by_night = 90
+        other = Place()
+        other.max_guest = 10
+        self.file_storage.delete(cheap)
+        ids = self.file_storage.query(Place).where(**where)
+        self.assertIn(pricey.id, ids)
+        self.assertIn(other.id, ids)
+        self.assertNotIn(cheap.id, ids)
+        self.assertEqual(self.file_storage.query(City).where(), [
+            obj.id for obj in self.file_storage.all(City).values()
+        ])
+
+    def test_nearby_and_within(self):
+        """
+        Test nearby() and within() methods:
+        Verify that the grid index follows new(), attribute changes
+        and delete().
+        """
+        lagos = Place()
+        lagos.latitude = 6.4541
+        lagos.longitude = 3.3947
+        ikeja = Place()
+        ikeja.latitude = 6.6018
+        ikeja.longitude = 3.3515
+        found = self.file_storage.nearby(6.5244, 3.3792, 20)
+        self.assertIn(lagos, found)
+        self.assertIn(ikeja, found)
+        self.assertEqual(
+            self.file_storage.nearby(6.5244, 3.3792, 20, limit=1), [lagos]
+        )
+        self.assertIn(ikeja, self.file_storage.within(6.5, 3.3, 6.7, 3.4))
+        self.assertNotIn(lagos, self.file_storage.within(6.5, 3.3, 6.7, 3.4))
+        ikeja.latitude = 48.85
+        self.assertNotIn(ikeja, self.file_storage.nearby(6.5244, 3.3792, 20))
+        self.file_storage.delete(lagos)
+        self.assertNotIn(lagos, self.file_storage.nearby(6.5244, 3.3792, 20))
+        abuja = Place()
+        abuja.latitude = 9.0765
+        abuja.longitude = 7.3986
+        self.assertIn(abuja, self.file_storage.nearby(9, 7.4, 10))
+
+    def test_search(self):
+        """
+        Test search() method:
+        Verify that the inverted index follows new(), attribute changes
+        and delete(), and that reload() reads it from its file.
+        """
+        review = Review()
+        review.text = "Lovely quokka sighting"
+        place = Place()
+        place.name = "Quokka lodge"
+        place.description = "Quokka quokka everywhere"
+        self.assertEqual(self.file_storage.search("quokka"), [place, review])
+        self.assertEqual(self.file_storage.search("quokka", Review), [review])
+        self.assertEqual(self.file_storage.search("quokka", page=2), [])
+        self.assertEqual(
+            self.file_storage.search("quokka", per_page=1, page=2), [review]
+        )
+        review.text = "Lovely wombat"
+        self.assertEqual(self.file_storage.search("wombat"), [review])
+        self.assertEqual(self.file_storage.search("quokka"), [place])
+        self.file_storage.save()
+        self.assertTrue(os.path.exists(self.file_storage.text_index_path()))
+        with patch("models.engine.file_storage.TextIndex.add") as add:
+            self.file_storage.reload()
+            found = self.file_storage.search("wombat")
+        add.assert_not_called()
+        self.assertEqual([obj.id for obj in found], [review.id])
+        self.file_storage.delete(place)
+        self.assertEqual(self.file_storage.search("lodge"), [])
+
+    def test_search_index_file(self):
+        """
+        Test search() method with the text index file:
+        Verify that reload() doesn't read the file, that the first
+        search() does without loading the objects in lazy mode, and
+        that a save changing no text only rewrites its stamp.
+        """
+        review = Review()
+        review.text = "Lovely quokka sighting"
+        other = Review()
+        other.text = "Grumpy wombat"
+        self.file_storage.search("quokka")
+        FileStorage.lazy = True
+        self.file_storage.save()
+        path = self.file_storage.text_index_path()
+        with open(path) as file:
+            docs = file.read()[64:]
+        review.place_id = "place-1"
+        self.file_storage.save()
+        with open(path) as file:
+            self.assertEqual(file.read()[64:], docs)
+        self.forget()
+        with patch("models.engine.file_storage.TextIndex") as text_index:
+            self.file_storage.reload()
+        text_index.assert_not_called()
+        found = self.file_storage.search("quokka")
+        self.assertEqual([obj.id for obj in found], [review.id])
+        self.assertEqual(found[0].place_id, "place-1")
+        self.assertIn(
+            f"Review.{other.id}", self.file_storage.all().unloaded()
+        )
+
+    def test_places_with(self):
+        """
+        Test link(), unlink() and places_with() methods:
+        Verify that the join index follows the amenity_ids of the places
+        and that the class-level amenity_ids list is never changed.
+        """
+        wifi = Amenity()
+        pool = Amenity()
+        both = Place()
+        only_wifi = Place()
+        self.file_storage.link(both, wifi)
+        self.file_storage.link(both, pool.id)
+        self.file_storage.link(both, pool)
+        self.file_storage.link(only_wifi, wifi)
+        self.assertEqual(Place.amenity_ids, [])
+        self.assertEqual(both.amenity_ids, [wifi.id, pool.id])
+        self.assertEqual(self.file_storage.places_with(wifi, pool), [both])
+        self.assertEqual(
+            self.file_storage.places_with(wifi),
+            sorted([both, only_wifi], key=lambda place: place.id)
+        )
+        self.file_storage.unlink(both, pool)
+        self.assertEqual(self.file_storage.places_with(wifi, pool), [])
+        only_wifi.amenity_ids = [pool.id]
+        self.assertEqual(self.file_storage.places_with(pool), [only_wifi])
+        self.file_storage.delete(only_wifi)
+        self.assertEqual(self.file_storage.places_with(pool), [])
+        self.assertEqual(self.file_storage.places_with(), [])
+
+    def test_thread_safe_stress(self):
+        """
+        Test thread_safe mode:
+        Verify that threads creating, updating, reading, querying
+        and saving at the same time neither fail nor lose changes.
+        """
+        FileStorage.thread_safe = True
+        FileStorage.columnar = True
+        for i in range(1000):
+            Place().number_rooms = i
+        # a storage querying the objects instead of the arrays
+        objects_query = FileStorage()
+        objects_query.columnar = False
+        errors = []
+        created = []
+        stop = threading.Event()
+
+        def writer():
+            try:
+                for i in range(200):
+                    place = Place()
+                    place.name = f"place {i}"
+                    place.number_rooms = i
+                    created.append(place)
+                    if i % 20 == 0:
+                        place.save()
+            except Exception as error:
+                errors.append(error)
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    for obj in self.file_storage.all().values():
+                        str(obj)
+                    self.file_storage.count(Place)
+                    self.file_storage.find(Place, number_rooms=3)
+            except Exception as error:
+                errors.append(error)
+
+        def querier():
+            try:
+                while not stop.is_set():
+                    query = self.file_storage.query(Place)
+                    query.where(number_rooms__gte=0)
+                    query.where(name="place 3")
+                    query.where(number_rooms__gte=0, name="place 3")
+                    objects_query.query(Place).where(number_rooms__gte=0)
+            except Exception as error:
+                errors.append(error)
+
+        def saver():
+            try:
+                while not stop.is_set():
+                    self.file_storage.save()
+            except Exception as error:
+                errors.append(error)
+
+        writers = [threading.Thread(target=writer) for _ in range(4)]
+        others = [threading.Thread(target=reader) for _ in range(2)]
+        others.append(threading.Thread(target=querier))
+        others.append(threading.Thread(target=saver))
+        for thread in writers + others:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in others:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.file_storage.save()
+        with open(self.file_storage._FileStorage__file_path) as file:
+            saved = json.load(file)
+        for place in created:
+            self.assertEqual(saved[f"Place.{place.id}"], place.to_dict())
+
+    def wait_for_file(self, timeout=5):
+        """
+        wait_for_file() method:
+        waits until the JSON file exists, returns its content
+        """
+        path = self.file_storage._FileStorage__file_path
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with open(path) as file:
+            return json.load(file)
+
+    def test_write_behind(self):
+        """
+        Test write_behind mode:
+        Verify that save() returns before writing, that the flusher
+        writes the changes within flush_interval_ms, coalesced into
+        one flush, and that flush() writes them right away.
+        """
+        FileStorage.write_behind = True
+        FileStorage.flush_interval_ms = 100
+        path = self.file_storage._FileStorage__file_path
+        metrics = self.file_storage.flush_metrics()
+        flushes, depth = metrics["flushes"], metrics["queue_depth"]
+        users = [User() for _ in range(5)]
+        for user in users:
+            user.save()
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.file_storage.flush_metrics()["queue_depth"],
+                         depth + 5)
+        saved = self.wait_for_file()
+        for user in users:
+            self.assertEqual(saved[f"User.{user.id}"], user.to_dict())
+        metrics = self.file_storage.flush_metrics()
+        self.assertEqual(metrics["flushes"], flushes + 1)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertGreater(metrics["max_flush_ms"], 0)
+        FileStorage.flush_interval_ms = 60000
+        user = User()
+        user.save()
+        self.file_storage.flush()
+        with open(path) as file:
+            self.assertIn(f"User.{user.id}", json.load(file))
+
+    def test_write_behind_threshold(self):
+        """
+        Test write_behind mode:
+        Verify that the flusher writes as soon as flush_threshold
+        objects are waiting, without waiting for flush_interval_ms.
+        """
+        FileStorage.write_behind = True
+        FileStorage.flush_interval_ms = 60000
+        FileStorage.flush_threshold = 3
+        models = [BaseModel() for _ in range(3)]
+        for model in models:
+            model.save()
+        saved = self.wait_for_file()
+        for model in models:
+            self.assertIn(f"BaseModel.{model.id}", saved)
+
+    def test_write_behind_failure(self):
+        """
+        Test write_behind mode:
+        Verify that a failed flush keeps the changes pending, counts
+        the failure and raises, and that the next flush writes them.
+        """
+        FileStorage.write_behind = True
+        FileStorage.flush_interval_ms = 60000
+        path = self.file_storage._FileStorage__file_path
+        failures = self.file_storage.flush_metrics()["failures"]
+        user = User()
+        user.save()
+        with patch.object(FileStorage, "_FileStorage__atomic_write",
+                          side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.file_storage.flush()
+        metrics = self.file_storage.flush_metrics()
+        self.assertEqual(metrics["failures"], failures + 1)
+        self.assertIn("disk full", metrics["last_error"])
+        self.assertGreater(metrics["queue_depth"], 0)
+        self.assertFalse(os.path.exists(path))
+        self.file_storage.flush()
+        with open(path) as file:
+            self.assertEqual(json.load(file)[f"User.{user.id}"],
+                             user.to_dict())
+
+    def test_write_behind_flush_waits(self):
+        """
+        Test write_behind mode:
+        Verify that flush() waits for a save in progress in the flusher
+        thread before it returns.
+        """
+        FileStorage.write_behind = True
+        FileStorage.flush_interval_ms = 1
+        path = self.file_storage._FileStorage__file_path
+        atomic_write = FileStorage._FileStorage__atomic_write
+        writing = threading.Event()
+
+        def slow_write(storage, *args, **kwargs):
+            writing.set()
+            time.sleep(0.3)
+            return atomic_write(storage, *args, **kwargs)
+
+        user = User()
+        with patch.object(FileStorage, "_FileStorage__atomic_write",
+                          slow_write):
+            user.save()
+            self.assertTrue(writing.wait(5))
+            self.file_storage.flush()
+            self.assertTrue(os.path.exists(path))
+        with open(path) as file:
+            self.assertIn(f"User.{user.id}", json.load(file))
+
+    def test_parallel_save(self):
+        """
+        Test parallel_workers:
+        Verify that a save encoded across processes writes
+        the same file as a save encoded in this process.
+        """
+        path = self.file_storage._FileStorage__file_path
+        for i in range(20):
+            place = Place()
+            place.name = f"place {i}"
+            place.number_rooms = i
+        self.file_storage.save()
+        with open(path) as file:
+            expected = json.load(file)
+        FileStorage._FileStorage__cache.clear()
+        FileStorage.parallel_workers = 2
+        FileStorage.parallel_threshold = 10
+        with patch("models.engine.parallel.encode",
+                   wraps=parallel.encode) as encode:
+            self.file_storage.save()
+        encode.assert_called_once()
+        with open(path) as file:
+            self.assertEqual(json.load(file), expected)
+
+    def forget(self):
+        """
+        forget() method:
+        empties FileStorage as if the process had just started
+        """
+        FileStorage._FileStorage__objects.clear()
+        FileStorage._FileStorage__by_class.clear()
+        FileStorage._FileStorage__by_attr.clear()
+        FileStorage._FileStorage__cache.clear()
+
+    def test_sharded_save(self):
+        """
+        Test sharded mode:
+        Verify that save() writes one file per class and only
+        rewrites the shard files of the changed objects.
+        """
+        FileStorage.sharded = True
+        self.forget()
+        user = User()
+        place = Place()
+        self.file_storage.save()
+        directory = self.file_storage.shards_path()
+        self.assertEqual(sorted(os.listdir(directory)),
+                         ["Place.json", "User.json"])
+        self.assertFalse(
+            os.path.exists(self.file_storage._FileStorage__file_path)
+        )
+        user_path = os.path.join(directory, "User.json")
+        os.utime(user_path, ns=(0, 0))
+        place.name = "Loft"
+        place.save()
+        self.assertEqual(os.stat(user_path).st_mtime_ns, 0)
+        with open(os.path.join(directory, "Place.json")) as file:
+            self.assertEqual(json.load(file)[f"Place.{place.id}"]["name"],
+                             "Loft")
+        self.file_storage.delete(place)
+        self.file_storage.save()
+        self.assertEqual(os.listdir(directory), ["User.json"])
+        self.forget()
+        self.file_storage.reload()
+        self.assertEqual(list(self.file_storage.all()), [f"User.{user.id}"])
+
+    def test_sharded_lazy_reload(self):
+        """
+        Test sharded lazy mode:
+        Verify that reload() reads no shard file and that the shard
+        files of a class are read on its first use, and before its
+        shard file is written.
+        """
+        FileStorage.sharded = True
+        self.forget()
+        user = User()
+        place = Place()
+        self.file_storage.save()
+        FileStorage.lazy = True
+        self.forget()
+        self.file_storage.reload()
+        self.assertEqual(len(FileStorage._FileStorage__objects), 0)
+        self.assertEqual(self.file_storage.get(User, user.id).id, user.id)
+        self.assertNotIn(f"Place.{place.id}",
+                         FileStorage._FileStorage__objects)
+        other = Place()
+        other.save()
+        with open(os.path.join(self.file_storage.shards_path(),
+                               "Place.json")) as file:
+            self.assertEqual(sorted(json.load(file)), sorted(
+                [f"Place.{place.id}", f"Place.{other.id}"]
+            ))
+        self.assertEqual(self.file_storage.count(), 3)
+
+    def test_sharded_buckets(self):
+        """
+        Test shard_buckets:
+        Verify that the objects of a class are split by id-hash bucket
+        and that a class written for another number of buckets
+        is rewritten whole.
+        """
+        FileStorage.sharded = True
+        self.forget()
+        users = [User() for _ in range(20)]
+        self.file_storage.save()
+        FileStorage.shard_buckets = 4
+        users[0].save()
+        directory = self.file_storage.shards_path()
+        names = sorted(os.listdir(directory))
+        self.assertNotIn("User.json", names)
+        self.assertTrue(all(shards.is_shard_name(name, 4) for name in names))
+        self.forget()
+        self.file_storage.reload()
+        self.assertEqual(sorted(self.file_storage.all()),
+                         sorted(f"User.{user.id}" for user in users))
+
+    def test_sharded_other_modes(self):
+        """
+        Test sharded mode:
+        Verify that it can't be combined with the journal.
+        """
+        FileStorage.sharded = True
+        FileStorage.journal = True
+        with self.assertRaises(ValueError):
+            self.file_storage.save()
+
+    def test_compression(self):
+        """
+        Test compression:
+        Verify that the snapshot is compressed with each codec
+        available and read back from it.
+        """
+        user = User()
+        user.email = "compressed@hbnb.io"
+        for name in compressed.available():
+            FileStorage.compression = name
+            self.file_storage.save()
+            path = self.file_storage.snapshot_path()
+            self.assertTrue(path.endswith(compressed.EXTENSIONS[name]))
+            with compressed.open_text(path, name) as file:
+                saved = json.load(file)
+            self.assertEqual(saved[f"User.{user.id}"], user.to_dict())
+            self.forget()
+            self.file_storage.reload()
+            self.assertEqual(
+                self.file_storage.get(User, user.id).email,
+                "compressed@hbnb.io"
+            )
+
+    def test_compression_migration(self):
+        """
+        Test compression:
+        Verify that an uncompressed file.json is read when compression
+        is turned on, and that a path ending with .gz is compressed.
+        """
+        user = User()
+        self.file_storage.save()
+        FileStorage.compression = "gzip"
+        self.forget()
+        self.file_storage.reload()
+        self.assertIsNotNone(self.file_storage.get(User, user.id))
+        self.file_storage.save()
+        self.assertTrue(os.path.exists("file.json.gz"))
+        FileStorage.compression = None
+        FileStorage._FileStorage__file_path = "file.json.gz"
+        try:
+            self.assertEqual(self.file_storage.snapshot_path(),
+                             "file.json.gz")
+            self.forget()
+            self.file_storage.reload()
+            self.assertIsNotNone(self.file_storage.get(User, user.id))
+        finally:
+            FileStorage._FileStorage__file_path = "file.json"
+
+    def test_compression_stale(self):
+        """
+        Test compression:
+        Verify that file.json is removed once the compressed snapshot is
+        written, and that the newest snapshot is read when compression
+        is turned off or back on.
+        """
+        user = User()
+        user.email = "v1@hbnb.io"
+        self.file_storage.save()
+        FileStorage.compression = "gzip"
+        user.email = "v2@hbnb.io"
+        self.file_storage.save()
+        self.assertFalse(os.path.exists("file.json"))
+        FileStorage.compression = None
+        self.forget()
+        self.file_storage.reload()
+        user = self.file_storage.get(User, user.id)
+        self.assertEqual(user.email, "v2@hbnb.io")
+        user.email = "v3@hbnb.io"
+        self.file_storage.save()
+        self.assertTrue(os.path.exists("file.json.gz"))
+        FileStorage.compression = "gzip"
+        self.forget()
+        self.file_storage.reload()
+        self.assertEqual(
+            self.file_storage.get(User, user.id).email, "v3@hbnb.io"
+        )
+
+    def test_compact_reload(self):
+        """
+        Test reload() in compact mode:
+        Verify that the reloaded objects share their ids and timestamps,
+        print the same as before and that their JSON text is not kept.
+        """
+        FileStorage.compact_objects = True
+        place = Place()
+        place.city_id = "city-compact"
+        other = Place()
+        other.city_id = "city-compact"
+        self.file_storage.save()
+        self.file_storage.reload()
+        reloaded = self.file_storage.get(Place, place.id)
+        self.assertIsNot(reloaded, place)
+        self.assertEqual(str(reloaded), str(place))
+        self.assertEqual(reloaded.to_dict(), place.to_dict())
+        self.assertIs(
+            reloaded.city_id, self.file_storage.get(Place, other.id).city_id
+        )
+        self.assertIs(reloaded.updated_at, reloaded.created_at)
+        self.assertNotIn(
+            f"Place.{place.id}", FileStorage._FileStorage__cache
+        )
+
+    def test_lazy_reload_without_index(self):
+        """
+        Test reload() in lazy mode without an up to date index file:
+        Verify that reload() falls back to loading every object.
+        """
+        user = User()
+        self.file_storage.save()
+        FileStorage.lazy = True
+        self.file_storage.reload()
+        objects = self.file_storage.all()
+        self.assertIsNot(dict.get(objects, f"User.{user.id}"), UNLOADED)
+
+    def test_binary_snapshot(self):
+        """
+        Test save() and reload() with snapshot_format "binary":
+        Verify that the binary snapshot is memory-mapped on reload()
+        and that objects are built the first time they are accessed.
+        """
+        FileStorage.snapshot_format = "binary"
+        place = Place()
+        place.name = "Lekki"
+        place.city_id = "city-1"
+        user = User()
+        self.file_storage.save()
+        path = self.file_storage.snapshot_path()
+        self.assertTrue(path.endswith(".hbnb"))
+        self.assertTrue(os.path.exists(path))
+        self.file_storage.reload()
+        objects = self.file_storage.all()
+        place_key = f"Place.{place.id}"
+        self.assertIs(dict.get(objects, place_key), UNLOADED)
+        self.assertEqual(str(objects[place_key]), str(place))
+        self.assertEqual(
+            self.file_storage.find(Place, city_id="city-1")[0].id, place.id
+        )
+        objects[place_key].name = "Ikoyi"
+        self.file_storage.save()
+        self.file_storage.reload()
+        self.assertEqual(objects[place_key].name, "Ikoyi")
+        self.assertEqual(
+            objects[f"User.{user.id}"].created_at, user.created_at
+        )
+
+    def test_batch_saves_once(self):
+        """
+        Test batch() method:
+        Verify that the saves made inside a batch are done once,
+        when it ends.
+        """
+        user = User()
+        with patch.object(
+            FileStorage, "compact", autospec=True,
+            side_effect=FileStorage.compact
+        ) as compact:
+            with self.file_storage.batch():
+                user.first_name = "Betty"
+                user.save()
+                user.last_name = "Bar"
+                user.save()
+                with self.file_storage.batch():
+                    user.save()
+                compact.assert_not_called()
+        compact.assert_called_once()
+        with open(self.file_storage._FileStorage__file_path, "r") as file:
+            data = json.load(file)[f"User.{user.id}"]
+        self.assertEqual(data["last_name"], "Bar")
+
+    def test_batch_rollback(self):
+        """
+        Test batch() method with an exception:
+        Verify that the objects created, changed or deleted in the batch
+        are restored and that nothing is saved.
+        """
+        city = City()
+        city.state_id = "state-a"
+        self.file_storage.save()
+        unsaved = User()
+        unsaved.first_name = "Betty"
+        place = Place()
+        self.file_storage.save()
+        with self.assertRaises(RuntimeError):
+            with self.file_storage.batch():
+                city.state_id = "state-b"
+                city.name = "Lagos"
+                unsaved.first_name = "Holberton"
+                self.file_storage.delete(place)
+                created = State()
+                self.file_storage.save()
+                raise RuntimeError
+        objects = self.file_storage.all()
+        self.assertIs(objects[f"City.{city.id}"], city)
+        self.assertEqual(city.state_id, "state-a")
+        self.assertNotIn("name", city.__dict__)
+        self.assertEqual(self.file_storage.find(City, state_id="state-a"),
+                         [city])
+        self.assertEqual(unsaved.first_name, "Betty")
+        self.assertIs(objects[f"Place.{place.id}"], place)
+        self.assertNotIn(f"State.{created.id}", objects)
+
+    def test_batch_rollback_journal(self):
+        """
+        Test batch() method with an exception in journal mode:
+        Verify that objects loaded by the journal replay (which have
+        no serialized form kept) are restored too.
+        """
+        FileStorage.journal = True
+        user = User()
+        user.first_name = "Betty"
+        self.file_storage.save()
+        self.forget()
+        self.file_storage.reload()
+        user = self.file_storage.get(User, user.id)
+        with self.assertRaises(RuntimeError):
+            with self.file_storage.batch():
+                user.first_name = "changed"
+                user.nickname = "bee"
+                user.save()
+                raise RuntimeError
+        self.assertEqual(user.first_name, "Betty")
+        self.assertNotIn("nickname", user.__dict__)
+
+    def test_batch_rollback_class_default(self):
+        """
+        Test batch() method with an exception:
+        Verify that an attribute set to the value of the class default
+        is restored instead of removed.
+        """
+        user = User()
+        user.email = ""
+        self.file_storage.save()
+        with self.assertRaises(RuntimeError):
+            with self.file_storage.batch():
+                user.email = "changed@hbnb.io"
+                raise RuntimeError
+        self.assertEqual(user.to_dict()["email"], "")
+
+    def test_batch_per_thread(self):
+        """
+        Test batch() method in thread_safe mode:
+        Verify that the saves and changes of another thread are not
+        part of the batch of a thread, and that its rollback is written
+        again when the other thread saved its changes meanwhile.
+        """
+        FileStorage.thread_safe = True
+        mine = User()
+        mine.first_name = "Betty"
+        theirs = User()
+        self.file_storage.save()
+        changed = threading.Event()
+
+        def other_thread():
+            changed.wait()
+            theirs.first_name = "Other"
+            theirs.save()
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        with self.assertRaises(RuntimeError):
+            with self.file_storage.batch():
+                mine.first_name = "changed"
+                changed.set()
+                thread.join()
+                raise RuntimeError
+        self.assertEqual(mine.first_name, "Betty")
+        self.assertEqual(theirs.first_name, "Other")
+        self.file_storage.save()
+        with open(self.file_storage._FileStorage__file_path) as file:
+            saved = json.load(file)
+        self.assertEqual(saved[f"User.{mine.id}"]["first_name"], "Betty")
+        self.assertEqual(saved[f"User.{theirs.id}"]["first_name"], "Other")
+
     def test_attr(self):
         """
         Test FileStorage class attributes
@@ -144,5 +1263,141 @@ class TestFileStorage(unittest.TestCase):
         self.assertGreater(len(FileStorage.reload.__doc__), 5)
 
 
+@unittest.skipIf(not isinstance(models.storage, FileStorage),
+                 "the storage engine is not FileStorage")
+class TestSharedFileStorage(unittest.TestCase):
+    """
+    FileStorage shared mode Test class:
+    several processes working on the same file
+    """
+
+    state = (
+        "objects", "by_class", "by_attr", "cache", "dirty", "deleted",
+        "file_path", "stamp", "journal_offset"
+    )
+    worker = (
+        "import sys\n"
+        "from models import storage\n"
+        "from models.user import User\n"
+        "for i in range(int(sys.argv[1])):\n"
+        "    User().save()\n"
+        "if len(sys.argv) > 2:\n"
+        "    user = storage.get(User, sys.argv[2])\n"
+        "    user.first_name = 'Worker'\n"
+        "    user.save()\n"
+    )
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Point FileStorage at an empty file in a temporary directory
+        """
+        self.saved = {
+            name: getattr(FileStorage, f"_FileStorage__{name}")
+            for name in self.state
+        }
+        for name in ("objects", "by_class", "by_attr", "cache"):
+            setattr(FileStorage, f"_FileStorage__{name}", {})
+        for name in ("dirty", "deleted"):
+            setattr(FileStorage, f"_FileStorage__{name}", set())
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        FileStorage._FileStorage__file_path = os.path.join(
+            self.tmp_dir.name, "file.json"
+        )
+        FileStorage.shared = True
+        self.file_storage = FileStorage()
+        self.file_storage.reload()
+
+    def tearDown(self):
+        """
+        tearDown() instance method:
+        Restore FileStorage and remove the temporary directory
+        """
+        FileStorage.shared = False
+        FileStorage.journal = False
+        for name, value in self.saved.items():
+            setattr(FileStorage, f"_FileStorage__{name}", value)
+        self.tmp_dir.cleanup()
+
+    def run_workers(self, *args_list):
+        """
+        run_workers() method:
+        runs a worker process in the temporary directory for each
+        list of arguments, all at the same time
+        """
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__))
+        )))
+        env = dict(
+            os.environ, PYTHONPATH=root, HBNB_STORAGE_SHARED="1",
+            HBNB_TYPE_STORAGE=""
+        )
+        if FileStorage.journal:
+            env["HBNB_STORAGE_JOURNAL"] = "1"
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-c", self.worker, *args],
+                cwd=self.tmp_dir.name, env=env
+            )
+            for args in args_list
+        ]
+        for worker in workers:
+            self.assertEqual(worker.wait(timeout=60), 0)
+
+    def test_concurrent_writers(self):
+        """
+        Test save() in shared mode:
+        Verify that processes saving at the same time
+        don't lose each other's objects.
+        """
+        for journal in (False, True):
+            FileStorage.journal = journal
+            user = User()
+            self.file_storage.save()
+            self.run_workers(["20"], ["20"], ["20"], ["20"])
+            self.file_storage.refresh()
+            self.assertEqual(
+                self.file_storage.count(User), 81 + journal * 81
+            )
+            self.assertIs(self.file_storage.get(User, user.id), user)
+
+    def test_refresh_merges_by_updated_at(self):
+        """
+        Test refresh() in shared mode:
+        Verify that changes saved by another process are merged,
+        except over local changes saved after them.
+        """
+        clean = User()
+        mine = User()
+        self.file_storage.save()
+        self.run_workers(["1", clean.id], ["0", mine.id])
+        mine.first_name = "Mine"
+        mine.save()
+        self.assertEqual(self.file_storage.get(User, clean.id).first_name,
+                         "Worker")
+        self.assertEqual(self.file_storage.count(User), 3)
+        self.assertEqual(mine.first_name, "Mine")
+        self.file_storage.reload()
+        self.assertEqual(
+            self.file_storage.get(User, mine.id).first_name, "Mine"
+        )
+
+    def test_refresh_sees_deletes(self):
+        """
+        Test refresh() in shared mode:
+        Verify that objects deleted by another process are removed
+        and that nothing is read when the files didn't change.
+        """
+        user = User()
+        self.file_storage.save()
+        with open(self.file_storage._FileStorage__file_path, "w") as file:
+            file.write("{}")
+        self.file_storage.refresh()
+        self.assertIsNone(self.file_storage.get(User, user.id))
+        with patch("models.engine.file_storage.iter_items") as read:
+            self.file_storage.refresh()
+        read.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
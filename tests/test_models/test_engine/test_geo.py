@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+"""
+Geospatial index Test Module
+"""
+
+
+from models.engine.geo import GridIndex, haversine, lon_ranges
+from models.place import Place
+import random
+import unittest
+
+
+class TestGeo(unittest.TestCase):
+    """
+    GridIndex Test class
+    """
+
+    def place(self, place_id, lat, lon):
+        """
+        place() method:
+        returns a Place located at (lat, lon)
+        """
+        return Place(
+            id=place_id, created_at="2023-08-08T12:34:56.789",
+            updated_at="2023-08-08T12:34:56.789", latitude=lat, longitude=lon
+        )
+
+    def test_haversine(self):
+        """
+        Test haversine() function:
+        Verify a known distance (Lagos to Abuja, about 525 km).
+        """
+        self.assertAlmostEqual(
+            haversine(6.5244, 3.3792, 9.0765, 7.3986), 525, delta=5
+        )
+        self.assertEqual(haversine(1, 2, 1, 2), 0)
+
+    def test_lon_ranges(self):
+        """
+        Test lon_ranges() function:
+        Verify that ranges crossing the antimeridian are split.
+        """
+        self.assertEqual(lon_ranges(-10, 10), [(-10, 10)])
+        self.assertEqual(lon_ranges(170, -170), [(170, 180), (-180, -170)])
+        self.assertEqual(lon_ranges(-190, -170), [(170, 180), (-180, -170)])
+        self.assertEqual(lon_ranges(-200, 200), [(-180, 180)])
+
+    def test_matches_full_scan(self):
+        """
+        Test nearby() and within() methods:
+        Verify that they find the same points as a full scan,
+        near the poles and the antimeridian too.
+        """
+        rand = random.Random(42)
+        places = [
+            self.place(str(i), rand.uniform(-90, 90), rand.uniform(-180, 180))
+            for i in range(3000)
+        ]
+        index = GridIndex(5, places)
+        for lat, lon, radius in (
+            (0, 0, 1500), (89, 10, 800), (-10, 179.5, 2000), (45, -60, 50)
+        ):
+            expected = sorted(
+                (haversine(lat, lon, p.latitude, p.longitude), p.id)
+                for p in places
+                if haversine(lat, lon, p.latitude, p.longitude) <= radius
+            )
+            self.assertEqual(index.nearby(lat, lon, radius), expected)
+            self.assertEqual(
+                index.nearby(lat, lon, radius, limit=3), expected[:3]
+            )
+        expected = sorted(
+            p.id for p in places
+            if 10 <= p.latitude <= 30 and (
+                p.longitude >= 170 or p.longitude <= -175
+            )
+        )
+        self.assertEqual(sorted(index.within(10, 170, 30, -175)), expected)
+
+    def test_add_and_remove(self):
+        """
+        Test add() and remove() methods:
+        Verify that points move and disappear, and that invalid
+        coordinates are not indexed.
+        """
+        place = self.place("p", 10, 10)
+        index = GridIndex(objects=[place, self.place("q", "x", 10)])
+        self.assertEqual(len(index), 1)
+        place.__dict__["latitude"] = -10
+        index.add(place)
+        self.assertEqual(index.within(-11, 9, -9, 11), ["p"])
+        self.assertEqual(index.within(9, 9, 11, 11), [])
+        index.remove("p")
+        index.remove("p")
+        self.assertEqual((len(index), index.cells), (0, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
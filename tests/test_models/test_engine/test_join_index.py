@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+"""
+Join index Test Module
+"""
+
+
+from models.engine.join_index import JoinIndex
+import unittest
+
+
+class TestJoinIndex(unittest.TestCase):
+    """
+    JoinIndex Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create an index of places and their amenities
+        """
+        self.index = JoinIndex()
+        self.index.set("place-1", ["wifi", "pool"])
+        self.index.set("place-2", ["wifi"])
+        self.index.set("place-3", ["wifi", "pool", "gym"])
+
+    def test_both_directions(self):
+        """
+        Test of_left() and of_right() methods:
+        Verify that links are seen from both sides.
+        """
+        self.assertEqual(self.index.of_left("place-1"), {"wifi", "pool"})
+        self.assertEqual(self.index.of_right("pool"), {"place-1", "place-3"})
+        self.assertEqual(self.index.of_right("sauna"), set())
+        self.assertEqual(len(self.index), 6)
+
+    def test_with_all(self):
+        """
+        Test with_all() method:
+        Verify that the left ids linked to every right id are found.
+        """
+        self.assertEqual(
+            self.index.with_all(["wifi", "pool"]), {"place-1", "place-3"}
+        )
+        self.assertEqual(self.index.with_all(["gym", "wifi"]), {"place-3"})
+        self.assertEqual(self.index.with_all(["gym", "sauna"]), set())
+        self.assertEqual(self.index.with_all([]), set())
+
+    def test_add_remove_set(self):
+        """
+        Test add(), remove() and set() methods:
+        Verify that both directions stay in sync and drop empty sets.
+        """
+        self.index.add("place-2", "pool")
+        self.assertIn("place-2", self.index.of_right("pool"))
+        self.index.remove("place-3", "gym")
+        self.index.remove("place-3", "gym")
+        self.assertNotIn("gym", self.index.rights)
+        self.index.set("place-1", [])
+        self.assertNotIn("place-1", self.index.lefts)
+        self.assertEqual(self.index.of_right("wifi"), {"place-2", "place-3"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+"""
+JSON backend Test Module
+"""
+
+
+from models.engine import json_backend
+from models.engine.json_backend import Backend
+from models.place import Place
+import json
+import math
+import unittest
+
+
+class TestJSONBackend(unittest.TestCase):
+    """
+    JSON backend Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Remember the current backend before each test
+        """
+        self.current = json_backend.current
+
+    def tearDown(self):
+        """
+        tearDown() instance method:
+        Restore the current backend after each test
+        """
+        json_backend.current = self.current
+
+    def test_round_trip(self):
+        """
+        Test the installed backends:
+        Verify that each one reads back what every one writes,
+        including the ISO timestamps of to_dict().
+        """
+        place = Place()
+        place.name = "Café / Loft ☃"
+        place.amenity_ids = ["a", "b"]
+        place.latitude = 37.7749
+        obj_dict = place.to_dict()
+        backends = [Backend(name) for name in json_backend.available()]
+        for writer in backends:
+            text = writer.dumps(obj_dict)
+            self.assertIsInstance(text, str)
+            for reader in backends:
+                self.assertEqual(reader.loads(text), obj_dict)
+                self.assertEqual(reader.loads(text.encode("utf-8")),
+                                 obj_dict)
+
+    def test_fallback(self):
+        """
+        Test dumps() method:
+        Verify that values a library can't encode are encoded
+        by the json module.
+        """
+        for name in json_backend.available():
+            text = Backend(name).dumps({"big": 2 ** 70})
+            self.assertEqual(json.loads(text), {"big": 2 ** 70})
+
+    def test_non_finite(self):
+        """
+        Test dumps() and loads() methods:
+        Verify that NaN and infinite floats are read back as they were
+        written, whichever backends write and read them.
+        """
+        obj_dict = {"latitude": float("nan"), "longitude": float("-inf"),
+                    "values": [float("inf")], "name": None}
+        backends = [Backend(name) for name in json_backend.available()]
+        for writer in backends:
+            text = writer.dumps(obj_dict)
+            for reader in backends:
+                loaded = reader.loads(text)
+                self.assertTrue(math.isnan(loaded["latitude"]))
+                self.assertEqual(loaded["longitude"], float("-inf"))
+                self.assertEqual(loaded["values"], [float("inf")])
+                self.assertIsNone(loaded["name"])
+
+    def test_invalid(self):
+        """
+        Test loads() method:
+        Verify that invalid JSON raises a ValueError.
+        """
+        for name in json_backend.available():
+            with self.assertRaises(ValueError):
+                Backend(name).loads('{"id": ')
+
+    def test_select(self):
+        """
+        Test select() function:
+        Verify that the json module is always available, that "auto"
+        picks the first installed backend and that unknown names
+        are refused.
+        """
+        self.assertIn("json", json_backend.available())
+        self.assertEqual(json_backend.select("json").name, "json")
+        self.assertEqual(json_backend.dumps({"a": 1}), '{"a": 1}')
+        self.assertEqual(json_backend.select().name,
+                         json_backend.available()[0])
+        with self.assertRaises(ValueError):
+            json_backend.select("yaml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""
+JSON streaming Test Module
+"""
+
+
+from io import StringIO
+from models.engine.json_stream import iter_items
+import json
+import unittest
+
+
+class TestIterItems(unittest.TestCase):
+    """
+    iter_items() Test class
+    """
+
+    def test_items(self):
+        """
+        Test iter_items() function:
+        Verify that every member is yielded in order with its JSON text,
+        whatever the chunk size.
+        """
+        data = {
+            "User.1": {"id": "1", "name": 'a "quoted" {name}'},
+            "Place.2": {"id": "2", "amenity_ids": ["x", "y"], "n": 12345},
+        }
+        text = json.dumps(data, indent=2)
+        for chunk_size in (1, 3, 7, 65536):
+            items = list(iter_items(StringIO(text), chunk_size))
+            self.assertEqual([key for key, _, _ in items], list(data))
+            for key, value, raw in items:
+                self.assertEqual(value, data[key])
+                self.assertEqual(json.loads(raw), data[key])
+
+    def test_empty_object(self):
+        """
+        Test iter_items() function on an empty object:
+        Verify that nothing is yielded.
+        """
+        self.assertEqual(list(iter_items(StringIO(" { } "))), [])
+
+    def test_invalid_documents(self):
+        """
+        Test iter_items() function on invalid documents:
+        Verify that empty, truncated or non-object documents raise
+        like json.load() does.
+        """
+        for text in ("", '{"User.1": {"id": "1"', '["User.1"]', '{"a" 1}'):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_items(StringIO(text), 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+"""
+Object cache Test Module
+"""
+
+
+from models.engine.object_cache import ObjectCache, sizeof
+from models.base_model import BaseModel
+import unittest
+
+
+class TestObjectCache(unittest.TestCase):
+    """
+    ObjectCache Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create the objects to cache and the list of evictions
+        """
+        self.objs = {f"BaseModel.{i}": BaseModel() for i in range(5)}
+        self.evicted = []
+
+    def on_evict(self, key, obj):
+        """
+        on_evict() method:
+        records an eviction
+        """
+        self.evicted.append(key)
+
+    def fill(self, cache, keys):
+        """
+        fill() method:
+        puts the objects of keys in cache
+        """
+        for key in keys:
+            cache.put(key, self.objs[key])
+
+    def test_lru(self):
+        """
+        Test the lru policy:
+        Verify that the least recently used object is evicted.
+        """
+        cache = ObjectCache(max_entries=2, on_evict=self.on_evict)
+        self.fill(cache, ["BaseModel.0", "BaseModel.1"])
+        self.assertIs(cache.get("BaseModel.0"), self.objs["BaseModel.0"])
+        self.fill(cache, ["BaseModel.2"])
+        self.assertEqual(self.evicted, ["BaseModel.1"])
+        self.assertIsNone(cache.get("BaseModel.1"))
+        self.assertEqual(cache.stats(), {
+            "hits": 1, "misses": 1, "evictions": 1, "entries": 2,
+            "bytes": 0
+        })
+
+    def test_lfu(self):
+        """
+        Test the lfu policy:
+        Verify that the least frequently used object is evicted,
+        the least recently used first among equals.
+        """
+        cache = ObjectCache(max_entries=3, policy="lfu",
+                            on_evict=self.on_evict)
+        self.fill(cache, ["BaseModel.0", "BaseModel.1", "BaseModel.2"])
+        for _ in range(2):
+            cache.get("BaseModel.0")
+        cache.get("BaseModel.1")
+        cache.get("BaseModel.2")
+        self.fill(cache, ["BaseModel.3", "BaseModel.4"])
+        self.assertEqual(self.evicted, ["BaseModel.1", "BaseModel.3"])
+        self.assertIn("BaseModel.0", cache)
+        self.assertIn("BaseModel.2", cache)
+
+    def test_bytes(self):
+        """
+        Test max_bytes:
+        Verify that the estimated bytes stay within the budget
+        and that an object bigger than it is still cached.
+        """
+        size = sizeof(self.objs["BaseModel.0"])
+        cache = ObjectCache(max_bytes=size * 2, on_evict=self.on_evict)
+        self.fill(cache, self.objs)
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.bytes, size * 2)
+        big = BaseModel()
+        big.text = "x" * size * 4
+        cache.put("BaseModel.big", big)
+        self.assertEqual(len(cache), 1)
+        self.assertIs(cache.get("BaseModel.big"), big)
+
+    def test_discard(self):
+        """
+        Test discard() and clear() methods:
+        Verify that the objects are removed without eviction.
+        """
+        cache = ObjectCache(max_entries=3, policy="lfu",
+                            on_evict=self.on_evict)
+        self.fill(cache, ["BaseModel.0", "BaseModel.1"])
+        cache.discard("BaseModel.0")
+        cache.discard("BaseModel.0")
+        self.assertNotIn("BaseModel.0", cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(self.evicted, [])
+
+    def test_policy(self):
+        """
+        Test __init__() method:
+        Verify that an unknown policy is refused.
+        """
+        with self.assertRaises(ValueError):
+            ObjectCache(policy="fifo")
+
+
+if __name__ == "__main__":
+    unittest.main()
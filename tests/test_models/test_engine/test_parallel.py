@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""
+Parallel encoding Test Module
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor
+from models.engine import binary_snapshot, parallel
+from models.user import User
+import json
+import unittest
+from unittest.mock import patch
+
+
+class TestParallel(unittest.TestCase):
+    """
+    Parallel encoding Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create the users to encode before each test
+        """
+        self.users = [User() for _ in range(25)]
+        for i, user in enumerate(self.users):
+            user.email = f"user{i}@hbnb.io"
+
+    def test_encode_json(self):
+        """
+        Test encode() function:
+        Verify that the JSON texts come back in order.
+        """
+        texts = parallel.encode(self.users, "json", 2)
+        self.assertEqual([json.loads(text) for text in texts], [
+            user.to_dict() for user in self.users
+        ])
+
+    def test_encode_binary(self):
+        """
+        Test encode() function:
+        Verify that the binary payloads come back in order.
+        """
+        payloads = parallel.encode(self.users, "binary", 2)
+        self.assertEqual(payloads, [
+            binary_snapshot.encode(user) for user in self.users
+        ])
+
+    def test_encode_inherited(self):
+        """
+        Test encode() function:
+        Verify that the objects are inherited by the workers
+        instead of being sent to them.
+        """
+        with patch.object(ProcessPoolExecutor, "submit", autospec=True,
+                          side_effect=ProcessPoolExecutor.submit) as submit:
+            texts = parallel.encode(self.users, "json", 2)
+        self.assertEqual(len(texts), len(self.users))
+        self.assertGreater(submit.call_count, 1)
+        for call in submit.call_args_list:
+            self.assertNotIn("User", repr(call.args[2:]))
+        self.assertIsNone(parallel._shared)
+
+    def test_encode_nothing(self):
+        """
+        Test encode() function:
+        Verify that no object gives an empty list.
+        """
+        self.assertEqual(parallel.encode([], "json", 2), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
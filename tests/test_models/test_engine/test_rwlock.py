@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""
+Reader-writer lock Test Module
+"""
+
+
+from models.engine.rwlock import RWLock
+import threading
+import time
+import unittest
+
+
+class TestRWLock(unittest.TestCase):
+    """
+    RWLock Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create a new lock before each test
+        """
+        self.lock = RWLock()
+
+    def test_readers_share(self):
+        """
+        Test reading() method:
+        Verify that several threads can read at the same time.
+        """
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read():
+            with self.lock.reading():
+                barrier.wait()
+
+        threads = [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        for thread in threads:
+            thread.join()
+
+    def test_writer_excludes(self):
+        """
+        Test writing() method:
+        Verify that a writer waits for the readers and blocks them.
+        """
+        events = []
+
+        def write():
+            with self.lock.writing():
+                events.append("write")
+
+        with self.lock.reading():
+            writer = threading.Thread(target=write)
+            writer.start()
+            time.sleep(0.05)
+            events.append("read")
+        writer.join(5)
+        self.assertEqual(events, ["read", "write"])
+
+    def test_reentrant(self):
+        """
+        Test reading() and writing() methods:
+        Verify that the writer can write and read again,
+        and that a reader can't start writing.
+        """
+        with self.lock.writing():
+            with self.lock.writing():
+                with self.lock.reading():
+                    pass
+        with self.lock.reading():
+            with self.lock.reading():
+                with self.assertRaises(RuntimeError):
+                    with self.lock.writing():
+                        pass
+        with self.lock.writing():
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()
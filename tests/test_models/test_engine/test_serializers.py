@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+"""
+Serializers Test Module
+"""
+
+
+from models.engine import serializers
+from models.base_model import BaseModel
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.review import Review
+from datetime import datetime
+import tracemalloc
+import unittest
+
+
+class Custom(BaseModel):
+    """
+    Custom class:
+    a model overriding to_dict() and __init__()
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        __init__() method:
+        Initialize like BaseModel and record the call
+        """
+        super().__init__(*args, **kwargs)
+        self.built = True
+
+    def to_dict(self):
+        """
+        to_dict() method:
+        returns the to_dict() of BaseModel without built
+        """
+        obj_dict = super().to_dict()
+        obj_dict.pop("built", None)
+        return obj_dict
+
+
+class TestSerializers(unittest.TestCase):
+    """
+    Serializers Test class
+    """
+
+    def test_round_trip(self):
+        """
+        Test encode() and decode() functions:
+        Verify that every class is encoded like to_dict()
+        and decoded like cls(**obj_dict).
+        """
+        for cls in FileStorage.classes_dict.values():
+            obj = cls()
+            obj.name = "Holberton"
+            obj.updated_at = datetime.now()
+            obj_dict = serializers.encode(obj)
+            self.assertEqual(obj_dict, obj.to_dict())
+            decoded = serializers.decode(cls, obj_dict)
+            self.assertIs(type(decoded), cls)
+            self.assertEqual(decoded.__dict__, cls(**obj_dict).__dict__)
+
+    def test_shared_timestamps(self):
+        """
+        Test decode() function:
+        Verify that equal timestamps are parsed once and shared,
+        and that integer timestamps are accepted.
+        """
+        obj_dict = Place().to_dict()
+        obj_dict["updated_at"] = obj_dict["created_at"]
+        place = serializers.decode(Place, obj_dict)
+        self.assertIs(place.updated_at, place.created_at)
+        self.assertIs(serializers.decode(Place, obj_dict).created_at,
+                      place.created_at)
+        self.assertEqual(serializers.encode(place), obj_dict)
+        obj_dict["created_at"] = 1
+        self.assertEqual(
+            serializers.decode(Place, obj_dict).created_at,
+            datetime(1970, 1, 1, 0, 0, 0, 1)
+        )
+
+    def test_shared_keys(self):
+        """
+        Test decode() function:
+        Verify that the decoded objects share the keys of their __dict__:
+        they use less memory than objects whose __dict__ is updated
+        at once.
+        """
+        codec = serializers.codec(Review)
+        obj_dicts = []
+        for i in range(1000):
+            timestamp = f"2023-08-08T12:34:56.{i:06d}"
+            obj_dicts.append(Review(
+                id=str(i), created_at=timestamp, updated_at=timestamp,
+                place_id="place", user_id="user", text="Great"
+            ).to_dict())
+        # parse the timestamps once, so that decoding doesn't allocate
+        for obj_dict in obj_dicts:
+            codec.decode(obj_dict)
+
+        def updated(obj_dict):
+            """returns a Review whose __dict__ is updated at once"""
+            obj = object.__new__(Review)
+            obj.__dict__.update(obj_dict)
+            del obj.__dict__["__class__"]
+            return obj
+
+        sizes = []
+        for build in (updated, codec.decode):
+            tracemalloc.start()
+            objs = [build(obj_dict) for obj_dict in obj_dicts]
+            sizes.append(tracemalloc.get_traced_memory()[0])
+            tracemalloc.stop()
+            del objs
+        self.assertLess(sizes[1], sizes[0] * 0.9)
+
+    def test_overrides(self):
+        """
+        Test codec() function:
+        Verify that a class overriding to_dict() or __init__()
+        keeps them.
+        """
+        obj = Custom()
+        obj_dict = serializers.encode(obj)
+        self.assertNotIn("built", obj_dict)
+        self.assertTrue(serializers.decode(Custom, obj_dict).built)
+        self.assertIs(serializers.codec(Custom), serializers.codec(Custom))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""
+Shards Test Module
+"""
+
+
+from models.engine import shards
+import json
+import os
+import tempfile
+import unittest
+
+
+class TestShards(unittest.TestCase):
+    """
+    Shards Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create a temporary directory before each test
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.records = {
+            f"{name}.{i}": {"id": str(i), "__class__": name}
+            for name in ("User", "Place") for i in range(10)
+        }
+
+    def tearDown(self):
+        """
+        tearDown() instance method:
+        Remove the temporary directory after each test
+        """
+        self.tmp_dir.cleanup()
+
+    def test_shard_name(self):
+        """
+        Test shard_name() function:
+        Verify the names with and without buckets.
+        """
+        self.assertEqual(shards.shard_name("User.1234"), "User.json")
+        name = shards.shard_name("User.1234", 8)
+        self.assertEqual(name, f"User.{shards.bucket('1234', 8)}.json")
+        self.assertTrue(shards.is_shard_name(name, 8))
+        self.assertFalse(shards.is_shard_name(name))
+        self.assertFalse(shards.is_shard_name("User.json", 8))
+        self.assertFalse(shards.is_shard_name("User.9.json", 8))
+
+    def test_bucket(self):
+        """
+        Test bucket() function:
+        Verify that buckets are stable and in range.
+        """
+        self.assertEqual(shards.bucket("abc", 16), shards.bucket("abc", 16))
+        self.assertTrue(all(
+            0 <= shards.bucket(str(i), 4) < 4 for i in range(100)
+        ))
+        self.assertEqual(len({shards.bucket(str(i), 4)
+                              for i in range(100)}), 4)
+
+    def test_split_and_merge(self):
+        """
+        Test split() and merge() functions:
+        Verify that a file split into shards merges back to it.
+        """
+        source = os.path.join(self.tmp_dir.name, "file.json")
+        directory = os.path.join(self.tmp_dir.name, "file.shards")
+        destination = os.path.join(self.tmp_dir.name, "merged.json")
+        with open(source, "w") as file:
+            json.dump(self.records, file)
+        shards.split(source, directory, 2)
+        names = shards.shard_names(directory)
+        self.assertEqual({shards.class_of(name) for name in names},
+                         {"User", "Place"})
+        for name in names:
+            for key, _, _ in shards.read(os.path.join(directory, name)):
+                self.assertEqual(shards.shard_name(key, 2), name)
+        shards.merge(directory, destination)
+        with open(destination) as file:
+            self.assertEqual(json.load(file), self.records)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+#!/usr/bin/python3
+"""
+SQLiteStorage Test Module
+"""
+
+
+from models.engine.base_storage import BaseStorage
+from models.engine.sqlite_storage import SQLiteStorage
+from models.city import City
+from models.place import Place
+from models.user import User
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    """
+    SQLiteStorage Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create a new SQLiteStorage on a temporary database before each test
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "file.db")
+        self.storage = SQLiteStorage(self.path)
+        self.storage.reload()
+
+    def tearDown(self):
+        """
+        tearDown() instance method:
+        Clean up by removing the temporary database after each test
+        """
+        self.tmp_dir.cleanup()
+
+    def new_user(self, **kwargs):
+        """
+        new_user() method:
+        returns a User added to the storage under test only
+        """
+        user = User(
+            id=kwargs.pop("id", "user-1"),
+            created_at="2023-08-08T12:34:56.789",
+            updated_at="2023-08-08T12:34:56.789", **kwargs
+        )
+        self.storage.new(user)
+        return user
+
+    def test_interface(self):
+        """
+        Test SQLiteStorage class:
+        Verify that SQLiteStorage implements the storage interface
+        """
+        self.assertIsInstance(self.storage, BaseStorage)
+        self.assertIs(self.storage.classes_dict, BaseStorage.classes_dict)
+
+    def test_new_all_get(self):
+        """
+        Test new(), all() and get() methods:
+        Verify that new() persists the object right away.
+        """
+        user = self.new_user(first_name="Betty")
+        self.assertEqual(self.storage.all(), {"User.user-1": user})
+        self.assertEqual(self.storage.all(Place), {})
+        self.assertIs(self.storage.get("User", "user-1"), user)
+        self.assertIsNone(self.storage.get(User, "nope"))
+        other = SQLiteStorage(self.path)
+        self.assertEqual(other.get(User, "user-1").first_name, "Betty")
+
+    def test_count_and_delete(self):
+        """
+        Test count() and delete() methods:
+        Verify that delete() removes the row right away.
+        """
+        user = self.new_user()
+        self.new_user(id="user-2")
+        self.assertEqual(self.storage.count(), 2)
+        self.assertEqual(self.storage.count("User"), 2)
+        self.assertEqual(self.storage.count(City), 0)
+        self.storage.delete(user)
+        self.storage.delete()
+        self.assertEqual(self.storage.count(User), 1)
+        self.assertIsNone(SQLiteStorage(self.path).get(User, "user-1"))
+
+    def test_save_and_reload(self):
+        """
+        Test save() and reload() methods:
+        Verify that save() writes the changed objects
+        and that reload() reads them back from the database.
+        """
+        user = self.new_user()
+        with patch("models.storage", self.storage):
+            user.first_name = "Betty"
+        self.assertIsNone(
+            SQLiteStorage(self.path).get(User, "user-1").__dict__.get(
+                "first_name"
+            )
+        )
+        self.storage.save()
+        self.storage.reload()
+        reloaded = self.storage.get(User, "user-1")
+        self.assertIsNot(reloaded, user)
+        self.assertEqual(reloaded.first_name, "Betty")
+
+    def test_find(self):
+        """
+        Test find() method:
+        Verify that find() matches persisted and unsaved values.
+        """
+        city = City(
+            id="city-1", created_at="2023-08-08T12:34:56.789",
+            updated_at="2023-08-08T12:34:56.789", state_id="state-1"
+        )
+        self.storage.new(city)
+        self.assertEqual(self.storage.find(City, state_id="state-1"), [city])
+        self.assertEqual(self.storage.find(City, state_id="state-2"), [])
+        with patch("models.storage", self.storage):
+            city.state_id = "state-2"
+        self.assertEqual(self.storage.find(City, state_id="state-1"), [])
+        self.assertEqual(self.storage.find(City, state_id="state-2"), [city])
+
+    def test_query(self):
+        """
+        Test query() method:
+        Verify that where() returns the ids of the matching objects.
+        """
+        place = Place(
+            id="place-1", created_at="2023-08-08T12:34:56.789",
+            updated_at="2023-08-08T12:34:56.789", price_by_night=50
+        )
+        self.storage.new(place)
+        query = self.storage.query(Place)
+        self.assertEqual(query.where(price_by_night__lt=100), ["place-1"])
+        self.assertEqual(query.where(price_by_night__gte=100), [])
+
+    def test_places_with(self):
+        """
+        Test link() and places_with() methods:
+        Verify that the places having every amenity are found.
+        """
+        place = Place(
+            id="place-1", created_at="2023-08-08T12:34:56.789",
+            updated_at="2023-08-08T12:34:56.789"
+        )
+        self.storage.new(place)
+        with patch("models.storage", self.storage):
+            self.storage.link(place, "wifi")
+            self.storage.link(place, "pool")
+        self.assertEqual(self.storage.places_with("wifi", "pool"), [place])
+        self.assertEqual(self.storage.places_with("wifi", "gym"), [])
+
+    def test_batch(self):
+        """
+        Test batch() method:
+        Verify that a batch is committed when it ends
+        and rolled back, in memory too, on an exception.
+        """
+        user = self.new_user()
+        with patch("models.storage", self.storage):
+            with self.storage.batch():
+                user.first_name = "Betty"
+                self.storage.save()
+                self.new_user(id="user-2")
+            self.assertEqual(
+                SQLiteStorage(self.path).get(User, "user-1").first_name,
+                "Betty"
+            )
+            with self.assertRaises(RuntimeError):
+                with self.storage.batch():
+                    user.first_name = "Holberton"
+                    self.storage.save()
+                    self.new_user(id="user-3")
+                    raise RuntimeError
+        self.assertEqual(user.first_name, "Betty")
+        self.assertIs(self.storage.get(User, "user-1"), user)
+        self.assertIsNone(self.storage.get(User, "user-3"))
+        self.assertEqual(self.storage.count(User), 2)
+
+    def test_cache(self):
+        """
+        Test cache_entries:
+        Verify that at most cache_entries objects are held, that the
+        changed objects evicted are written back, and the counters.
+        """
+        self.storage.cache_entries = 2
+        with patch("models.storage", self.storage):
+            users = [self.new_user(id=f"user-{i}") for i in range(3)]
+            users[1].first_name = "Betty"
+            users[0].first_name = "Holberton"
+            users[2].first_name = "School"
+        stats = self.storage.cache_stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 3)
+        self.assertEqual(stats["writebacks"], 1)
+        self.assertEqual(
+            SQLiteStorage(self.path).get(User, "user-1").first_name, "Betty"
+        )
+        self.assertIs(self.storage.get(User, "user-0"), users[0])
+        self.assertEqual(self.storage.cache_stats()["hits"], 1)
+        del users
+        self.assertEqual(self.storage.get(User, "user-1").first_name,
+                         "Betty")
+        self.assertEqual(self.storage.cache_stats()["misses"], 1)
+        self.storage.save()
+        self.assertEqual(
+            SQLiteStorage(self.path).get(User, "user-0").first_name,
+            "Holberton"
+        )
+
+    def test_documentations(self):
+        """
+        Documentation Test:
+        Test if there is a doc in module, class and methods.
+        """
+        from models.engine import sqlite_storage
+
+        self.assertGreater(len(sqlite_storage.__doc__), 5)
+        self.assertGreater(len(SQLiteStorage.__doc__), 5)
+        for method in ("all", "new", "save", "reload", "delete", "get",
+                       "count", "find"):
+            self.assertGreater(len(getattr(SQLiteStorage, method).__doc__), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""
+Full-text index Test Module
+"""
+
+
+from models.engine.text_index import TextIndex, tokenize
+from models.place import Place
+from models.review import Review
+import unittest
+
+
+class TestTextIndex(unittest.TestCase):
+    """
+    TextIndex Test class
+    """
+
+    def setUp(self):
+        """
+        setUp() instance method:
+        Create an index over a few reviews and a place
+        """
+        self.index = TextIndex({"Review": ("text",), "Place": ("name",)})
+        self.objects = {
+            "Review.1": Review(text="Great pool, great view"),
+            "Review.2": Review(text="The pool was cold"),
+            "Review.3": Review(text="Noisy street"),
+            "Place.1": Place(name="Pool house", description="ignored"),
+        }
+        for key, obj in self.objects.items():
+            self.index.add(key, obj)
+
+    def test_tokenize(self):
+        """
+        Test tokenize() function:
+        Verify that text is split in lowercase words.
+        """
+        self.assertEqual(tokenize("Great pool,  VIEW!"),
+                         ["great", "pool", "view"])
+        self.assertEqual(tokenize(""), [])
+
+    def test_search(self):
+        """
+        Test search() method:
+        Verify that the results are ranked and filtered by class.
+        """
+        self.assertEqual(self.index.search("great"), ["Review.1"])
+        self.assertEqual(self.index.search("POOL view")[0], "Review.1")
+        self.assertEqual(
+            sorted(self.index.search("pool")),
+            ["Place.1", "Review.1", "Review.2"]
+        )
+        self.assertEqual(self.index.search("pool", "Place"), ["Place.1"])
+        self.assertEqual(self.index.search("ignored"), [])
+        self.assertEqual(self.index.search("missing words"), [])
+
+    def test_add_and_remove(self):
+        """
+        Test add() and remove() methods:
+        Verify that updates replace the indexed words.
+        """
+        review = self.objects["Review.3"]
+        review.__dict__["text"] = "Quiet street"
+        self.index.add("Review.3", review)
+        self.assertEqual(self.index.search("noisy"), [])
+        self.assertEqual(self.index.search("quiet"), ["Review.3"])
+        self.index.remove("Review.3")
+        self.index.remove("Review.3")
+        self.assertEqual(self.index.search("street"), [])
+        self.assertNotIn("noisy", self.index.postings)
+        copy = TextIndex(self.index.text_attrs, self.index.docs)
+        self.assertEqual(copy.postings, self.index.postings)
+        self.assertEqual(copy.length, self.index.length)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+#!/usr/bin/python3
+"""
+Binary snapshot conversion script:
+converts file.json to file.hbnb or file.hbnb to file.json,
+streaming the objects
+
+usage: ./tools/binary_snapshot.py <source> <destination>
+"""
+
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# importing the models package must not load the store being converted
+os.environ["HBNB_STORAGE_WORKER"] = "1"
+
+from models.engine.binary_snapshot import convert  # noqa: E402
+
+
+def main():
+    """runs the conversion"""
+    if len(sys.argv) != 3:
+        print(__doc__.strip().splitlines()[-1], file=sys.stderr)
+        sys.exit(1)
+    convert(sys.argv[1], sys.argv[2])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+"""
+Shards conversion script:
+splits file.json into the shard directory file.shards
+or merges the shard directory file.shards into file.json
+(depending on which one source is), streaming the objects
+
+usage: ./tools/shards.py <source> <destination> [buckets]
+"""
+
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# importing the models package must not load the store being converted
+os.environ["HBNB_STORAGE_WORKER"] = "1"
+
+from models.engine.shards import merge, split  # noqa: E402
+
+
+def main():
+    """runs the conversion"""
+    if len(sys.argv) not in (3, 4):
+        print(__doc__.strip().splitlines()[-1], file=sys.stderr)
+        sys.exit(1)
+    if os.path.isdir(sys.argv[1]):
+        merge(sys.argv[1], sys.argv[2])
+    else:
+        split(sys.argv[1], sys.argv[2],
+              int(sys.argv[3]) if len(sys.argv) == 4 else 1)
+
+
+if __name__ == "__main__":
+    main()